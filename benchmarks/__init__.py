@@ -0,0 +1,3 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
@@ -0,0 +1,90 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+"""Compare row-wise `Job.from_dict` with column-wise `Job.from_frame`
+
+# Example run the benchmark:
+```bash
+python -m benchmarks.job_frame_bench --rows 5000
+```
+"""
+
+import argparse
+import random
+import time
+from dataclasses import fields
+from datetime import date, timedelta
+from typing import Any, cast
+
+import pandas as pd
+
+from job_search_pipeline.query import Job
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Returns a jobspy-like DataFrame with a realistic share of missing cells."""
+    rng = random.Random(seed)
+    description = "Nous recherchons un(e) développeur(euse) Python. " * 40
+    records = []
+    for i in range(rows):
+        record: dict[str, Any] = {
+            f.name: None for f in fields(Job) if f.name != "query"
+        }
+        record.update(
+            id=f"in-{i:08x}",
+            site="indeed",
+            job_url=f"https://ca.indeed.com/viewjob?jk={i:016x}",
+            title=rng.choice(["Développeur Python", "Analyste", "DevOps"]),
+            company=rng.choice(["ACME", "Initech", None]),
+            location="Québec, QC, CA",
+            date_posted=date(2026, 10, 1) + timedelta(days=rng.randrange(14)),
+            job_type=rng.choice(["fulltime", None]),
+            interval=rng.choice(["yearly", "hourly", None]),
+            min_amount=rng.choice([80000.0, float("nan")]),
+            max_amount=rng.choice([95000.0, float("nan")]),
+            currency=rng.choice(["CAD", None]),
+            is_remote=rng.choice([True, False]),
+            description=description,
+            company_rating=rng.choice([4.1, float("nan")]),
+        )
+        records.append(record)
+    return pd.DataFrame.from_records(records)
+
+
+def from_dict_path(frame: pd.DataFrame) -> list[Job]:
+    records = cast(list[dict[str, Any]], frame.to_dict(orient="records"))
+    return [Job.from_dict(query="q", **r) for r in records]
+
+
+def from_frame_path(frame: pd.DataFrame) -> list[Job]:
+    return Job.from_frame(frame, query="q")
+
+
+def best_of(fn, frame: pd.DataFrame, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(frame)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    frame = make_frame(args.rows)
+    assert from_dict_path(frame) == from_frame_path(frame)
+
+    baseline = best_of(from_dict_path, frame, args.repeat)
+    vectorized = best_of(from_frame_path, frame, args.repeat)
+    for name, seconds in (("from_dict", baseline), ("from_frame", vectorized)):
+        rate = args.rows / seconds
+        print(f"{name:>10}: {seconds * 1e3:8.2f} ms ({rate:,.0f} rows/s)")
+    print(f"   speedup: {baseline / vectorized:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+"""Compare one search per level with the single-pass `classify_many`
+
+# Example run the benchmark:
+```bash
+python -m benchmarks.job_level_bench --repeat 5
+```
+"""
+
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+
+from job_search_pipeline.utils.parse import job_level
+
+PARSE_DIR = Path(__file__).resolve().parent.parent / "job_search_pipeline/utils/parse"
+
+# One pattern per level, searched in priority order (the previous approach).
+SEQUENTIAL = [
+    (re.compile(rf"\b({'|'.join(frags)})\b", re.I), label)
+    for label, frags in job_level._LEVEL_FRAGMENTS.items()
+]
+
+
+def load_descriptions() -> list[str]:
+    """Returns the real-length descriptions of the parser fixtures."""
+    paths = [
+        *sorted((PARSE_DIR / "job_level/__tests__/job_level").glob("*.txt")),
+        *sorted((PARSE_DIR / "salary/__tests__/salary").glob("*.txt")),
+    ]
+    return [path.read_text(encoding="utf-8") for path in paths]
+
+
+def distinct_texts(descriptions: list[str], n: int, seed: int = 0) -> list[str]:
+    """Returns `n` distinct texts made of lines sampled from `descriptions`.
+
+    Each text mixes the lines of several descriptions, so the texts differ
+    in the level keywords they contain and nothing is reused between them.
+    """
+    rng = random.Random(seed)
+    lines = [line for text in descriptions for line in text.splitlines() if line]
+    size = len(lines) // len(descriptions)
+    return [f"{i}\n" + "\n".join(rng.sample(lines, size)) for i in range(n)]
+
+
+def sequential_path(texts: list[str]) -> list[str | None]:
+    out = []
+    for text in texts:
+        text = text.lower()
+        out.append(next((label for p, label in SEQUENTIAL if p.search(text)), None))
+    return out
+
+
+def single_pass_path(texts: list[str]) -> list[str | None]:
+    return job_level.classify_many(texts)
+
+
+def best_of(fn, texts: list[str], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(texts)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    texts = distinct_texts(load_descriptions(), args.texts)
+    assert sequential_path(texts) == single_pass_path(texts)
+
+    baseline = best_of(sequential_path, texts, args.repeat)
+    single = best_of(single_pass_path, texts, args.repeat)
+    for name, seconds in (("sequential", baseline), ("single", single)):
+        rate = len(texts) / seconds
+        print(f"{name:>10}: {seconds * 1e3:8.2f} ms ({rate:,.0f} texts/s)")
+    print(f"   speedup: {baseline / single:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
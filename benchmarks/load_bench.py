@@ -0,0 +1,73 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+"""Load-test `run_many` → `parse_many` offline with the fake jobspy backend
+
+# Example run a 100k-job load test:
+```bash
+python -m benchmarks.load_bench --jobs 100000 --queries 100
+```
+"""
+
+import argparse
+import resource
+import time
+
+from job_search_pipeline.query import (
+    Deduplicator,
+    FakeScraper,
+    Query,
+    SyntheticJobs,
+    parse_many,
+    run_many,
+)
+
+TERMS = ["python", "java", "backend", "frontend", "data", "devops", "qa", "cloud"]
+LOCATIONS = ["Québec, QC, Canada", "Montréal, QC, Canada", "Lévis, QC, Canada"]
+
+
+def make_queries(n: int, results_wanted: int) -> list[Query]:
+    return [
+        Query.from_dict(
+            query=f"indeed: {TERMS[i % len(TERMS)]} {i}",
+            location=LOCATIONS[i % len(LOCATIONS)],
+            results_wanted=results_wanted,
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--pool-size", type=int, default=1_000_000)
+    parser.add_argument("--description-length", type=int, default=3500)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    scraper = FakeScraper(
+        seed=args.seed,
+        pool_size=args.pool_size,
+        jobs=SyntheticJobs(seed=args.seed, description_length=args.description_length),
+    )
+    queries = make_queries(args.queries, args.jobs // args.queries)
+    dedup = Deduplicator()
+
+    start = time.perf_counter()
+    jobs = list(run_many(queries, dedup=dedup, delay=(0, 0), scraper=scraper))
+    scraped = time.perf_counter()
+    parsed = parse_many(jobs, workers=args.workers, salary_from_description=True)
+    done = time.perf_counter()
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"    queries: {len(queries)} ({dedup.dropped} duplicates dropped)")
+    print(f"       jobs: {len(jobs):,}")
+    for name, seconds in (("run", scraped - start), ("parse", done - scraped)):
+        print(f"{name:>11}: {seconds:8.2f} s ({len(parsed) / seconds:,.0f} jobs/s)")
+    print(f"   peak RSS: {rss:,.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
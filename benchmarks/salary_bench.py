@@ -0,0 +1,71 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+"""Measure `extract_salary` throughput on long French/English descriptions
+
+# Example run the benchmark:
+```bash
+python -m benchmarks.salary_bench --length 20000
+```
+
+# Example compare with the vectorized `extract_salary_column`:
+```bash
+python -m benchmarks.salary_bench --column
+```
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from job_search_pipeline.utils.parse.salary import (
+    extract_salary,
+    extract_salary_column,
+)
+
+FIXTURES_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "job_search_pipeline/utils/parse/salary/__tests__/salary"
+)
+
+
+def load_descriptions(length: int) -> list[str]:
+    """Returns the salary fixtures, each repeated up to about `length` chars."""
+    out = []
+    for path in sorted(FIXTURES_DIR.glob("*.txt")):
+        text = path.read_text(encoding="utf-8")
+        out.append((text + "\n") * max(1, length // max(1, len(text))))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--column", action="store_true")
+    args = parser.parse_args()
+
+    descriptions = load_descriptions(args.length)
+    chars = sum(map(len, descriptions))
+
+    start = time.perf_counter()
+    if args.column:
+        extract_salary_column(pd.Series(descriptions * args.repeat), currency="CAD")
+    else:
+        for _ in range(args.repeat):
+            for text in descriptions:
+                extract_salary(text, currency="CAD")
+    seconds = time.perf_counter() - start
+
+    n = len(descriptions) * args.repeat
+    print(
+        f"descriptions: {len(descriptions)} x {args.repeat} ({chars:,} chars each pass)"
+    )
+    print(f"  throughput: {n / seconds:,.0f} descriptions/s")
+    print(f"              {chars * args.repeat / seconds / 1e6:,.2f} M chars/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+"""Offline benchmark suite for the parsing and formatting hot paths
+
+Every case runs against a fixed corpus (the parser fixtures plus seeded
+synthetic jobs) and reports throughput and p50/p99 latency. Results are
+compared with a stored baseline and the run fails when the p50 latency of
+a case regressed by more than `--threshold`. The p50 is the median of the
+per-pass p50s, and a regressed case is measured `--confirm` more times:
+it only fails if the regression reproduces every time, so one noisy run
+on a shared machine does not fail the suite.
+
+# Example run the suite and compare with the stored baseline:
+```bash
+python -m benchmarks.suite --threshold 0.25
+```
+
+# Example record a new baseline:
+```bash
+python -m benchmarks.suite --save-baseline
+```
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from job_search_pipeline.query import Job
+from job_search_pipeline.utils import cache
+from job_search_pipeline.utils import parse
+from job_search_pipeline.utils.format import job_title
+
+ROOT = Path(__file__).resolve().parent
+PARSE_DIR = ROOT.parent / "job_search_pipeline/utils/parse"
+DEFAULT_BASELINE = ROOT / "baseline.json"
+
+TITLES = [
+    "Développeur(euse) Python",
+    "Analyste programmeur.euse",
+    "Développeuse/Développeur d'applications sénior.e",
+    "Développeur Frontend Senior – Vue.js (Vue 3) - Senior Frontend Developer",
+    "Programmeur d'outils | Tools Programmer",
+    "Stage coopératif - Été 2026: Développeur backend",
+    "Chargé(e) de projet TI",
+    "Senior Software Engineer",
+    "Développeur(se) en ingénierie des données – 4 mois Stage/Co-op (Été 2026)",
+    "Data Engineer [Remote]",
+]
+
+
+@dataclass
+class Result:
+    calls: int
+    ops_per_s: float
+    p50_us: float
+    p99_us: float
+
+
+def load_corpus(jobs: int = 200, seed: int = 0) -> dict[str, list]:
+    """Returns the descriptions, titles and scraped records of the corpus."""
+    paths = [
+        *sorted((PARSE_DIR / "job_level/__tests__/job_level").glob("*.txt")),
+        *sorted((PARSE_DIR / "salary/__tests__/salary").glob("*.txt")),
+    ]
+    descriptions = [path.read_text(encoding="utf-8") for path in paths]
+
+    rng = random.Random(seed)
+    records = []
+    for i in range(jobs):
+        records.append(
+            {
+                "id": f"in-{i:08x}",
+                "site": "indeed",
+                "job_url": f"https://ca.indeed.com/viewjob?jk={i:016x}",
+                "title": rng.choice(TITLES),
+                "company": rng.choice(["ACME", "Initech / Initrode", "rh@globex.ca"]),
+                "location": "Québec, QC, CA",
+                "date_posted": "2026-10-01",
+                "interval": rng.choice(["yearly", "hourly", None]),
+                "min_amount": rng.choice([80000.0, None]),
+                "max_amount": rng.choice([95000.0, None]),
+                "currency": rng.choice(["CAD", None]),
+                "is_remote": rng.choice([True, False]),
+                "description": rng.choice(descriptions),
+            }
+        )
+    return {"descriptions": descriptions, "titles": TITLES, "records": records}
+
+
+def cases(corpus: dict[str, list]) -> dict[str, tuple[Callable, list]]:
+    """Returns the benchmarked functions with the inputs of one pass."""
+    jobs = [Job.from_dict(query="q", **r) for r in corpus["records"]]
+    return {
+        "parse.salary.extract_salary": (
+            lambda text: parse.salary.extract_salary(text, currency="CAD"),
+            corpus["descriptions"],
+        ),
+        "parse.job_level.transform": (
+            parse.job_level.transform,
+            corpus["descriptions"],
+        ),
+        "format.job_title.transform": (job_title.transform, corpus["titles"]),
+        "Job.from_dict": (
+            lambda record: Job.from_dict(query="q", **record),
+            corpus["records"],
+        ),
+        "Job.parse": (Job.parse, jobs),
+    }
+
+
+def measure(fn: Callable, inputs: list, repeat: int) -> Result:
+    """Times every call; the memoization caches are cleared before each pass.
+
+    The p50 is the median of the per-pass p50s, the p99 is over all calls.
+    """
+    timings, p50s = [], []
+    for _ in range(repeat):
+        cache.clear()
+        run = []
+        for value in inputs:
+            start = time.perf_counter_ns()
+            fn(value)
+            run.append(time.perf_counter_ns() - start)
+        p50s.append(statistics.median(run) / 1e3)
+        timings.extend(run)
+    timings.sort()
+    total = sum(timings) / 1e9
+
+    def percentile(q: float) -> float:
+        return timings[min(len(timings) - 1, int(q * len(timings)))] / 1e3
+
+    return Result(
+        calls=len(timings),
+        ops_per_s=len(timings) / total if total else 0.0,
+        p50_us=statistics.median(p50s),
+        p99_us=percentile(0.99),
+    )
+
+
+def compare(
+    results: dict[str, Result], baseline: dict[str, dict], threshold: float
+) -> list[str]:
+    """Returns the cases whose p50 latency regressed beyond `threshold`."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base and result.p50_us > base["p50_us"] * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--confirm", type=int, default=2)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    corpus = load_corpus(jobs=args.jobs)
+    benchmarks = cases(corpus)
+    results = {
+        name: measure(fn, inputs, args.repeat)
+        for name, (fn, inputs) in benchmarks.items()
+    }
+
+    baseline = {}
+    if args.baseline.exists():
+        with args.baseline.open("r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(
+        f"{'case':<30} {'ops/s':>12} {'p50 (us)':>10} {'p99 (us)':>10} {'vs base':>8}"
+    )
+    for name, r in results.items():
+        base = baseline.get(name)
+        delta = f"{r.p50_us / base['p50_us'] - 1:+.0%}" if base else "-"
+        print(
+            f"{name:<30} {r.ops_per_s:>12,.0f} {r.p50_us:>10.1f} "
+            f"{r.p99_us:>10.1f} {delta:>8}"
+        )
+
+    if args.save_baseline:
+        with args.baseline.open("w", encoding="utf-8") as f:
+            data = {name: asdict(r) for name, r in results.items()}
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        print(f"Saved baseline: {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    for _ in range(args.confirm):
+        if not regressions:
+            break
+        rerun = {name: measure(*benchmarks[name], args.repeat) for name in regressions}
+        regressions = compare(rerun, baseline, args.threshold)
+    if regressions:
+        print(f"Regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@
 
 from . import version
 from . import query
+from . import store
 from . import utils
 
-__all__ = ["version", "query", "utils"]
+__all__ = ["version", "query", "store", "utils"]
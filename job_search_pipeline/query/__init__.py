@@ -2,6 +2,29 @@
 #                       Copyright 2026, Sébastien Kéroack
 # ==============================================================================
 
+from .cache import ScrapeCache
+from .dedup import BloomFilter, Deduplicator, job_key
+from .fake import FakeScraper, SyntheticJobs
+from .parallel import parse_many
 from .query import Job, Query
+from .search import Search, run_many, scrape_many
+from .table import JobTable
+from .watermark import Watermark, Watermarks
 
-__all__ = ["Job", "Query"]
+__all__ = [
+    "BloomFilter",
+    "Deduplicator",
+    "FakeScraper",
+    "Job",
+    "JobTable",
+    "Query",
+    "ScrapeCache",
+    "Search",
+    "SyntheticJobs",
+    "Watermark",
+    "Watermarks",
+    "job_key",
+    "parse_many",
+    "run_many",
+    "scrape_many",
+]
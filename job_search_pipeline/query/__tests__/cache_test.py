@@ -0,0 +1,77 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import os
+import time
+from datetime import date
+
+import pytest
+
+from job_search_pipeline.query import Query, ScrapeCache
+from job_search_pipeline.query import query as query_module
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ScrapeCache(tmp_path / "cache", ttl=60, max_entries=3)
+
+
+def test_key_ignores_whitespace_and_case_of_search_term():
+    a = Query(query="indeed: Python  Backend", location="québec, qc, canada")
+    b = Query(query="Indeed:python backend", location="québec, qc, canada")
+    assert ScrapeCache.key(a.params()) == ScrapeCache.key(b.params())
+
+
+def test_key_depends_on_window():
+    a = Query(query="indeed: python", days_old=7)
+    b = Query(query="indeed: python", days_old=1)
+    assert ScrapeCache.key(a.params()) != ScrapeCache.key(b.params())
+
+
+def test_roundtrip_serializes_dates(cache):
+    params = Query(query="indeed: python").params()
+    cache.put(params, [{"id": "1", "date_posted": date(2026, 1, 2), "x": None}])
+    assert cache.get(params) == [{"id": "1", "date_posted": "2026-01-02", "x": None}]
+
+
+def test_expired_entries_are_dropped(cache):
+    params = Query(query="indeed: python").params()
+    cache.put(params, [])
+    cache.ttl = -1
+    assert cache.get(params) is None
+    assert not list(cache.path.glob("*.json"))
+
+
+def test_evicts_least_recently_used(cache):
+    params = [Query(query=f"indeed: python {i}").params() for i in range(4)]
+    for i, p in enumerate(params[:3]):
+        cache.put(p, [{"id": str(i)}])
+        file = cache.path / f"{cache.key(p)}.json"
+        os.utime(file, (time.time() - 30 + i, time.time() - 30 + i))
+
+    # Touch the oldest entry so the second one becomes the LRU.
+    assert cache.get(params[0]) == [{"id": "0"}]
+    cache.put(params[3], [{"id": "3"}])
+
+    assert cache.get(params[1]) is None
+    assert cache.get(params[0]) is not None
+    assert cache.get(params[3]) is not None
+
+
+def test_scrape_is_served_from_cache(cache, monkeypatch):
+    calls = []
+
+    class Frame:
+        def to_dict(self, orient):
+            return [{"id": "1"}]
+
+    def scrape_jobs(**kwargs):
+        calls.append(kwargs)
+        return Frame()
+
+    monkeypatch.setattr(query_module, "scrape_jobs", scrape_jobs)
+    q = Query(query="indeed: python")
+    assert q.scrape(cache=cache) == [{"id": "1"}]
+    assert q.scrape(cache=cache) == [{"id": "1"}]
+    assert len(calls) == 1
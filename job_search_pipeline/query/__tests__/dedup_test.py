@@ -0,0 +1,77 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import pandas as pd
+import pytest
+
+from job_search_pipeline.query import BloomFilter, Deduplicator, Job, Query, job_key
+from job_search_pipeline.query.dedup import canonical_url
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        (
+            "https://CA.indeed.com/viewjob?jk=abc&from=serp&utm_source=x",
+            "https://ca.indeed.com/viewjob?jk=abc",
+        ),
+        ("https://example.com/jobs/1/#apply", "https://example.com/jobs/1"),
+        ("https://example.com/job?b=2&a=1", "https://example.com/job?a=1&b=2"),
+    ],
+)
+def test_canonical_url(a: str, b: str):
+    assert canonical_url(a) == canonical_url(b)
+
+
+def test_job_key_fallbacks():
+    assert job_key({"site": "Indeed", "id": "in-1", "job_url": "x"}) == "indeed:in-1"
+    assert job_key({"id": float("nan"), "job_url": "https://a/b/"}) == "url:https://a/b"
+    assert (
+        job_key({"title": " Développeur  Python", "company": "ACME", "id": "N/A"})
+        == "title:développeur python|acme"
+    )
+
+
+def test_job_key_matches_record_key():
+    record = {"site": "indeed", "id": "in-1", "job_url": "https://a"}
+    assert Job.from_dict(**record).key() == job_key(record)
+
+
+def test_bloom_filter_membership_and_persistence(tmp_path):
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"indeed:in-{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"linkedin:{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+    path = tmp_path / "seen.bloom"
+    bloom.save(path)
+    loaded = BloomFilter.open(path)
+    assert loaded.count == 1000
+    assert all(key in loaded for key in keys)
+
+
+def test_deduplicator_drops_repeats():
+    dedup = Deduplicator()
+    records = [
+        {"site": "indeed", "id": "in-1"},
+        {"site": "indeed", "id": "in-2"},
+        {"site": "indeed", "id": "in-1"},
+    ]
+    assert list(dedup.filter(records)) == records[:2]
+    assert dedup.dropped == 1
+
+
+def test_run_skips_duplicates_across_queries(monkeypatch):
+    def fetch(self, cache=None, watermarks=None, scraper=None):
+        return pd.DataFrame(
+            [{"site": "indeed", "id": "in-1"}, {"site": "indeed", "id": "in-2"}]
+        )
+
+    monkeypatch.setattr(Query, "fetch", fetch)
+    dedup = Deduplicator(BloomFilter(capacity=100))
+    assert len(Query(query="indeed: python").run(dedup=dedup)) == 2
+    assert Query(query="indeed: backend").run(dedup=dedup) == []
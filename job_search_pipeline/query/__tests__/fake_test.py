@@ -0,0 +1,60 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from jobspy.util import desired_order
+
+from job_search_pipeline.query import (
+    Deduplicator,
+    FakeScraper,
+    Query,
+    Search,
+    SyntheticJobs,
+    run_many,
+)
+from job_search_pipeline.query.fake import JOBSPY_COLUMNS
+
+
+def test_columns_match_jobspy():
+    assert list(JOBSPY_COLUMNS) == desired_order
+
+
+def test_synthetic_jobs_are_deterministic():
+    assert SyntheticJobs(seed=1).record(42) == SyntheticJobs(seed=1).record(42)
+    assert SyntheticJobs(seed=1).record(42) != SyntheticJobs(seed=2).record(42)
+
+
+def test_synthetic_jobs_are_bilingual_with_realistic_descriptions():
+    records = [SyntheticJobs().record(i) for i in range(200)]
+    lengths = sorted(len(r["description"]) for r in records)
+    assert 2000 < lengths[len(lengths) // 2] < 6000
+    assert any("Salaire" in r["description"] for r in records)
+    assert any("Salary" in r["description"] for r in records)
+
+
+def test_fake_scraper_serves_query_run():
+    scraper = FakeScraper(pool_size=100)
+    q = Query(query="indeed: python", location="québec, qc, canada", results_wanted=20)
+    jobs = q.run(scraper=scraper)
+    assert len(jobs) == 20 and scraper.calls == 1
+    assert jobs == q.run(scraper=scraper)
+    assert all(job.site == "indeed" and job.parse()["title"] for job in jobs)
+
+
+def test_fake_scraper_overlapping_queries_are_deduplicated():
+    search = Search.from_dict(
+        query=["indeed: python", "indeed: backend"],
+        location=["Québec, QC, Canada", "Lévis, QC, Canada"],
+        results_wanted=50,
+    )
+    dedup = Deduplicator()
+    jobs = list(
+        run_many(
+            search.queries(),
+            dedup=dedup,
+            delay=(0, 0),
+            scraper=FakeScraper(pool_size=100),
+        )
+    )
+    assert dedup.dropped > 0
+    assert len(jobs) + dedup.dropped == 200
@@ -0,0 +1,38 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import pytest
+
+from job_search_pipeline.query import Job, parse_many
+
+JOBS = [
+    Job.from_dict(
+        id=f"in-{i}",
+        site="indeed",
+        title=f"Développeur(euse) Python {i}",
+        company="ACME / Groupe",
+        description="Senior role." if i % 2 else "Stage de 4 mois.",
+        min_amount=20 + i,
+        currency="CAD",
+        interval="hourly",
+    )
+    for i in range(40)
+]
+
+
+@pytest.mark.parametrize("workers,chunksize", [(1, None), (2, None), (3, 7)])
+def test_parse_many_keeps_order(workers, chunksize):
+    expected = [job.parse() for job in JOBS]
+    assert (
+        parse_many(JOBS, workers=workers, chunksize=chunksize, min_batch=0) == expected
+    )
+
+
+def test_parse_many_forwards_parse_options():
+    out = parse_many(JOBS[:3], workers=2, min_batch=0, job_format="none")
+    assert all("job" not in o for o in out)
+
+
+def test_parse_many_empty():
+    assert parse_many([], workers=4) == []
@@ -0,0 +1,175 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import types
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from job_search_pipeline.query import Job, Query
+from job_search_pipeline.query import query as query_module
+from job_search_pipeline.utils.format.value import content_hash
+
+FRAME = pd.DataFrame(
+    [
+        {
+            "id": "in-1",
+            "site": "indeed",
+            "job_url": "https://ca.indeed.com/viewjob?jk=1",
+            "title": "Développeur(euse) Python",
+            "company": "ACME",
+            "min_amount": 80000.0,
+            "max_amount": float("nan"),
+            "description": "Senior role.",
+        },
+        {
+            "id": "in-2",
+            "site": "indeed",
+            "job_url": "https://ca.indeed.com/viewjob?jk=2",
+            "title": "Analyste",
+            "company": None,
+            "min_amount": float("nan"),
+            "max_amount": float("nan"),
+            "description": None,
+        },
+    ]
+)
+
+
+@pytest.fixture
+def scrape_jobs(monkeypatch):
+    calls = []
+
+    def scrape_jobs(**kwargs):
+        calls.append(kwargs)
+        return FRAME.copy()
+
+    monkeypatch.setattr(query_module, "scrape_jobs", scrape_jobs)
+    return calls
+
+
+def test_iter_jobs_is_lazy_and_matches_run(scrape_jobs):
+    q = Query(query="indeed: python")
+    jobs = q.iter_jobs()
+    assert isinstance(jobs, types.GeneratorType)
+    assert list(jobs) == q.run()
+
+
+def test_iter_records_matches_to_dict(scrape_jobs):
+    records = list(Query(query="indeed: python").iter_records())
+    expected = FRAME.to_dict(orient="records")
+    assert [r["id"] for r in records] == [r["id"] for r in expected]
+    assert [Job.from_dict(**r) for r in records] == [
+        Job.from_dict(**r) for r in expected
+    ]
+
+
+def test_iter_records_scrapes_eagerly(scrape_jobs):
+    Query(query="indeed: python").iter_records()
+    assert len(scrape_jobs) == 1
+
+
+def test_from_frame_matches_from_dict():
+    frame = pd.DataFrame(
+        {
+            "id": ["in-1", None, "  ", "null"],
+            "site": ["indeed", "indeed", float("nan"), "N/A"],
+            "title": ["Développeur", "NaN", " nan ", "None"],
+            "date_posted": [date(2026, 10, 17), None, "2026-10-16", float("nan")],
+            "min_amount": [80000.0, 0.0, float("nan"), None],
+            "max_amount": ["95000", "abc", None, 1.5],
+            "is_remote": [True, False, float("nan"), None],
+            "company_rating": [4.5, float("nan"), 3.0, 1.0],
+        }
+    )
+    expected = [Job.from_dict(query="q", **r) for r in frame.to_dict(orient="records")]
+    assert Job.from_frame(frame, query="q") == expected
+
+
+def test_from_frame_empty():
+    assert Job.from_frame(pd.DataFrame()) == []
+
+
+def test_job_is_slotted():
+    with pytest.raises(AttributeError):
+        Job().unknown = 1
+
+
+JOB = Job.from_dict(
+    query="Query(query='indeed: python')",
+    id="in-1",
+    site="indeed",
+    title="Développeur(euse) Python",
+    min_amount=80000,
+    is_remote=True,
+    description="Senior role. " * 100,
+    company_description="ACME builds things. " * 50,
+)
+
+
+def test_parse_default_keeps_full_repr():
+    assert JOB.parse()["job"] == repr(JOB)
+
+
+def test_parse_slim_replaces_large_fields_with_hash():
+    out = JOB.parse(job_format="slim")
+    assert JOB.description not in out["job"]
+    assert content_hash(JOB.description) in out["job"]
+    assert out["description"] == JOB.description
+
+
+def test_parse_compact_roundtrip():
+    out = JOB.parse(job_format="compact")
+    assert len(out["job"]) < len(repr(JOB)) // 4
+    job = Job.decode(
+        out["job"],
+        description=out["description"],
+        company_description=out["company_description"],
+    )
+    assert job == JOB
+
+
+def test_parse_none_drops_job():
+    assert "job" not in JOB.parse(job_format="none")
+
+
+def test_parse_rejects_unknown_format():
+    with pytest.raises(NotImplementedError):
+        JOB.parse(job_format="xml")
+
+
+def test_decode_checks_omitted_fields():
+    payload = JOB.encode(omit=["description"])
+    with pytest.raises(ValueError):
+        Job.decode(payload)
+    with pytest.raises(ValueError):
+        Job.decode(payload, description="tampered")
+    assert Job.decode(JOB.encode()) == JOB
+
+
+def test_salary_from_description_is_opt_in():
+    job = Job.from_dict(description="Salaire: 85 000$ à 110 000$ par année.")
+    assert job.salary() == "N/A"
+    assert job.salary(from_description=True) == "85,000-110,000 / yearly"
+    assert job.parse(salary_from_description=True)["salary"] == job.salary(
+        from_description=True
+    )
+
+
+def test_salary_from_description_keeps_scraped_amounts():
+    job = Job.from_dict(
+        min_amount=50000,
+        currency="CAD",
+        interval="yearly",
+        description="Salaire: 85 000$ à 110 000$ par année.",
+    )
+    assert job.salary(from_description=True) == "CAD 50,000 / yearly"
+
+
+def test_salary_from_description_is_bounded():
+    filler = "Nous offrons un environnement stimulant. " * 1000
+    job = Job.from_dict(description=filler + "Salaire: 85 000$ à 110 000$ par année.")
+    assert len(job.description) > query_module.DESCRIPTION_SALARY_MAX_LENGTH
+    assert job.salary(from_description=True) == "N/A"
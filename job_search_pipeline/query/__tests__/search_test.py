@@ -0,0 +1,96 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from job_search_pipeline.query import Query, Search, run_many, scrape_many
+
+SEARCH = {
+    "results_wanted": 20,
+    "days_old": 7,
+    "distance_unit": 15,
+    "distance_use_km": True,
+    "location": ["Val-Bélair, QC, Canada", "Remote, Canada"],
+    "query": [
+        "indeed: (developer OR développeur) python",
+        "indeed: (developer OR développeur) backend",
+        "linkedin: python",
+    ],
+}
+
+
+@pytest.fixture
+def fake_scrape(monkeypatch):
+    lock = threading.Lock()
+    state = {"active": {}, "peak": {}, "calls": []}
+
+    def fetch(self, cache=None, watermarks=None, scraper=None):
+        site = self.site_name()
+        with lock:
+            state["calls"].append(self)
+            state["active"][site] = state["active"].get(site, 0) + 1
+            state["peak"][site] = max(state["peak"].get(site, 0), state["active"][site])
+        time.sleep(0.01)
+        with lock:
+            state["active"][site] -= 1
+        return pd.DataFrame(
+            [{"id": f"{self.search_term()}@{self.location}", "site": site}]
+        )
+
+    monkeypatch.setattr(Query, "fetch", fetch)
+    return state
+
+
+def test_search_expands_location_query_matrix():
+    queries = Search.from_dict(**SEARCH).queries()
+    assert len(queries) == 6
+    assert queries[0].location == "val-bélair, qc, canada"
+    assert queries[0].distance_unit == 15 and queries[0].distance_use_km
+    assert {q.query for q in queries} == set(SEARCH["query"])
+
+
+def test_search_accepts_scalar_query_and_location():
+    search = Search.from_dict(query="indeed: python", location="Québec, QC, Canada")
+    assert len(search.queries()) == 1
+
+
+def test_scrape_many_yields_every_query(fake_scrape):
+    queries = Search.from_dict(**SEARCH).queries()
+    results = list(scrape_many(queries, delay=(0, 0)))
+    assert len(results) == len(queries)
+    assert sorted(map(repr, (q for q, _ in results))) == sorted(map(repr, queries))
+
+
+def test_scrape_many_respects_site_limits(fake_scrape):
+    queries = Search.from_dict(**SEARCH).queries()
+    list(
+        scrape_many(
+            queries,
+            max_workers=8,
+            site_limits={"linkedin": 1},
+            default_site_limit=2,
+            delay=(0, 0),
+        )
+    )
+    assert fake_scrape["peak"]["indeed"] <= 2
+    assert fake_scrape["peak"]["linkedin"] == 1
+
+
+def test_scrape_many_propagates_errors(monkeypatch):
+    def fetch(self, cache=None, watermarks=None, scraper=None):
+        raise RuntimeError("blocked")
+
+    monkeypatch.setattr(Query, "fetch", fetch)
+    with pytest.raises(RuntimeError):
+        list(scrape_many([Query(query="indeed: python")], delay=(0, 0)))
+
+
+def test_run_many_builds_jobs(fake_scrape):
+    jobs = list(run_many(Search.from_dict(**SEARCH).queries(), delay=(0, 0)))
+    assert len(jobs) == 6
+    assert all(job.query.startswith("Query(") for job in jobs)
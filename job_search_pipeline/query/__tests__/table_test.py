@@ -0,0 +1,82 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import pandas as pd
+import pytest
+
+from job_search_pipeline.query import FakeScraper, Job, JobTable
+from job_search_pipeline.query.fake import JOBSPY_COLUMNS
+from job_search_pipeline.query.table import CATEGORICAL_FIELDS
+from job_search_pipeline.utils import cache
+
+
+@pytest.fixture(scope="module")
+def frame() -> pd.DataFrame:
+    scraper = FakeScraper(seed=3, pool_size=150)
+    return scraper(site_name=["indeed", "linkedin"], results_wanted=100)
+
+
+def test_roundtrips_jobs(frame):
+    jobs = Job.from_frame(frame, query="indeed: python")
+    table = JobTable.from_frame(frame, query="indeed: python")
+    assert len(table) == len(jobs)
+    assert table.to_jobs() == jobs
+    assert table[7] == jobs[7]
+    assert JobTable.from_jobs(jobs).to_jobs() == jobs
+    assert JobTable.from_jobs([]).to_jobs() == []
+    for name in CATEGORICAL_FIELDS:
+        assert isinstance(table.frame[name].dtype, pd.CategoricalDtype)
+
+
+@pytest.mark.parametrize("job_format", ["repr", "slim", "compact", "none"])
+@pytest.mark.parametrize("salary_from_description", [False, True])
+def test_parse_matches_job_parse(frame, job_format, salary_from_description):
+    kwargs = dict(
+        job_format=job_format, salary_from_description=salary_from_description
+    )
+    table = JobTable.from_frame(frame, query="q")
+    expected = [job.parse(**kwargs) for job in table]
+    cache.clear()
+    assert table.parse(**kwargs).to_dict("records") == expected
+    assert table.to_items(**kwargs) == [{"json": e} for e in expected]
+
+
+@pytest.mark.parametrize("job_format", ["repr", "slim", "compact", "none"])
+def test_parse_empty_table(job_format):
+    empty = JobTable.from_frame(pd.DataFrame(columns=list(JOBSPY_COLUMNS)))
+    for table in (empty, JobTable.from_records([]), JobTable.from_jobs([])):
+        assert len(table) == 0
+        parsed = table.parse(job_format=job_format, salary_from_description=True)
+        assert len(parsed) == 0 and "title" in parsed.columns
+        assert table.to_items(job_format=job_format) == []
+
+
+def test_parse_rejects_unknown_job_format(frame):
+    with pytest.raises(NotImplementedError):
+        JobTable.from_frame(frame).parse(job_format="xml")
+
+
+def test_filter(frame):
+    table = JobTable.from_frame(frame)
+    jobs = table.to_jobs()
+
+    indeed = table.filter(site="indeed", job_type=["fulltime", "contract"])
+    expected = [
+        j for j in jobs if j.site == "indeed" and j.job_type in ("fulltime", "contract")
+    ]
+    assert indeed.to_jobs() == expected
+
+    paid = table.filter(table.frame["min_amount"] > 80000, is_remote=True)
+    assert paid.to_jobs() == [
+        j for j in jobs if j.min_amount and j.min_amount > 80000 and j.is_remote
+    ]
+
+
+def test_from_items(frame):
+    table = JobTable.from_frame(frame)
+    items = table.to_items(job_format="compact")
+    assert JobTable.from_items(items).to_jobs() == table.to_jobs()
+
+    records = [{"json": r} for r in frame.to_dict("records")]
+    assert JobTable.from_items(records).to_jobs() == table.to_jobs()
@@ -0,0 +1,116 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from job_search_pipeline.query import Query, Watermarks
+from job_search_pipeline.query import query as query_module
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def test_hours_old_without_since_uses_days_old():
+    assert Query(days_old=7).hours_old() == 168
+
+
+def test_hours_old_since_last_run_plus_overlap():
+    since = _now() - timedelta(hours=5, minutes=30)
+    assert Query(days_old=7).hours_old(since=since, overlap_hours=24) == 30
+
+
+def test_hours_old_is_capped_to_days_old():
+    since = _now() - timedelta(days=30)
+    assert Query(days_old=7).hours_old(since=since, overlap_hours=24) == 168
+
+
+def test_key_ignores_window():
+    a = Query(query="indeed: python", days_old=7)
+    b = Query(query="indeed: python", days_old=1)
+    assert Watermarks.key(a) == Watermarks.key(b)
+
+
+def test_advance_drops_seen_urls_and_persists(tmp_path):
+    path = tmp_path / "watermarks.json"
+    q = Query(query="indeed: python", days_old=7)
+    marks = Watermarks(path, overlap_hours=12)
+    assert marks.hours_old(q) == 168
+
+    first = pd.DataFrame(
+        [
+            {"job_url": "https://a", "date_posted": "2026-10-16"},
+            {"job_url": "https://b", "date_posted": "2026-10-17"},
+        ]
+    )
+    assert len(marks.advance(q, first, _now())) == 2
+    assert marks.get(q) is None and not path.exists()
+    marks.commit(q)
+
+    marks = Watermarks(path, overlap_hours=12)
+    mark = marks.get(q)
+    assert mark.job_urls == ["https://a", "https://b"]
+    assert marks.hours_old(q) == 13
+
+    second = pd.DataFrame(
+        [
+            {"job_url": "https://b", "date_posted": "2026-10-17"},
+            {"job_url": "https://c", "date_posted": float("nan")},
+        ]
+    )
+    assert marks.advance(q, second, _now())["job_url"].tolist() == ["https://c"]
+    marks.commit(q)
+    assert marks.get(q).job_urls == ["https://a", "https://b", "https://c"]
+
+
+def test_loads_older_files(tmp_path):
+    path = tmp_path / "watermarks.json"
+    path.write_text(
+        '{"k": {"last_run": "2026-10-17T00:00:00+00:00", "date_posted": "NaT",'
+        ' "job_urls": ["https://a"]}}',
+        encoding="utf-8",
+    )
+    assert Watermarks(path)._marks["k"].job_urls == ["https://a"]
+
+
+def test_scrape_requests_incremental_window(tmp_path, monkeypatch):
+    calls = []
+
+    def scrape_jobs(**kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame([{"job_url": "https://a"}])
+
+    monkeypatch.setattr(query_module, "scrape_jobs", scrape_jobs)
+    marks = Watermarks(tmp_path / "watermarks.json", overlap_hours=6)
+    q = Query(query="indeed: python", days_old=7)
+
+    assert len(q.scrape(watermarks=marks)) == 1
+    assert q.scrape(watermarks=marks) == []
+    assert [c["hours_old"] for c in calls] == [168, 7]
+
+
+def test_mark_stays_when_consumption_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        query_module,
+        "scrape_jobs",
+        lambda **kwargs: pd.DataFrame([{"job_url": "https://a"}]),
+    )
+    marks = Watermarks(tmp_path / "watermarks.json", overlap_hours=6)
+    q = Query(query="indeed: python", days_old=7)
+
+    def parse_all():
+        for _ in q.iter_jobs(watermarks=marks):
+            raise RuntimeError("parse failed")
+
+    with pytest.raises(RuntimeError):
+        parse_all()
+    assert marks.get(q) is None
+    assert not (tmp_path / "watermarks.json").exists()
+
+    # The next run requests the full window and gets the posting again.
+    assert len(q.run(watermarks=marks)) == 1
+    assert marks.get(q).job_urls == ["https://a"]
@@ -0,0 +1,105 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from job_search_pipeline.utils.format.value import json_default
+
+DEFAULT_CACHE_DIR = ".data/query/cache"
+
+
+class ScrapeCache:
+    """On-disk cache of scrape results keyed by the normalized query parameters.
+
+    Each entry is one JSON file. Entries older than `ttl` seconds are ignored
+    and removed on access. When the cache grows beyond `max_entries` files or
+    `max_bytes` bytes, the least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_DIR,
+        ttl: float = 6 * 3600,
+        max_entries: int = 512,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(params: dict) -> str:
+        """Returns a stable hash for the given scrape parameters."""
+        blob = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _file(self, params: dict) -> Path:
+        return self.path / f"{self.key(params)}.json"
+
+    def get(self, params: dict) -> list[dict] | None:
+        """Returns the cached records or None when missing/expired."""
+        file = self._file(params)
+        try:
+            with file.open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - float(entry.get("created", 0)) > self.ttl:
+            file.unlink(missing_ok=True)
+            return None
+
+        # Bump the access time used by the LRU eviction.
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+        return entry.get("records", [])
+
+    def put(self, params: dict, records: list[dict]) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        file = self._file(params)
+        tmp = file.with_suffix(file.suffix + ".tmp")
+        entry = {"created": time.time(), "params": params, "records": records}
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, default=json_default)
+        tmp.replace(file)
+        self.evict()
+
+    def evict(self) -> None:
+        """Drops expired entries, then least recently used ones over the limits."""
+        if not self.path.exists():
+            return
+
+        now = time.time()
+        entries = []
+        for file in self.path.glob("*.json"):
+            try:
+                st = file.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, file))
+
+        # Oldest access first.
+        entries.sort(key=lambda t: t[0])
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for mtime, size, file in entries:
+            if count <= self.max_entries and total <= self.max_bytes:
+                # Access time cannot be older than creation, so only the
+                # remaining entries may still be expired.
+                if now - mtime <= self.ttl:
+                    break
+            file.unlink(missing_ok=True)
+            count -= 1
+            total -= size
+
+    def clear(self) -> None:
+        for file in self.path.glob("*.json"):
+            file.unlink(missing_ok=True)
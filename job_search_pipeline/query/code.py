@@ -2,14 +2,76 @@
 #                       Copyright 2026, Sébastien Kéroack
 # ==============================================================================
 
-from job_search_pipeline.query import Query
+from job_search_pipeline.query import (
+    Deduplicator,
+    Query,
+    ScrapeCache,
+    Watermarks,
+    run_many,
+)
+from job_search_pipeline.store import JobStore
+from job_search_pipeline.utils import cache, metrics
 
 # ---- n8n Python node entrypoint ----
-out = []
 
-for it in _items:
-    q = Query.from_dict(**it["json"])
-    for job in q.run():
-        out.append({"json": job.parse()})
+# Optional "job_format" of Job.parse ("repr", "slim", "compact" or "none")
+job_format = _items[0]["json"].get("job_format", "repr") if _items else "repr"
+
+# Optional "salary_from_description" of Job.parse (parse the description when
+# the scraper gave no salary amounts)
+salary_from_description = bool(
+    _items[0]["json"].get("salary_from_description", False) if _items else False
+)
+
+# Optional "memo_path" where the format caches persist between runs
+memo_path = _items[0]["json"].get("memo_path") if _items else None
+if memo_path:
+    cache.load(memo_path)
+
+# Optional "store_path" of a local SQLite JobStore: jobs already stored are
+# dropped locally. Jobs are only stored once scored (`store/scored/code.py`),
+# so a failure further down the workflow does not hide them from later runs
+store_path = _items[0]["json"].get("store_path") if _items else None
+
+# Optional "watermarks_path" of the per-query high-water marks: queries only
+# request the hours since their last successful run (see `Watermarks`)
+watermarks_path = _items[0]["json"].get("watermarks_path") if _items else None
+watermarks = Watermarks(watermarks_path) if watermarks_path else None
+
+# Optional "cache_path" of the on-disk scrape cache: queries scraped within
+# its ttl are served from disk (see `ScrapeCache`)
+cache_path = _items[0]["json"].get("cache_path") if _items else None
+scrape_cache = ScrapeCache(cache_path) if cache_path else None
+
+# Optional "metrics_path" (".json" summary or ".prom" Prometheus text) where
+# the per-stage timings of this run are written (also when the run fails)
+metrics_path = _items[0]["json"].get("metrics_path") if _items else None
+if metrics_path:
+    metrics.reset()
+    metrics.enable()
+
+try:
+    queries = [Query.from_dict(**it["json"]) for it in _items]
+    rows = [
+        job.parse(
+            job_format=job_format, salary_from_description=salary_from_description
+        )
+        for job in run_many(
+            queries, dedup=Deduplicator(), cache=scrape_cache, watermarks=watermarks
+        )
+    ]
+    if store_path:
+        with JobStore(store_path) as store:
+            rows = store.new(rows)
+    out = [{"json": row} for row in rows]
+
+    if memo_path:
+        cache.save(memo_path)
+finally:
+    # The task runner is long-lived: later runs without "metrics_path" must
+    # not keep paying for the timers.
+    if metrics_path:
+        metrics.disable()
+        metrics.save(metrics_path)
 
 return out
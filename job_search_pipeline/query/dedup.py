@@ -0,0 +1,162 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import hashlib
+import math
+import re
+import struct
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Protocol
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from job_search_pipeline.utils.format.value import na
+
+# Query parameters that only track where a click came from.
+_TRACKING_PARAMS = {
+    "fbclid",
+    "from",
+    "gclid",
+    "refid",
+    "src",
+    "trackingid",
+    "trk",
+    "vjs",
+}
+
+_WS_PATTERN = re.compile(r"\s+")
+
+
+def _text(v: Any) -> str:
+    return na(str(v if v is not None else ""), default="")
+
+
+def canonical_url(url: str | None) -> str:
+    """Normalizes a job URL so the same posting always yields the same string."""
+    url = _text(url).strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            urlencode(query),
+            "",
+        )
+    )
+
+
+def job_key(record: Mapping[str, Any]) -> str:
+    """Returns the canonical key of a scraped job record.
+
+    Falls back from the site id to the normalized job URL, then to the
+    normalized title and company.
+    """
+    site = _text(record.get("site")).strip().lower()
+    job_id = _text(record.get("id")).strip()
+    if site and job_id:
+        return f"{site}:{job_id}"
+
+    url = canonical_url(record.get("job_url"))
+    if url:
+        return f"url:{url}"
+
+    title = _WS_PATTERN.sub(" ", _text(record.get("title"))).strip().casefold()
+    company = _WS_PATTERN.sub(" ", _text(record.get("company"))).strip().casefold()
+    return f"title:{title}|{company}"
+
+
+class KeySet(Protocol):
+    def __contains__(self, key: object) -> bool: ...
+
+    def add(self, key: str) -> None: ...
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set used to remember keys over long histories.
+
+    Membership tests can return false positives (at most about `error_rate`
+    once `capacity` keys were added) but never false negatives.
+    """
+
+    _HEADER = struct.Struct("<QII")
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.size = max(8, size)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def __contains__(self, key: object) -> bool:
+        return all(
+            self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(str(key))
+        )
+
+    def add(self, key: str) -> None:
+        for p in self._positions(key):
+            self._bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(self._HEADER.pack(self.size, self.hashes, self.count))
+            f.write(self._bits)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BloomFilter":
+        with Path(path).open("rb") as f:
+            size, hashes, count = cls._HEADER.unpack(f.read(cls._HEADER.size))
+            bits = bytearray(f.read())
+        if len(bits) != (size + 7) // 8:
+            raise ValueError(f"Corrupted bloom filter: {path}")
+        bloom = cls.__new__(cls)
+        bloom.size, bloom.hashes, bloom.count, bloom._bits = size, hashes, count, bits
+        return bloom
+
+    @classmethod
+    def open(cls, path: str | Path, **kwargs) -> "BloomFilter":
+        """Loads the filter at `path` or creates an empty one."""
+        return cls.load(path) if Path(path).exists() else cls(**kwargs)
+
+
+class Deduplicator:
+    """Drops records whose canonical key was already seen.
+
+    Backed by a plain set for a single run, or by a (persisted) `BloomFilter`
+    to remember keys across runs with bounded memory.
+    """
+
+    def __init__(self, seen: KeySet | None = None):
+        self.seen = seen if seen is not None else set()
+        self.dropped = 0
+
+    def add(self, record: Mapping[str, Any] | Any) -> bool:
+        """Returns True if the record (or `Job`) is new and remembers it."""
+        key = job_key(record) if isinstance(record, Mapping) else record.key()
+        if key in self.seen:
+            self.dropped += 1
+            return False
+        self.seen.add(key)
+        return True
+
+    def filter(self, records: Iterable[Any]) -> Iterator[Any]:
+        return (r for r in records if self.add(r))
@@ -0,0 +1,271 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import hashlib
+import json
+import random
+import time
+from datetime import date, timedelta
+from typing import Iterator
+
+import pandas as pd
+
+# Column order of the DataFrame returned by jobspy's `scrape_jobs`.
+JOBSPY_COLUMNS = (
+    "id",
+    "site",
+    "job_url",
+    "job_url_direct",
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "job_type",
+    "salary_source",
+    "interval",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "is_remote",
+    "job_level",
+    "job_function",
+    "listing_type",
+    "emails",
+    "description",
+    "company_industry",
+    "company_url",
+    "company_logo",
+    "company_url_direct",
+    "company_addresses",
+    "company_num_employees",
+    "company_revenue",
+    "company_description",
+    "skills",
+    "experience_range",
+    "company_rating",
+    "company_reviews_count",
+    "vacancy_count",
+    "work_from_home_type",
+)
+
+_TECHS = ["Python", "Java", "React", "DevOps", ".NET", "données", "Data", "QA"]
+
+_TITLES = {
+    "fr": [
+        "Développeur(euse) {tech}",
+        "Développeur.euse {tech} sénior.e",
+        "Développeuse/Développeur {tech}",
+        "Analyste programmeur.euse {tech}",
+        "Programmeur(se) {tech} - Stage (4 mois)",
+        "Ingénieur(e) {tech} intermédiaire",
+        "Chargé(e) de projet TI",
+        "Stage coopératif - Été 2026: Développeur {tech}",
+        "Développeur {tech} junior | Junior {tech} Developer",
+    ],
+    "en": [
+        "Senior {tech} Developer",
+        "{tech} Software Engineer",
+        "Junior {tech} Developer",
+        "Lead {tech} Engineer",
+        "{tech} Engineer - Contract",
+        "Software Developer II, {tech}",
+        "Intern, {tech} Development",
+        "Engineering Manager, {tech}",
+    ],
+}
+
+_PARAGRAPHS = {
+    "fr": [
+        "Nous sommes une entreprise québécoise en pleine croissance qui conçoit "
+        "des solutions logicielles pour les secteurs public et privé.",
+        "Tu feras partie d'une équipe multidisciplinaire et tu participeras à la "
+        "conception, au développement et au déploiement de nouvelles "
+        "fonctionnalités.",
+        "Responsabilités : analyser les besoins, écrire du code de qualité, "
+        "effectuer des revues de code et contribuer à l'amélioration continue.",
+        "Exigences : baccalauréat en informatique ou expérience équivalente, "
+        "maîtrise du français et connaissance de l'anglais.",
+        "Avantages : horaire flexible, télétravail hybride, assurances "
+        "collectives, REER avec contribution de l'employeur et formation continue.",
+        "Prime de référencement : jusqu'à 1000$ pour toute candidature retenue.",
+        "Nous souscrivons au principe d'équité en matière d'emploi et invitons "
+        "toutes les personnes qualifiées à postuler.",
+    ],
+    "en": [
+        "We are a fast-growing software company building products used by "
+        "thousands of customers across North America.",
+        "You will join a cross-functional team and take part in the design, "
+        "development and deployment of new features.",
+        "Responsibilities: gather requirements, write clean and tested code, "
+        "review pull requests and mentor teammates.",
+        "Requirements: a degree in computer science or equivalent experience, "
+        "and strong communication skills in English and French.",
+        "Benefits: flexible hours, hybrid work, group insurance, RRSP matching "
+        "and a yearly training budget.",
+        "Referral bonus: up to $1,000 for every successful hire.",
+        "We are an equal opportunity employer and welcome applications from all "
+        "qualified candidates.",
+    ],
+}
+
+_SALARIES = {
+    "fr": [
+        "Salaire : {lo_fr}$ à {hi_fr}$ par année.",
+        "Rémunération : entre {lo_fr} $ et {hi_fr} $ annuellement.",
+        "Salaire : {rate},00$ à {rate_hi},00$ de l'heure.",
+        "Taux horaire : {rate},50$ par heure.",
+    ],
+    "en": [
+        "Salary: ${lo:,} - ${hi:,} per year.",
+        "Compensation: ${lo_k}k–{hi_k}k annually.",
+        "Pay: ${rate} - ${rate_hi} per hour.",
+        "Hourly rate: ${rate}.50/hour.",
+    ],
+}
+
+_COMPANIES = [
+    "ACME",
+    "Initech",
+    "Globex Québec",
+    "Solutions Nordiques",
+    "Groupe Lévis TI",
+    "rh@umbrella.ca",
+    "Hooli / Hooli Canada",
+]
+
+_LOCATIONS = ["Québec, QC, CA", "Montréal, QC, CA", "Lévis, QC, CA", "Remote, CA"]
+
+
+def _seed(*parts) -> int:
+    blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return int.from_bytes(hashlib.sha256(blob.encode("utf-8")).digest()[:8], "little")
+
+
+def _fr_amount(value: int) -> str:
+    return f"{value:,}".replace(",", " ")
+
+
+class SyntheticJobs:
+    """Deterministic generator of bilingual (FR/EN) jobspy-like postings.
+
+    Posting `i` is always the same record for a given `seed`, so a pool of
+    indices shared by several queries yields realistic duplicates. The
+    description length follows a log-normal distribution around
+    `description_length` characters.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        description_length: int = 3500,
+        fr_ratio: float = 0.6,
+        salary_ratio: float = 0.6,
+        amounts_ratio: float = 0.3,
+        start: date = date(2026, 10, 1),
+    ):
+        self.seed = seed
+        self.description_length = description_length
+        self.fr_ratio = fr_ratio
+        self.salary_ratio = salary_ratio
+        self.amounts_ratio = amounts_ratio
+        self.start = start
+
+    def _description(self, rng: random.Random, lang: str, salary: str) -> str:
+        target = rng.lognormvariate(0, 0.5) * self.description_length
+        target = int(min(max(target, 500), 20000))
+        paragraphs, size = [], 0
+        while size < target:
+            paragraph = rng.choice(_PARAGRAPHS[lang])
+            paragraphs.append(paragraph)
+            size += len(paragraph) + 2
+        if salary:
+            paragraphs.insert(rng.randrange(len(paragraphs) + 1), salary)
+        return "\n\n".join(paragraphs)
+
+    def record(self, i: int, site: str = "indeed") -> dict:
+        """Returns posting `i` as a jobspy row."""
+        rng = random.Random(_seed(self.seed, site, i))
+        lang = "fr" if rng.random() < self.fr_ratio else "en"
+        title = rng.choice(_TITLES[lang]).format(tech=rng.choice(_TECHS))
+
+        lo = rng.randrange(50, 120) * 1000
+        hi = lo + rng.randrange(5, 40) * 1000
+        rate = rng.randrange(20, 70)
+        salary = ""
+        if rng.random() < self.salary_ratio:
+            salary = rng.choice(_SALARIES[lang]).format(
+                lo=lo,
+                hi=hi,
+                lo_fr=_fr_amount(lo),
+                hi_fr=_fr_amount(hi),
+                lo_k=lo // 1000,
+                hi_k=hi // 1000,
+                rate=rate,
+                rate_hi=rate + rng.randrange(2, 10),
+            )
+        amounts = rng.random() < self.amounts_ratio
+
+        record = dict.fromkeys(JOBSPY_COLUMNS)
+        record.update(
+            id=f"{site[:2]}-{i:012x}",
+            site=site,
+            job_url=f"https://jobs.example.com/{site}/{i:012x}",
+            title=title,
+            company=rng.choice(_COMPANIES),
+            location=rng.choice(_LOCATIONS),
+            date_posted=self.start - timedelta(days=rng.randrange(14)),
+            job_type=rng.choice(["fulltime", "contract", "internship", None]),
+            interval="yearly" if amounts else None,
+            min_amount=float(lo) if amounts else None,
+            max_amount=float(hi) if amounts else None,
+            currency="CAD" if amounts else None,
+            is_remote=rng.random() < 0.3,
+            description=self._description(rng, lang, salary),
+            company_url=f"https://www.example.com/cmp/{rng.randrange(1000)}",
+        )
+        return record
+
+    def __iter__(self) -> Iterator[dict]:
+        i = 0
+        while True:
+            yield self.record(i)
+            i += 1
+
+
+class FakeScraper:
+    """Offline stand-in for jobspy's `scrape_jobs` backed by `SyntheticJobs`.
+
+    Returns `results_wanted` postings per site, drawn from a pool of
+    `pool_size` postings so overlapping queries return some of the same
+    postings. The output only depends on the parameters and `seed`.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        pool_size: int = 1_000_000,
+        latency: float = 0.0,
+        jobs: SyntheticJobs | None = None,
+    ):
+        self.seed = seed
+        self.pool_size = pool_size
+        self.latency = latency
+        self.jobs = jobs if jobs is not None else SyntheticJobs(seed=seed)
+        self.calls = 0
+
+    def __call__(self, **params) -> pd.DataFrame:
+        self.calls += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        sites = params.get("site_name") or ["indeed"]
+        sites = [sites] if isinstance(sites, str) else list(sites)
+        wanted = int(params.get("results_wanted") or 15)
+        rng = random.Random(_seed(self.seed, params))
+        rows = [
+            self.jobs.record(rng.randrange(self.pool_size), site=site)
+            for site in sites
+            for _ in range(wanted)
+        ]
+        return pd.DataFrame(rows, columns=list(JOBSPY_COLUMNS))
@@ -0,0 +1,45 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable
+
+from job_search_pipeline.query.query import Job
+
+# Below this many jobs, the process pool start-up costs more than it saves.
+DEFAULT_MIN_BATCH = 256
+
+
+def _parse_chunk(jobs: list[Job], kwargs: dict) -> list[dict]:
+    return [job.parse(**kwargs) for job in jobs]
+
+
+def parse_many(
+    jobs: Iterable[Job],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    min_batch: int = DEFAULT_MIN_BATCH,
+    **kwargs,
+) -> list[dict]:
+    """Runs `Job.parse(**kwargs)` over many jobs using a process pool.
+
+    Jobs are split in chunks of `chunksize` (by default about four chunks per
+    worker) and the output keeps the input order. Batches smaller than
+    `min_batch`, or `workers <= 1`, are parsed in-process.
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) < max(min_batch, 2):
+        return _parse_chunk(jobs, kwargs)
+
+    chunksize = chunksize or math.ceil(len(jobs) / (workers * 4))
+    chunks = [jobs[i : i + chunksize] for i in range(0, len(jobs), chunksize)]
+    out = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        for parsed in pool.map(_parse_chunk, chunks, repeat(kwargs)):
+            out.extend(parsed)
+    return out
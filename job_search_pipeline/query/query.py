@@ -2,18 +2,35 @@
 #                       Copyright 2026, Sébastien Kéroack
 # ==============================================================================
 
-from dataclasses import dataclass
+import base64
+import json
+import math
+import zlib
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+import pandas as pd
 from jobspy import scrape_jobs
 
+from job_search_pipeline.query.cache import ScrapeCache
+from job_search_pipeline.query.dedup import Deduplicator, job_key
+from job_search_pipeline.utils import metrics
 from job_search_pipeline.utils.format import job_level, job_title, salary, company_name
+from job_search_pipeline.utils.parse.salary import extract_salary
+from job_search_pipeline.utils.parse.text import JobText
 from job_search_pipeline.utils.format.value import (
+    content_hash,
     na,
     optional_float,
     repr_dataclass_short,
 )
 
+if TYPE_CHECKING:
+    from job_search_pipeline.query.watermark import Watermarks
 
-@dataclass
+
+@dataclass(slots=True)
 class Job:
     query: str = ""
     id: str = ""
@@ -27,8 +44,8 @@ class Job:
     job_type: str = ""
     salary_source: str = ""
     interval: str = ""
-    min_amount: float = None
-    max_amount: float = None
+    min_amount: float | None = None
+    max_amount: float | None = None
     currency: str = ""
     is_remote: bool = False
     job_level: str = ""
@@ -52,59 +69,55 @@ class Job:
     work_from_home_type: str = ""
 
     @classmethod
+    @metrics.timed("job.from_dict")
     def from_dict(cls, **kwargs) -> "Job":
+        values = {name: na(str(kwargs.get(name, ""))) for name in _NA_FIELDS}
         return cls(
-            query=str(kwargs.get("query", cls.query)),
-            id=na(str(kwargs.get("id", cls.id))),
-            site=na(str(kwargs.get("site", cls.site))),
-            job_url=na(str(kwargs.get("job_url", cls.job_url))),
-            job_url_direct=na(str(kwargs.get("job_url_direct", cls.job_url_direct))),
-            title=na(str(kwargs.get("title", cls.title))),
-            company=na(str(kwargs.get("company", cls.company))),
-            location=na(str(kwargs.get("location", cls.location))),
-            date_posted=na(str(kwargs.get("date_posted", cls.date_posted))),
-            job_type=na(str(kwargs.get("job_type", cls.job_type))),
-            salary_source=na(str(kwargs.get("salary_source", cls.salary_source))),
-            interval=na(str(kwargs.get("interval", cls.interval))),
-            min_amount=optional_float(kwargs.get("min_amount")) or cls.min_amount,
-            max_amount=optional_float(kwargs.get("max_amount")) or cls.max_amount,
-            currency=na(str(kwargs.get("currency", cls.currency))),
-            is_remote=bool(kwargs.get("is_remote", cls.is_remote)),
-            job_level=na(str(kwargs.get("job_level", cls.job_level))),
-            job_function=na(str(kwargs.get("job_function", cls.job_function))),
-            listing_type=na(str(kwargs.get("listing_type", cls.listing_type))),
-            emails=na(str(kwargs.get("emails", cls.emails))),
-            description=na(str(kwargs.get("description", cls.description))),
-            company_industry=na(
-                str(kwargs.get("company_industry", cls.company_industry))
-            ),
-            company_url=na(str(kwargs.get("company_url", cls.company_url))),
-            company_logo=na(str(kwargs.get("company_logo", cls.company_logo))),
-            company_url_direct=na(
-                str(kwargs.get("company_url_direct", cls.company_url_direct))
-            ),
-            company_addresses=na(
-                str(kwargs.get("company_addresses", cls.company_addresses))
-            ),
-            company_num_employees=na(
-                str(kwargs.get("company_num_employees", cls.company_num_employees))
-            ),
-            company_revenue=na(str(kwargs.get("company_revenue", cls.company_revenue))),
-            company_description=na(
-                str(kwargs.get("company_description", cls.company_description))
-            ),
-            skills=na(str(kwargs.get("skills", cls.skills))),
-            experience_range=na(
-                str(kwargs.get("experience_range", cls.experience_range))
-            ),
-            company_rating=na(str(kwargs.get("company_rating", cls.company_rating))),
-            company_reviews_count=na(
-                str(kwargs.get("company_reviews_count", cls.company_reviews_count))
-            ),
-            vacancy_count=na(str(kwargs.get("vacancy_count", cls.vacancy_count))),
-            work_from_home_type=na(
-                str(kwargs.get("work_from_home_type", cls.work_from_home_type))
-            ),
+            query=str(kwargs.get("query", "")),
+            min_amount=optional_float(kwargs.get("min_amount")) or None,
+            max_amount=optional_float(kwargs.get("max_amount")) or None,
+            is_remote=bool(kwargs.get("is_remote", False)),
+            **values,
+        )
+
+    @classmethod
+    def iter_frame(cls, frame: pd.DataFrame, query: str = "") -> Iterator["Job"]:
+        """Builds jobs from a jobspy DataFrame, normalizing it column-wise.
+
+        Equivalent to calling `from_dict` on every row, but the NA handling
+        is done once per column instead of once per cell.
+        """
+        n = len(frame)
+        columns: list[list[Any]] = []
+        with metrics.timer("job.convert"):
+            for name in _FIELDS:
+                col = frame[name] if name in frame.columns else None
+                if name == "query":
+                    columns.append([query] * n)
+                elif name in ("min_amount", "max_amount"):
+                    columns.append(_float_column(col, n))
+                elif name == "is_remote":
+                    columns.append([False] * n if col is None else list(map(bool, col)))
+                else:
+                    columns.append(_na_column(col, n))
+        metrics.count("job.rows", n)
+        for values in zip(*columns):
+            yield cls(*values)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, query: str = "") -> list["Job"]:
+        return list(cls.iter_frame(frame, query=query))
+
+    def key(self) -> str:
+        """Returns the canonical key used to deduplicate jobs."""
+        return job_key(
+            {
+                "site": self.site,
+                "id": self.id,
+                "job_url": self.job_url,
+                "title": self.title,
+                "company": self.company,
+            }
         )
 
     def title_gendered(self, gender="man") -> str:
@@ -114,18 +127,58 @@ class Job:
         """Returns city part from location."""
         return self.location.split(",")[0].strip().title() or "N/A"
 
-    def salary(self) -> str:
+    def salary(
+        self, from_description: bool = False, description: JobText | None = None
+    ) -> str:
+        """Returns the formatted salary.
+
+        With `from_description`, the description is parsed when the scraper
+        gave no amounts. The scan is bounded by `DESCRIPTION_SALARY_MAX_LENGTH`
+        and stops at the first match scoring `DESCRIPTION_SALARY_STOP_SCORE`.
+        `description` is the preprocessed `self.description`, if already built.
+        """
+        interval, lo, hi, currency = (
+            self.interval,
+            self.min_amount,
+            self.max_amount,
+            self.currency,
+        )
+        if from_description and lo is None and hi is None:
+            with metrics.timer("parse.salary"):
+                interval, lo, hi, currency = extract_salary(
+                    description or self.description,
+                    currency=self.currency,
+                    max_length=DESCRIPTION_SALARY_MAX_LENGTH,
+                    stop_score=DESCRIPTION_SALARY_STOP_SCORE,
+                )
         return salary.transform(
-            min_amount=self.min_amount,
-            max_amount=self.max_amount,
-            currency=self.currency,
-            interval=self.interval,
+            min_amount=lo,
+            max_amount=hi,
+            currency=currency,
+            interval=interval,
         )
 
-    def parse(self) -> dict:
-        title = self.title_gendered()
+    @metrics.timed("job.parse")
+    def parse(
+        self, job_format: str = "repr", salary_from_description: bool = False
+    ) -> dict:
+        """Returns the record sent downstream.
 
-        return {
+        `job_format` controls the "job" key:
+          - "repr":    full `repr(self)` (default)
+          - "slim":    `repr(self)` with the large fields replaced by their hash
+          - "compact": `self.encode()` without the large fields (see `decode`)
+          - "none":    no "job" key
+
+        `salary_from_description` is passed to `salary` as `from_description`.
+        """
+        if job_format not in JOB_FORMATS:
+            raise NotImplementedError(f"Only {JOB_FORMATS} job formats are supported.")
+
+        title = self.title_gendered()
+        # Preprocessed once for the level and salary parsers.
+        description = JobText(self.description)
+        out = {
             "date_posted": self.date_posted,
             "source": "python-jobspy",
             "site": self.site,
@@ -134,20 +187,107 @@ class Job:
             "company_description": self.company_description,
             "company_url": self.company_url,
             "title": title,
-            "level": job_level.transform(title, self.description),
+            "level": job_level.transform(title, description),
             "description": self.description,
-            "salary": self.salary(),
+            "salary": self.salary(
+                from_description=salary_from_description, description=description
+            ),
             "url": self.job_url,
             "type": self.job_type,
             "city": self.city(),
             "is_remote": str(self.is_remote).upper(),
-            "job": repr(self),
         }
+        if job_format == "repr":
+            out["job"] = repr(self)
+        elif job_format == "slim":
+            hashes = {
+                k: (
+                    description.content_hash
+                    if k == "description"
+                    else content_hash(getattr(self, k))
+                )
+                for k in LARGE_FIELDS
+            }
+            out["job"] = repr_dataclass_short(self, **hashes)
+        elif job_format == "compact":
+            out["job"] = self.encode(omit=LARGE_FIELDS)
+        return out
+
+    def encode(self, omit: Iterable[str] = ()) -> str:
+        """Returns a compact, lossless text encoding of the job.
+
+        Fields in `omit` are replaced by their content hash and must be given
+        back to `decode`.
+        """
+        omit = set(omit)
+        values = [
+            content_hash(getattr(self, name)) if name in omit else getattr(self, name)
+            for name in _FIELDS
+        ]
+        blob = json.dumps([sorted(omit), values], ensure_ascii=False)
+        packed = zlib.compress(blob.encode("utf-8"), 9)
+        return _ENCODING_PREFIX + base64.urlsafe_b64encode(packed).decode("ascii")
+
+    @classmethod
+    def decode(cls, payload: str, **omitted: str) -> "Job":
+        """Inverse of `encode`; omitted fields are checked against their hash."""
+        if not payload.startswith(_ENCODING_PREFIX):
+            raise ValueError("Not an encoded job payload.")
+        packed = base64.urlsafe_b64decode(payload[len(_ENCODING_PREFIX) :])
+        omit, values = json.loads(zlib.decompress(packed).decode("utf-8"))
+        values = dict(zip(_FIELDS, values))
+        for name in omit:
+            if name not in omitted:
+                raise ValueError(f"Missing omitted field: {name}")
+            if content_hash(omitted[name]) != values[name]:
+                raise ValueError(f"Content hash mismatch for field: {name}")
+            values[name] = omitted[name]
+        return cls(**values)
 
     def __repr__(self) -> str:
         return repr_dataclass_short(self)
 
 
+# Fields that already appear as top-level keys of `Job.parse()`.
+LARGE_FIELDS = ("description", "company_description")
+JOB_FORMATS = ("repr", "slim", "compact", "none")
+
+# Bounds the salary scan of descriptions (see `Job.salary`).
+DESCRIPTION_SALARY_MAX_LENGTH = 20000
+DESCRIPTION_SALARY_STOP_SCORE = 5
+
+# A `scrape_jobs` compatible callable, e.g. `fake.FakeScraper`.
+Scraper = Callable[..., pd.DataFrame]
+
+_ENCODING_PREFIX = "job1:"
+_FIELDS = tuple(f.name for f in fields(Job))
+_NA_FIELDS = tuple(
+    name
+    for name in _FIELDS
+    if name not in ("query", "min_amount", "max_amount", "is_remote")
+)
+_NA_PATTERN = r"\s*|(?i:nan|none|null|n/a)"
+
+
+def _na_column(col: pd.Series | None, n: int) -> list[str]:
+    """Column-wise `na(str(v))`."""
+    if col is None:
+        return ["N/A"] * n
+    if col.dtype == object or pd.api.types.is_string_dtype(col.dtype):
+        col = col.astype(str).fillna("N/A")
+    else:
+        col = pd.Series([str(v) for v in col.tolist()], index=col.index, dtype=object)
+    return col.mask(col.str.fullmatch(_NA_PATTERN), "N/A").tolist()
+
+
+def _float_column(col: pd.Series | None, n: int) -> list[float | None]:
+    """Column-wise `optional_float(v) or None`."""
+    if col is None:
+        return [None] * n
+    values = pd.to_numeric(col, errors="coerce").tolist()
+    return [v if v == v and v else None for v in values]
+
+
 @dataclass
 class Query:
     query: str = ""
@@ -178,9 +318,17 @@ class Query:
             else self.distance_unit
         )
 
-    def hours_old(self) -> int:
-        """Converts days_old to hours_old."""
-        return self.days_old * 24
+    def hours_old(self, since: datetime | None = None, overlap_hours: int = 0) -> int:
+        """Converts days_old to hours_old.
+
+        When `since` is given, only the hours elapsed since then (plus
+        `overlap_hours`) are requested, capped to days_old.
+        """
+        hours = self.days_old * 24
+        if since is None:
+            return hours
+        elapsed = (datetime.now(timezone.utc) - since).total_seconds() / 3600
+        return max(1, min(hours, math.ceil(elapsed) + overlap_hours))
 
     @classmethod
     def from_dict(cls, **kwargs) -> "Query":
@@ -194,20 +342,116 @@ class Query:
             sort_by=str(kwargs.get("sort_by", cls.sort_by)).strip().lower(),
         )
 
-    def scrape(self) -> list[dict]:
-        return scrape_jobs(
-            site_name=self.site_name(),
-            search_term=self.search_term(),
-            location=self.location,
-            country_indeed=self.country(),
-            results_wanted=self.results_wanted,
-            hours_old=self.hours_old(),
-            distance=self.distance(),
-            sort_by=self.sort_by,
-        ).to_dict(orient="records")
-
-    def run(self) -> list[Job]:
-        return [Job.from_dict(query=repr(self), **job) for job in self.scrape()]
+    def params(self, watermarks: "Watermarks | None" = None) -> dict:
+        """Returns the normalized keyword arguments passed to scrape_jobs."""
+        hours_old = (
+            watermarks.hours_old(self) if watermarks is not None else self.hours_old()
+        )
+        return {
+            "site_name": self.site_name(),
+            "search_term": " ".join(self.search_term().split()),
+            "location": self.location,
+            "country_indeed": self.country(),
+            "results_wanted": self.results_wanted,
+            "hours_old": hours_old,
+            "distance": self.distance(),
+            "sort_by": self.sort_by,
+        }
+
+    def fetch(
+        self,
+        cache: ScrapeCache | None = None,
+        watermarks: "Watermarks | None" = None,
+        scraper: Scraper | None = None,
+    ) -> pd.DataFrame:
+        """Returns the jobspy DataFrame, served from `cache` when possible.
+
+        `scraper` replaces jobspy's `scrape_jobs` (e.g. for offline runs).
+        With `watermarks`, the mark is only staged: the iterators below move it
+        once fully consumed, other callers call `Watermarks.commit`.
+        """
+        started = datetime.now(timezone.utc)
+        params = self.params(watermarks)
+        records = cache.get(params) if cache is not None else None
+        if records is None:
+            with metrics.timer("query.scrape"):
+                frame = (scraper or scrape_jobs)(**params)
+            metrics.count("query.scrapes")
+            if cache is not None:
+                cache.put(params, frame.to_dict(orient="records"))
+        else:
+            frame = pd.DataFrame.from_records(records)
+            metrics.count("query.cache_hits")
+
+        if watermarks is not None:
+            frame = watermarks.advance(self, frame, started)
+        return frame
+
+    def iter_records(
+        self,
+        cache: ScrapeCache | None = None,
+        watermarks: "Watermarks | None" = None,
+        scraper: Scraper | None = None,
+    ) -> Iterator[dict]:
+        """Scrapes now and returns an iterator converting rows one at a time."""
+        frame = self.fetch(cache=cache, watermarks=watermarks, scraper=scraper)
+        return _committed(self, _iter_frame_records(frame), watermarks)
+
+    def scrape(
+        self,
+        cache: ScrapeCache | None = None,
+        watermarks: "Watermarks | None" = None,
+        scraper: Scraper | None = None,
+    ) -> list[dict]:
+        frame = self.fetch(cache=cache, watermarks=watermarks, scraper=scraper)
+        records = frame.to_dict(orient="records")
+        if watermarks is not None:
+            watermarks.commit(self)
+        return records
+
+    def iter_jobs(
+        self,
+        cache: ScrapeCache | None = None,
+        watermarks: "Watermarks | None" = None,
+        dedup: Deduplicator | None = None,
+        scraper: Scraper | None = None,
+    ) -> Iterator[Job]:
+        frame = self.fetch(cache=cache, watermarks=watermarks, scraper=scraper)
+        return _committed(self, _iter_jobs(repr(self), frame, dedup), watermarks)
+
+    def run(
+        self,
+        cache: ScrapeCache | None = None,
+        watermarks: "Watermarks | None" = None,
+        dedup: Deduplicator | None = None,
+        scraper: Scraper | None = None,
+    ) -> list[Job]:
+        jobs = self.iter_jobs(
+            cache=cache, watermarks=watermarks, dedup=dedup, scraper=scraper
+        )
+        return list(jobs)
 
     def __repr__(self) -> str:
         return repr_dataclass_short(self)
+
+
+def _iter_frame_records(frame: pd.DataFrame) -> Iterator[dict]:
+    columns = list(frame.columns)
+    for row in frame.itertuples(index=False, name=None):
+        yield dict(zip(columns, row))
+
+
+def _committed(
+    query: Query, items: Iterator[Any], watermarks: "Watermarks | None"
+) -> Iterator[Any]:
+    """Yields `items`, then moves the watermark of `query` (if any)."""
+    yield from items
+    if watermarks is not None:
+        watermarks.commit(query)
+
+
+def _iter_jobs(
+    query: str, frame: pd.DataFrame, dedup: Deduplicator | None = None
+) -> Iterator[Job]:
+    jobs = Job.iter_frame(frame, query=query)
+    return dedup.filter(jobs) if dedup is not None else jobs
@@ -8,26 +8,28 @@
 python -m job_search_pipeline.query.query_dirtytest
 ```
 
-# Example usage: Load and inspect saved jobs CSV
+# Example usage: Stream and inspect saved jobs
 ```python
 import pandas as pd
+from job_search_pipeline.store import JsonlStore
 pd.set_option("display.max_columns", None)
 pd.set_option("display.max_rows", None)
 pd.set_option("display.width", None)
 pd.set_option("display.max_colwidth", 50)
-jobs = pd.read_json(".data/query/jobs.json", orient="records")
+jobs = next(JsonlStore().iter_frames(chunksize=1000))
 jobs.columns
 jobs["job_url"][0]
 ```
 """
 
 import json
-from datetime import date, datetime
-from os import makedirs
-from os.path import exists
 from pathlib import Path
 
-from job_search_pipeline.query import Query
+from job_search_pipeline.query import Query, ScrapeCache
+from job_search_pipeline.store import JsonlStore
+
+# Former JSON array of every saved job, imported once into the store.
+LEGACY_PATH = Path(".data/query/jobs.json")
 
 
 def _load_json_records(path: Path) -> list[dict]:
@@ -41,35 +43,12 @@ def _load_json_records(path: Path) -> list[dict]:
         return []
 
 
-def _json_default(v):
-    # datetime/date (and pandas Timestamp behaves similarly)
-    if isinstance(v, (datetime, date)):
-        return v.isoformat()
-
-    # numpy scalars often have .item()
-    item = getattr(v, "item", None)
-    if callable(item):
-        try:
-            return item()
-        except Exception:
-            pass
-
-    # fallback
-    return str(v)
-
-
-def _save_json_records(path: Path, records: list[dict]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(records, f, ensure_ascii=False, indent=2, default=_json_default)
-    tmp.replace(path)
-
-
 def run():
-    # Ensure data directory exists
-    if not exists(".data/query"):
-        makedirs(".data/query")
+    store = JsonlStore()
+    if not len(store) and LEGACY_PATH.exists():
+        imported = store.append(_load_json_records(LEGACY_PATH))
+        LEGACY_PATH.rename(LEGACY_PATH.with_suffix(".json.imported"))
+        print(f"Imported {imported} records from {LEGACY_PATH}")
 
     # Query site
     jobs = Query(
@@ -80,34 +59,12 @@ def run():
         days_old=7,
         results_wanted=20,
         sort_by="relevance",
-    ).scrape()
-    out_path = Path(".data/query/jobs.json")
-
-    # Append results (keep valid JSON array). True file-append isn't possible for JSON arrays
-    # without rewriting the file, so we load+merge+write.
-    existing = _load_json_records(out_path)
-    new_records = jobs
-
-    seen = set()
-    merged: list[dict] = []
-    for rec in existing:
-        key = rec.get("job_url")
-        if key in seen:
-            continue
-        seen.add(key)
-        merged.append(rec)
-    added = 0
-    for rec in new_records:
-        key = rec.get("job_url")
-        if key in seen:
-            continue
-        seen.add(key)
-        merged.append(rec)
-        added += 1
+    ).scrape(cache=ScrapeCache())
 
-    _save_json_records(out_path, merged)
+    # Only the new records are written; the store dedups by key and URL.
+    added = store.append(jobs)
     print(
-        f"Loaded {len(existing)} existing records; appended {added}; total {len(merged)} -> {out_path}"
+        f"Appended {added} of {len(jobs)} records; total {len(store)} -> {store.path}"
     )
 
 
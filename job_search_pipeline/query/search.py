@@ -0,0 +1,176 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+import pandas as pd
+
+from job_search_pipeline.query.cache import ScrapeCache
+from job_search_pipeline.query.dedup import Deduplicator
+from job_search_pipeline.query.query import (
+    Job,
+    Query,
+    Scraper,
+    _committed,
+    _iter_frame_records,
+    _iter_jobs,
+)
+from job_search_pipeline.query.watermark import Watermarks
+
+# Politeness budget applied to every site unless overridden with `site_limits`.
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_SITE_LIMIT = 2
+# Same range as the "Code: Random Wait" node (seconds).
+DEFAULT_DELAY = (2.5, 5.5)
+
+
+class _SiteLimiter:
+    """Bounds the number of in-flight scrapes per site."""
+
+    def __init__(self, site_limits: dict[str, int], default: int):
+        self._site_limits = {k.strip().lower(): v for k, v in site_limits.items()}
+        self._default = default
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def slot(self, site: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(site)
+            if sem is None:
+                limit = max(1, int(self._site_limits.get(site, self._default)))
+                sem = self._semaphores[site] = threading.BoundedSemaphore(limit)
+            return sem
+
+
+def _fetch_many(
+    queries: Iterable[Query],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    site_limits: dict[str, int] | None = None,
+    default_site_limit: int = DEFAULT_SITE_LIMIT,
+    delay: tuple[float, float] = DEFAULT_DELAY,
+    cache: ScrapeCache | None = None,
+    watermarks: Watermarks | None = None,
+    scraper: Scraper | None = None,
+) -> Iterator[tuple[Query, pd.DataFrame]]:
+    queries = list(queries)
+    if not queries:
+        return
+
+    limiter = _SiteLimiter(site_limits or {}, default_site_limit)
+    lo, hi = delay
+
+    def fetch(q: Query) -> pd.DataFrame:
+        return q.fetch(cache=cache, watermarks=watermarks, scraper=scraper)
+
+    def task(q: Query) -> tuple[Query, pd.DataFrame]:
+        if cache is not None and cache.get(q.params(watermarks)) is not None:
+            return q, fetch(q)
+
+        with limiter.slot(q.site_name()):
+            try:
+                return q, fetch(q)
+            finally:
+                if hi > 0:
+                    time.sleep(random.uniform(lo, hi))
+
+    workers = max(1, min(max_workers, len(queries)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(task, q) for q in queries}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def scrape_many(
+    queries: Iterable[Query], **kwargs
+) -> Iterator[tuple[Query, Iterator[dict]]]:
+    """Runs the scrapes concurrently and yields results as they complete.
+
+    Each site gets at most `site_limits[site]` (or `default_site_limit`)
+    scrapes in flight. A slot is held for a random `delay` after its scrape
+    returns so consecutive requests to the same site stay spaced out.
+    Queries served from `cache` skip both the slot and the delay.
+
+    Records are converted lazily (see `Query.iter_records`) as the caller
+    iterates them, and the watermark of a query moves once its records
+    were consumed.
+    """
+    watermarks = kwargs.get("watermarks")
+    for q, frame in _fetch_many(queries, **kwargs):
+        yield q, _committed(q, _iter_frame_records(frame), watermarks)
+
+
+def run_many(
+    queries: Iterable[Query], dedup: Deduplicator | None = None, **kwargs
+) -> Iterator[Job]:
+    """Same as `scrape_many` but yields `Job` objects (see `Query.iter_jobs`).
+
+    With `dedup`, postings already returned by another query of the run (or
+    remembered from previous runs) are dropped before they are parsed.
+    """
+    watermarks = kwargs.get("watermarks")
+    for q, frame in _fetch_many(queries, **kwargs):
+        yield from _committed(q, _iter_jobs(repr(q), frame, dedup), watermarks)
+
+
+@dataclass
+class Search:
+    """Search spec as found in `search.json` (lists of queries and locations)."""
+
+    query: list[str] = field(default_factory=list)
+    location: list[str] = field(default_factory=list)
+    distance_unit: int = Query.distance_unit
+    distance_use_km: bool = Query.distance_use_km
+    days_old: int = Query.days_old
+    results_wanted: int = Query.results_wanted
+    sort_by: str = Query.sort_by
+
+    @classmethod
+    def from_dict(cls, **kwargs) -> "Search":
+        def as_list(v) -> list[str]:
+            if v is None:
+                return []
+            return [str(v)] if isinstance(v, str) else [str(x) for x in v]
+
+        return cls(
+            query=as_list(kwargs.get("query")),
+            location=as_list(kwargs.get("location")),
+            distance_unit=int(kwargs.get("distance_unit", cls.distance_unit)),
+            distance_use_km=bool(kwargs.get("distance_use_km", cls.distance_use_km)),
+            days_old=int(kwargs.get("days_old", cls.days_old)),
+            results_wanted=int(kwargs.get("results_wanted", cls.results_wanted)),
+            sort_by=str(kwargs.get("sort_by", cls.sort_by)),
+        )
+
+    def queries(self) -> list[Query]:
+        """Expands the location × query matrix into one `Query` per pair."""
+        return [
+            Query.from_dict(
+                query=query,
+                location=location,
+                distance_unit=self.distance_unit,
+                distance_use_km=self.distance_use_km,
+                days_old=self.days_old,
+                results_wanted=self.results_wanted,
+                sort_by=self.sort_by,
+            )
+            for location in self.location
+            for query in self.query
+        ]
+
+    def scrape(self, **kwargs) -> Iterator[tuple[Query, Iterator[dict]]]:
+        return scrape_many(self.queries(), **kwargs)
+
+    def run(self, **kwargs) -> Iterator[Job]:
+        return run_many(self.queries(), **kwargs)
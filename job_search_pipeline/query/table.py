@@ -0,0 +1,255 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from job_search_pipeline.query.query import (
+    _ENCODING_PREFIX,
+    _FIELDS,
+    DESCRIPTION_SALARY_MAX_LENGTH,
+    DESCRIPTION_SALARY_STOP_SCORE,
+    JOB_FORMATS,
+    LARGE_FIELDS,
+    Job,
+    _float_column,
+    _na_column,
+)
+from job_search_pipeline.utils import metrics
+from job_search_pipeline.utils.format import job_level, job_title, salary, company_name
+from job_search_pipeline.utils.format.value import content_hash, repr_dataclass_short
+from job_search_pipeline.utils.parse.salary import extract_salary_column
+
+# Low-cardinality fields stored as pandas categoricals.
+CATEGORICAL_FIELDS = ("site", "job_type", "currency", "interval", "job_level")
+
+_AMOUNT_FIELDS = ("min_amount", "max_amount")
+_TEXT_FIELDS = tuple(
+    name
+    for name in _FIELDS
+    if name not in (*CATEGORICAL_FIELDS, *_AMOUNT_FIELDS, "is_remote")
+)
+
+
+def _map_unique(fn: Callable, col: pd.Series) -> list:
+    """`[fn(v) for v in col]`, calling `fn` once per distinct value."""
+    codes, uniques = pd.factorize(col)
+    return np.asarray([fn(v) for v in uniques], dtype=object)[codes].tolist()
+
+
+def _optional(values: Iterable) -> list:
+    """Turns the NaNs of a float column back into None."""
+    return [v if v == v else None for v in values]
+
+
+class JobTable:
+    """Columnar container of jobs backed by a pandas DataFrame.
+
+    `frame` has one column per `Job` field, with the `CATEGORICAL_FIELDS`
+    stored as categoricals and missing amounts as NaN. Tables convert to and
+    from `Job` objects, and `parse` is the column-wise `Job.parse`.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+
+    @classmethod
+    def _from_columns(cls, columns: dict[str, Sequence]) -> "JobTable":
+        frame = pd.DataFrame(columns, columns=list(_FIELDS))
+        frame = frame.astype(
+            {
+                # Text columns stay text when the table is empty.
+                **{name: object for name in _TEXT_FIELDS},
+                **{name: "category" for name in CATEGORICAL_FIELDS},
+                **{name: "float64" for name in _AMOUNT_FIELDS},
+                "is_remote": bool,
+            }
+        )
+        return cls(frame)
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[Job]) -> "JobTable":
+        rows = [[getattr(job, name) for name in _FIELDS] for job in jobs]
+        columns = zip(*rows) if rows else [[] for _ in _FIELDS]
+        return cls._from_columns(dict(zip(_FIELDS, columns)))
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, query: str = "") -> "JobTable":
+        """Builds a table from a jobspy DataFrame (see `Job.iter_frame`).
+
+        A "query" column, if any, takes precedence over `query`.
+        """
+        n = len(frame)
+        columns: dict[str, Sequence[Any]] = {}
+        with metrics.timer("job.convert"):
+            for name in _FIELDS:
+                col = frame[name] if name in frame.columns else None
+                if name == "query":
+                    columns[name] = (
+                        [query] * n if col is None else col.astype(str).tolist()
+                    )
+                elif name in _AMOUNT_FIELDS:
+                    columns[name] = _float_column(col, n)
+                elif name == "is_remote":
+                    columns[name] = [False] * n if col is None else list(map(bool, col))
+                else:
+                    columns[name] = _na_column(col, n)
+        metrics.count("job.rows", n)
+        return cls._from_columns(columns)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict], query: str = "") -> "JobTable":
+        return cls.from_frame(pd.DataFrame.from_records(list(records)), query=query)
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict]) -> "JobTable":
+        """Builds a table from n8n items.
+
+        Items are either parsed jobs in the "compact" `job_format` (decoded
+        with their top-level large fields) or raw jobspy-like records.
+        """
+        records = [item["json"] for item in items]
+        payloads = [record.get("job") for record in records]
+        if records and all(
+            isinstance(p, str) and p.startswith(_ENCODING_PREFIX) for p in payloads
+        ):
+            return cls.from_jobs(
+                Job.decode(p, **{k: r[k] for k in LARGE_FIELDS if k in r})
+                for p, r in zip(payloads, records)
+            )
+        return cls.from_records(records)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __getitem__(self, i: int) -> Job:
+        row = self.frame.iloc[i]
+        values = {name: row[name] for name in _FIELDS}
+        for name in _AMOUNT_FIELDS:
+            values[name] = _optional([values[name]])[0]
+        return Job(**values)
+
+    def __iter__(self) -> Iterator[Job]:
+        columns: list[list[Any]] = []
+        for name in _FIELDS:
+            values = self.frame[name].tolist()
+            columns.append(_optional(values) if name in _AMOUNT_FIELDS else values)
+        for row in zip(*columns):
+            yield Job(*row)
+
+    def to_jobs(self) -> list[Job]:
+        return list(self)
+
+    def filter(self, mask: Any = None, **equals: Any) -> "JobTable":
+        """Returns the rows matching the boolean `mask` and every `equals`.
+
+        `equals` maps a field to a value, or to a list/tuple/set of values.
+        """
+        keep = np.ones(len(self.frame), dtype=bool)
+        if mask is not None:
+            keep &= np.asarray(mask, dtype=bool)
+        for name, value in equals.items():
+            col = self.frame[name]
+            if isinstance(value, (list, tuple, set, frozenset)):
+                keep &= col.isin(list(value)).to_numpy(dtype=bool)
+            else:
+                keep &= (col == value).to_numpy(dtype=bool)
+        return JobTable(self.frame[keep].reset_index(drop=True))
+
+    def _salary(self, from_description: bool) -> list[str]:
+        """Column-wise `Job.salary`."""
+        f = self.frame
+        interval = f["interval"].astype(object)
+        lo, hi = f["min_amount"], f["max_amount"]
+        currency = f["currency"].astype(object)
+        if from_description:
+            missing = (lo.isna() & hi.isna()).to_numpy()
+            if missing.any():
+                found = extract_salary_column(
+                    f["description"][missing],
+                    max_length=DESCRIPTION_SALARY_MAX_LENGTH,
+                    stop_score=DESCRIPTION_SALARY_STOP_SCORE,
+                )
+                interval, lo, hi = interval.copy(), lo.copy(), hi.copy()
+                interval[missing] = found["interval"].astype(object).to_numpy()
+                lo[missing] = found["min_amount"].to_numpy()
+                hi[missing] = found["max_amount"].to_numpy()
+                # `extract_salary` echoes the job currency when it finds one.
+                currency = currency.where(~missing | interval.notna(), None)
+        return [
+            salary.transform(
+                min_amount=a,
+                max_amount=b,
+                currency=None if c != c else c,
+                interval=None if i != i else i,
+            )
+            for a, b, c, i in zip(
+                _optional(lo.tolist()),
+                _optional(hi.tolist()),
+                currency.tolist(),
+                interval.tolist(),
+            )
+        ]
+
+    def parse(
+        self, job_format: str = "repr", salary_from_description: bool = False
+    ) -> pd.DataFrame:
+        """Column-wise `Job.parse`; returns one row per job.
+
+        Formatters run once per distinct value (titles, companies), and the
+        description salaries are extracted with `extract_salary_column`.
+        """
+        if job_format not in JOB_FORMATS:
+            raise NotImplementedError(f"Only {JOB_FORMATS} job formats are supported.")
+
+        f = self.frame
+        titles = _map_unique(job_title.transform, f["title"])
+        levels = [
+            job_level.transform(title, description)
+            for title, description in zip(titles, f["description"].tolist())
+        ]
+        cities = f["location"].str.split(",").str[0].str.strip().str.title()
+        out = pd.DataFrame(
+            {
+                "date_posted": f["date_posted"],
+                "source": "python-jobspy",
+                "site": f["site"].astype(object),
+                "emails": f["emails"],
+                "company": _map_unique(company_name.transform, f["company"]),
+                "company_description": f["company_description"],
+                "company_url": f["company_url"],
+                "title": titles,
+                "level": levels,
+                "description": f["description"],
+                "salary": self._salary(salary_from_description),
+                "url": f["job_url"],
+                "type": f["job_type"].astype(object),
+                "city": cities.mask(cities == "", "N/A"),
+                "is_remote": f["is_remote"].map({True: "TRUE", False: "FALSE"}),
+            },
+            index=f.index,
+        )
+        if job_format == "repr":
+            out["job"] = [repr(job) for job in self]
+        elif job_format == "slim":
+            out["job"] = [
+                repr_dataclass_short(
+                    job, **{k: content_hash(getattr(job, k)) for k in LARGE_FIELDS}
+                )
+                for job in self
+            ]
+        elif job_format == "compact":
+            out["job"] = [job.encode(omit=LARGE_FIELDS) for job in self]
+        return out
+
+    def to_items(
+        self, job_format: str = "repr", salary_from_description: bool = False
+    ) -> list[dict]:
+        """Returns the n8n items of `parse`, as sent by the query node."""
+        parsed = self.parse(
+            job_format=job_format, salary_from_description=salary_from_description
+        )
+        return [{"json": record} for record in parsed.to_dict("records")]
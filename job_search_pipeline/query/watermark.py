@@ -0,0 +1,123 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import json
+import threading
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from job_search_pipeline.query.cache import ScrapeCache
+from job_search_pipeline.utils.format.value import na
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from job_search_pipeline.query.query import Query
+
+DEFAULT_WATERMARKS_PATH = ".data/query/watermarks.json"
+
+
+@dataclass
+class Watermark:
+    last_run: str = ""
+    job_urls: list[str] = field(default_factory=list)
+
+    def since(self) -> datetime | None:
+        """Returns the start of the last successful run."""
+        if not self.last_run:
+            return None
+        return datetime.fromisoformat(self.last_run)
+
+
+class Watermarks:
+    """Per-query high-water marks persisted as a JSON file.
+
+    A mark records when the last successful scrape of a normalized query
+    started and the URLs it returned.
+    Later runs only request the hours elapsed since then plus `overlap_hours`,
+    and postings already returned by a previous run are dropped.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_WATERMARKS_PATH,
+        overlap_hours: int = 24,
+        max_urls: int = 1000,
+    ):
+        self.path = Path(path)
+        self.overlap_hours = overlap_hours
+        self.max_urls = max_urls
+        self._lock = threading.Lock()
+        self._marks: dict[str, Watermark] = {}
+        self._pending: dict[str, Watermark] = {}
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Fields of older files (e.g. "date_posted") are ignored.
+            names = {f.name for f in fields(Watermark)}
+            self._marks = {
+                k: Watermark(**{n: x for n, x in v.items() if n in names})
+                for k, v in data.items()
+            }
+
+    @staticmethod
+    def key(query: "Query") -> str:
+        """Hashes the query parameters, excluding the requested window."""
+        params = query.params()
+        params.pop("hours_old", None)
+        return ScrapeCache.key(params)
+
+    def get(self, query: "Query") -> Watermark | None:
+        with self._lock:
+            return self._marks.get(self.key(query))
+
+    def hours_old(self, query: "Query") -> int:
+        mark = self.get(query)
+        since = mark.since() if mark else None
+        return query.hours_old(since=since, overlap_hours=self.overlap_hours)
+
+    def advance(
+        self, query: "Query", frame: "pd.DataFrame", started: datetime
+    ) -> "pd.DataFrame":
+        """Drops already ingested rows and stages the mark at `started`.
+
+        The mark only moves on `commit`, once the rows were consumed.
+        """
+        key = self.key(query)
+        with self._lock:
+            mark = self._marks.get(key) or Watermark()
+
+            if "job_url" in frame.columns and len(frame):
+                seen = set(mark.job_urls)
+                urls = [na(str(v), default="") for v in frame["job_url"].tolist()]
+                keep = [url not in seen for url in urls]
+                frame = frame[keep]
+                urls = [url for url, k in zip(urls, keep) if k and url]
+            else:
+                urls = []
+
+            self._pending[key] = Watermark(
+                last_run=started.astimezone(timezone.utc).isoformat(),
+                job_urls=(mark.job_urls + urls)[-self.max_urls :],
+            )
+        return frame
+
+    def commit(self, query: "Query") -> None:
+        """Moves the mark staged by `advance` and saves it."""
+        key = self.key(query)
+        with self._lock:
+            mark = self._pending.pop(key, None)
+            if mark is not None:
+                self._marks[key] = mark
+                self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            data = {k: asdict(v) for k, v in self._marks.items()}
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        tmp.replace(self.path)
@@ -0,0 +1,21 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from .blob import BlobStore
+from .fingerprint import candidate_fingerprint, job_fingerprint
+from .jsonl import JsonlStore
+from .parquet import export_jobs, export_parsed, read_dataset
+from .sqlite import JobStore, row_key
+
+__all__ = [
+    "BlobStore",
+    "JobStore",
+    "JsonlStore",
+    "candidate_fingerprint",
+    "export_jobs",
+    "export_parsed",
+    "job_fingerprint",
+    "read_dataset",
+    "row_key",
+]
@@ -0,0 +1,108 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import pytest
+
+from job_search_pipeline.query import SyntheticJobs
+from job_search_pipeline.store import BlobStore, JsonlStore
+from job_search_pipeline.store.blob import BLOB_FIELDS, train_dictionary
+from job_search_pipeline.utils.format.value import content_hash
+
+
+@pytest.fixture
+def records() -> list[dict]:
+    jobs = SyntheticJobs(seed=4, description_length=2000)
+    return [jobs.record(i) for i in range(60)]
+
+
+def test_stores_texts_once_by_content_hash(tmp_path):
+    store = BlobStore(tmp_path)
+    key = store.put("Développeur Python senior")
+    assert key == content_hash("Développeur Python senior")
+    assert store.put("Développeur Python senior") == key
+    assert store.put("") != key
+    assert len(store) == 2 and key in store
+    assert store.get(key) == "Développeur Python senior"
+    with pytest.raises(KeyError):
+        store.get(content_hash("missing"))
+
+
+def test_trained_dictionary_shrinks_blobs(tmp_path, records):
+    texts = [r["description"] for r in records]
+    plain = BlobStore(tmp_path / "plain")
+    for text in texts[30:]:
+        plain.put(text)
+
+    store = BlobStore(tmp_path / "trained")
+    for text in texts[:30]:
+        store.put(text)
+    assert store.train(texts[:30]) == 1
+    size = store.compressed_size()
+    for text in texts[30:]:
+        store.put(text)
+    assert store.compressed_size() - size < plain.compressed_size() // 2
+
+    # Blobs keep the dictionary they were written with.
+    store.close()
+    store = BlobStore(tmp_path / "trained")
+    assert store.dictionary_id == 1
+    assert [store.get(content_hash(t)) for t in texts] == texts
+
+
+def test_train_dictionary_keeps_repeated_lines():
+    dictionary = train_dictionary(["shared line\nonly a\n", "shared line\nonly b\n"])
+    assert dictionary == b"shared line\n"
+    assert len(train_dictionary(["x" * 100 + "\n"] * 2, size=50)) == 0
+
+
+def test_reopens_and_recovers_from_interrupted_writes(tmp_path):
+    store = BlobStore(tmp_path)
+    keys = [store.put(f"description {i}") for i in range(5)]
+    store.close()
+    index = tmp_path / "blobs.idx"
+    index.write_bytes(index.read_bytes()[:-7])
+
+    store = BlobStore(tmp_path)
+    assert len(store) == 4 and keys[4] not in store
+    assert store.put("description 4") == keys[4]
+    assert [store.get(k) for k in keys] == [f"description {i}" for i in range(5)]
+
+
+def test_get_checks_the_key(tmp_path):
+    store = BlobStore(tmp_path)
+    key = store.put("Développeur Python senior, Québec")
+    store.close()
+    pack = tmp_path / "blobs.pack"
+    data = bytearray(pack.read_bytes())
+    data[len(data) // 2] ^= 0xFF
+    pack.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        BlobStore(tmp_path).get(key)
+
+
+def test_strip_and_restore_records(tmp_path, records):
+    store = BlobStore(tmp_path)
+    record = dict(records[0], company_description="Une entreprise.")
+    stripped = store.strip(record)
+    assert "description" not in stripped and "company_description" not in stripped
+    assert stripped["description_hash"] == content_hash(record["description"])
+    assert store.restore(stripped) == record
+    assert store.strip({"description": None}) == {"description": None}
+
+
+def test_jsonl_store_keeps_only_hashes(tmp_path, records):
+    blobs = BlobStore(tmp_path / "blobs")
+    store = JsonlStore(tmp_path / "jobs", blobs=blobs)
+    copies = [
+        dict(r, id=f"copy-{r['id']}", job_url=r["job_url"] + "x") for r in records
+    ]
+    assert store.append(records + copies) == 120
+    texts = {r[k] for r in records for k in BLOB_FIELDS if isinstance(r.get(k), str)}
+    assert len(blobs) == len(texts)
+
+    segment = store.segments()[0].read_text(encoding="utf-8")
+    assert records[0]["description"][:50] not in segment
+    assert [r["description"] for r in store][:60] == [r["description"] for r in records]
+    key = f"indeed:{records[3]['id']}"
+    assert store.get(key)["description"] == records[3]["description"]
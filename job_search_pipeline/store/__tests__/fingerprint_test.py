@@ -0,0 +1,88 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import pytest
+
+from job_search_pipeline.query import FakeScraper, JobTable
+from job_search_pipeline.store import JobStore, candidate_fingerprint, job_fingerprint
+from job_search_pipeline.store.fingerprint import changed, stamp
+
+BUNDLE = {
+    "resume.md": "# Jane Doe\nPython, Kubernetes",
+    "candidate.json": '{"name": "Jane Doe"}',
+    "llm/compatibility_score/prompt/system.md": "Score the job.",
+}
+
+
+@pytest.fixture
+def rows() -> list[dict]:
+    frame = FakeScraper(seed=5)(results_wanted=20)
+    return JobTable.from_frame(frame).parse(job_format="none").to_dict("records")
+
+
+def test_job_fingerprint_ignores_formatting():
+    row = {"title": "Développeur Python", "company": "Acme", "description": "A  b"}
+    same = dict(row, title=" développeur PYTHON ", description="a\nb", url="x")
+    assert job_fingerprint(row) == job_fingerprint(same)
+    assert job_fingerprint({"company": "N/A"}) == job_fingerprint({"company": None})
+    assert job_fingerprint(row) != job_fingerprint(dict(row, description="A b c"))
+    # Fields do not bleed into each other.
+    moved = dict(row, title="Développeur", company="Python Acme")
+    assert job_fingerprint(row) != job_fingerprint(moved)
+
+
+def test_candidate_fingerprint(tmp_path):
+    for name, content in BUNDLE.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    fingerprint = candidate_fingerprint(BUNDLE)
+    assert candidate_fingerprint(tmp_path) == fingerprint
+    assert candidate_fingerprint(str(tmp_path)) == fingerprint
+    edited = dict(BUNDLE, **{"resume.md": BUNDLE["resume.md"] + ", SQL"})
+    assert candidate_fingerprint(edited) != fingerprint
+    renamed = {k.replace("resume", "cv"): v for k, v in BUNDLE.items()}
+    assert candidate_fingerprint(renamed) != fingerprint
+
+    # Files the LLM stages do not read leave the fingerprint unchanged.
+    (tmp_path / "avatar.jpeg").write_bytes(b"\xff\xd8")
+    (tmp_path / "llm/compatibility_score/node").mkdir()
+    (tmp_path / "llm/compatibility_score/node/notes.md").write_text("x")
+    assert candidate_fingerprint(tmp_path) == fingerprint
+    assert candidate_fingerprint(dict(BUNDLE, **{"search.json": "{}"})) == fingerprint
+
+
+def test_changed_and_stamp():
+    candidate = candidate_fingerprint(BUNDLE)
+    row = {"title": "Dev", "company": "Acme", "description": "Python"}
+    assert changed(row, candidate)
+    scored = stamp(row, candidate)
+    assert not changed(scored, candidate)
+    assert changed(scored, candidate_fingerprint({}))
+    assert changed(dict(scored, description="Python, Go"), candidate)
+    assert not changed(row, candidate, stored=scored)
+
+
+def test_store_skips_unchanged_jobs(tmp_path, rows):
+    candidate = candidate_fingerprint(BUNDLE)
+    with JobStore(tmp_path / "jobs.sqlite") as store:
+        store.upsert(rows)
+        assert store.changed(rows, candidate) == rows
+        assert len(store.rescore(candidate)) == 20
+        assert len(store.rescore(candidate, limit=5)) == 5
+
+        # Scored results are stored with their fingerprints; rows without a
+        # score (failed scoring) are not.
+        results = [dict(row, score=10) for row in rows[:15]]
+        results += [dict(row, score=None) for row in rows[15:]]
+        assert store.upsert_scored(results, candidate) == 15
+        assert store.get(rows[0])["job_fingerprint"] == job_fingerprint(rows[0])
+        assert store.changed(rows, candidate) == rows[15:]
+        assert len(store.rescore(candidate)) == 5
+
+        # A re-scraped posting with a new description, and a new resume.
+        edited = dict(rows[0], description=rows[0]["description"] + " Go.")
+        assert store.changed([edited, rows[1]], candidate) == [edited]
+        store.upsert([edited])
+        assert len(store.rescore(candidate)) == 6
+        assert len(store.rescore(candidate_fingerprint({}))) == 20
@@ -0,0 +1,86 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from datetime import date
+
+import pytest
+
+from job_search_pipeline.query import SyntheticJobs
+from job_search_pipeline.store import JsonlStore
+
+
+@pytest.fixture
+def records() -> list[dict]:
+    jobs = SyntheticJobs(seed=4, description_length=500)
+    return [jobs.record(i) for i in range(30)]
+
+
+def test_appends_only_new_records(tmp_path, records):
+    store = JsonlStore(tmp_path)
+    assert store.append(records[:20]) == 20
+    assert store.append(records[10:]) == 10
+    assert len(store) == 30
+
+    stored = list(store)
+    assert [r["id"] for r in stored] == [r["id"] for r in records]
+    assert stored[0]["date_posted"] == records[0]["date_posted"].isoformat()
+
+
+def test_dedups_by_key_and_url(tmp_path, records):
+    store = JsonlStore(tmp_path)
+    store.append(records[:1])
+    record = records[0]
+    assert record in store
+    assert f"indeed:{record['id']}" in store
+    assert record["job_url"] + "?utm_source=x" in store
+
+    # Same posting under another id, and duplicates within one batch.
+    moved = dict(record, id="other", job_url=record["job_url"] + "/")
+    assert store.append([moved, records[1], records[1]]) == 1
+
+
+def test_reopens_from_the_index(tmp_path, records):
+    JsonlStore(tmp_path).append(records[:10])
+    store = JsonlStore(tmp_path)
+    assert len(store) == 10 and records[3] in store
+    assert store.get(f"indeed:{records[3]['id']}")["title"] == records[3]["title"]
+    assert store.get("indeed:missing") is None
+    assert store.append(records) == 20
+
+
+def test_rolls_segments(tmp_path, records):
+    store = JsonlStore(tmp_path, max_segment_bytes=4096)
+    store.append(records)
+    assert len(store.segments()) > 1
+    store = JsonlStore(tmp_path, max_segment_bytes=4096)
+    assert [r["id"] for r in store] == [r["id"] for r in records]
+    assert store.get(f"indeed:{records[-1]['id']}")["id"] == records[-1]["id"]
+
+
+def test_recovers_from_interrupted_writes(tmp_path, records):
+    store = JsonlStore(tmp_path)
+    store.append(records[:5])
+    segment = store.segments()[-1]
+
+    # A record written without its index entry, then a partial line.
+    store.append(records[5:6])
+    index = tmp_path / "index.jsonl"
+    lines = index.read_bytes().splitlines(keepends=True)
+    index.write_bytes(b"".join(lines[:-1]) + lines[-1][:10])
+    with segment.open("ab") as f:
+        f.write(b'{"id": "partial"')
+
+    store = JsonlStore(tmp_path)
+    assert len(store) == 6 and records[5] in store
+    assert store.append(records[6:8]) == 2
+    assert [r["id"] for r in store] == [r["id"] for r in records[:8]]
+    assert len(JsonlStore(tmp_path)) == 8
+
+
+def test_iter_frames(tmp_path, records):
+    store = JsonlStore(tmp_path)
+    store.append(records)
+    frames = list(store.iter_frames(chunksize=12))
+    assert [len(f) for f in frames] == [12, 12, 6]
+    assert frames[0]["date_posted"][0] == date.isoformat(records[0]["date_posted"])
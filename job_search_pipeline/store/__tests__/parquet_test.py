@@ -0,0 +1,72 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import pandas as pd
+import pytest
+
+from job_search_pipeline.query import JobTable, SyntheticJobs
+from job_search_pipeline.store import export_jobs, export_parsed, read_dataset
+from job_search_pipeline.store.parquet import jobs_frame, parsed_frame
+
+
+@pytest.fixture
+def table() -> JobTable:
+    jobs = SyntheticJobs(seed=6, description_length=300)
+    records = [jobs.record(i) for i in range(40)]
+    for i, record in enumerate(records):
+        record["site"] = ("indeed", "linkedin")[i % 2]
+    records[0]["date_posted"] = None
+    return JobTable.from_records(records)
+
+
+def test_jobs_frame_is_typed(table):
+    frame = jobs_frame(table, scrape_date="2026-10-01")
+    assert frame["min_amount"].dtype == "float64"
+    assert isinstance(frame["interval"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(frame["date_posted"])
+    assert pd.isna(frame["date_posted"][0])
+    assert set(frame["scrape_date"]) == {"2026-10-01"}
+
+
+def test_parsed_frame_is_typed(table):
+    frame = parsed_frame(table, scrape_date="2026-10-01")
+    expected = table.parse(job_format="slim")
+    assert frame["title"].tolist() == expected["title"].tolist()
+    assert frame["level"].astype(object).tolist() == expected["level"].tolist()
+    for name in ("level", "interval", "currency", "site"):
+        assert isinstance(frame[name].dtype, pd.CategoricalDtype)
+    assert frame["max_amount"].equals(table.frame["max_amount"])
+
+
+def test_read_dataset_rejects_unknown_datasets(tmp_path):
+    with pytest.raises(NotImplementedError):
+        read_dataset("scores", path=tmp_path)
+
+
+def test_exports_partitions(tmp_path, table):
+    pytest.importorskip("pyarrow")
+    export_jobs(table, path=tmp_path, scrape_date="2026-10-01")
+    export_parsed(table, path=tmp_path, scrape_date="2026-10-01")
+    export_parsed(table.filter(site="indeed"), path=tmp_path, scrape_date="2026-10-02")
+
+    partitions = sorted(
+        p.relative_to(tmp_path / "parsed").as_posix()
+        for p in (tmp_path / "parsed").glob("*/*")
+    )
+    assert partitions == [
+        "scrape_date=2026-10-01/site=indeed",
+        "scrape_date=2026-10-01/site=linkedin",
+        "scrape_date=2026-10-02/site=indeed",
+    ]
+
+    frame = read_dataset(
+        path=tmp_path,
+        columns=["level", "min_amount"],
+        filters=[("scrape_date", "==", "2026-10-02")],
+    )
+    assert list(frame.columns) == ["level", "min_amount"] and len(frame) == 20
+    assert frame["min_amount"].dtype == "float64"
+
+    jobs = read_dataset("jobs", path=tmp_path, columns=["id", "max_amount"])
+    assert sorted(jobs["id"]) == sorted(table.frame["id"])
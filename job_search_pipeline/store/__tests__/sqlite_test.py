@@ -0,0 +1,85 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from datetime import datetime, timezone
+
+import pytest
+
+from job_search_pipeline.query import FakeScraper, JobTable
+from job_search_pipeline.store import JobStore, row_key
+
+
+@pytest.fixture
+def rows() -> list[dict]:
+    frame = FakeScraper(seed=5)(results_wanted=40)
+    return JobTable.from_frame(frame).parse(job_format="none").to_dict("records")
+
+
+@pytest.fixture
+def store(tmp_path):
+    with JobStore(tmp_path / "jobs.sqlite") as store:
+        yield store
+
+
+def test_upsert_and_dedup(store, rows):
+    assert store.new(rows + rows[:5]) == rows
+    assert store.upsert(rows[:30], now="2026-10-01T00:00:00+00:00") == 30
+    assert len(store) == 30
+    assert store.new(rows) == rows[30:]
+    assert rows[0] in store and row_key(rows[0]) in store
+    assert store.get(rows[0]) == rows[0]
+
+    store.upsert(rows, now="2026-10-02T00:00:00+00:00")
+    assert len(store) == 40
+    assert [r["url"] for r in store.new_since("2026-10-02")] == [
+        r["url"] for r in rows[30:]
+    ]
+    since = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    assert len(store.new_since(since)) == 40
+    assert len(list(store.export(updated_since="2026-10-02"))) == 40
+
+
+def test_partial_updates_keep_other_fields(store, rows):
+    store.upsert(rows[:1], now="2026-10-01T00:00:00+00:00")
+    url = rows[0]["url"]
+    store.upsert([{"url": url, "level": "senior", "level_raw": "{}", "salary": None}])
+    assert store.get(rows[0]) == dict(rows[0], level="senior", level_raw="{}")
+    assert len(store.new_since("2026-10-01")) == 1
+    assert len(list(store.export(updated_since="2026-10-02"))) == 1
+
+
+def test_nan_values_are_missing(store, rows):
+    row = dict(rows[0], salary=float("nan"), score=float("nan"))
+    store.upsert([row])
+    store.upsert([row])
+    assert len(store) == 1
+    stored = store.get(row)
+    assert "salary" not in stored and "score" not in stored
+    assert store.unscored() == [stored]
+
+
+def test_row_key_ignores_the_job_repr():
+    row = {"company": "Acme", "job": "Job(title='Dev', company='Acme')"}
+    assert row_key(row) == row_key(dict(row, job="Job(company='Acme')"))
+
+
+def test_ranking_queries(store, rows):
+    store.upsert(rows[:10])
+    scores = [{"url": r["url"], "score": i * 10} for i, r in enumerate(rows[:6])]
+    store.upsert(scores)
+
+    assert [r["score"] for r in store.top(limit=3)] == [50, 40, 30]
+    assert [r["score"] for r in store.top(min_score=35)] == [50, 40]
+    company = rows[5]["company"]
+    assert all(r["company"] == company for r in store.top(company=company))
+    assert len(store.unscored()) == 4
+    assert len(store.unscored(limit=2)) == 2
+
+
+def test_reopens(tmp_path, rows):
+    with JobStore(tmp_path / "jobs.sqlite") as store:
+        store.upsert(rows)
+    with JobStore(tmp_path / "jobs.sqlite") as store:
+        assert len(store) == len(rows)
+        assert list(store.export()) == rows
@@ -0,0 +1,186 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import hashlib
+import mmap
+import struct
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+DEFAULT_BLOB_DIR = ".data/store/blobs"
+
+# Fields replaced by the hash of their text in stored records.
+BLOB_FIELDS = ("description", "company_description")
+
+# zlib only looks back 32 KiB, so a larger dictionary would not be used.
+MAX_DICTIONARY_SIZE = 32 * 1024
+
+_PACK = "blobs.pack"
+_INDEX = "blobs.idx"
+_DICTIONARY = "zdict-{:03d}.bin"
+
+# sha256 digest, pack offset, compressed length, dictionary id (0 = none).
+_ENTRY = struct.Struct("<32sQIH")
+_WBITS = -15  # Raw deflate: no header nor checksum, `get` checks the key.
+
+
+def train_dictionary(samples: Iterable[str], size: int = MAX_DICTIONARY_SIZE) -> bytes:
+    """Builds a zlib preset dictionary from sample texts.
+
+    Lines seen in several samples (boilerplate paragraphs, benefits, equal
+    opportunity statements, ...) are kept by decreasing saved bytes, the
+    most valuable last since zlib encodes nearer matches more cheaply.
+    """
+    counts: Counter[str] = Counter()
+    for text in samples:
+        counts.update({line for line in text.splitlines() if len(line) > 3})
+    ranked = sorted(
+        ((n * len(line.encode("utf-8")), line) for line, n in counts.items() if n > 1),
+        reverse=True,
+    )
+    chosen, total = [], 0
+    for _, line in ranked:
+        blob = (line + "\n").encode("utf-8")
+        if total + len(blob) > size:
+            continue
+        chosen.append(blob)
+        total += len(blob)
+    return b"".join(reversed(chosen))
+
+
+class BlobStore:
+    """Content-addressed store of compressed texts (e.g. job descriptions).
+
+    A text is stored once under the SHA-256 of its UTF-8 bytes (the same as
+    `content_hash`), deflated with the latest preset dictionary from `train`.
+    Blobs are appended to a single pack file which is memory-mapped for
+    lookups, so reading many blobs only pages in the ones used.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_BLOB_DIR):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._entries: dict[bytes, tuple[int, int, int]] = {}
+        self._dictionaries: dict[int, bytes] = {0: b""}
+        self._mmap: mmap.mmap | None = None
+        self._pack = (self.path / _PACK).open("ab+")
+
+        for file in sorted(self.path.glob("zdict-*.bin")):
+            self._dictionaries[int(file.stem.split("-")[1])] = file.read_bytes()
+        self.dictionary_id = max(self._dictionaries)
+
+        index = self.path / _INDEX
+        data = index.read_bytes() if index.exists() else b""
+        size = len(data) - len(data) % _ENTRY.size
+        if size != len(data):
+            # Drop the partial last entry of an interrupted write.
+            with index.open("r+b") as f:
+                f.truncate(size)
+        for digest, offset, length, dictionary in _ENTRY.iter_unpack(data[:size]):
+            self._entries[digest] = (offset, length, dictionary)
+        self._index = index.open("ab")
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._pack.close()
+        self._index.close()
+
+    def __enter__(self) -> "BlobStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return bytes.fromhex(key) in self._entries
+
+    def train(self, samples: Iterable[str], size: int = MAX_DICTIONARY_SIZE) -> int:
+        """Trains a new dictionary used by the next `put`s; returns its id.
+
+        Blobs keep the dictionary they were written with.
+        """
+        dictionary = train_dictionary(samples, size=size)
+        self.dictionary_id = max(self._dictionaries) + 1
+        file = self.path / _DICTIONARY.format(self.dictionary_id)
+        tmp = file.with_suffix(file.suffix + ".tmp")
+        tmp.write_bytes(dictionary)
+        tmp.replace(file)
+        self._dictionaries[self.dictionary_id] = dictionary
+        return self.dictionary_id
+
+    def put(self, text: str) -> str:
+        """Stores `text` (once) and returns its key."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).digest()
+        if digest not in self._entries:
+            zdict = self._dictionaries[self.dictionary_id]
+            compressor = zlib.compressobj(9, zlib.DEFLATED, _WBITS, 9, zdict=zdict)
+            blob = compressor.compress(data) + compressor.flush()
+            self._pack.seek(0, 2)
+            offset = self._pack.tell()
+            self._pack.write(blob)
+            self._pack.flush()
+            entry = (offset, len(blob), self.dictionary_id)
+            self._index.write(_ENTRY.pack(digest, *entry))
+            self._index.flush()
+            self._entries[digest] = entry
+        return digest.hex()
+
+    def get(self, key: str) -> str:
+        """Returns the text stored under `key`; raises KeyError if missing.
+
+        Raises ValueError if the blob does not match its key (corrupted pack).
+        """
+        digest = bytes.fromhex(key)
+        offset, length, dictionary = self._entries[digest]
+        view = self._view(offset + length)
+        decompressor = zlib.decompressobj(_WBITS, zdict=self._dictionaries[dictionary])
+        try:
+            data = decompressor.decompress(view[offset : offset + length])
+            data += decompressor.flush()
+        except zlib.error as e:
+            raise ValueError(f"Corrupted blob: {key}") from e
+        if hashlib.sha256(data).digest() != digest:
+            raise ValueError(f"Corrupted blob: {key}")
+        return data.decode("utf-8")
+
+    def _view(self, end: int) -> mmap.mmap:
+        """Returns a read-only map of the pack covering at least `end` bytes."""
+        if self._mmap is None or len(self._mmap) < end:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(self._pack.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def strip(
+        self, record: Mapping[str, Any], fields: Iterable[str] = BLOB_FIELDS
+    ) -> dict:
+        """Returns `record` with each text field replaced by "<field>_hash"."""
+        out = dict(record)
+        for name in fields:
+            value = out.get(name)
+            if isinstance(value, str):
+                out[f"{name}_hash"] = self.put(out.pop(name))
+        return out
+
+    def restore(
+        self, record: Mapping[str, Any], fields: Iterable[str] = BLOB_FIELDS
+    ) -> dict:
+        """Inverse of `strip`."""
+        out = dict(record)
+        for name in fields:
+            key = out.pop(f"{name}_hash", None)
+            if key is not None:
+                out[name] = self.get(key)
+        return out
+
+    def compressed_size(self) -> int:
+        return sum(length for _, length, _ in self._entries.values())
@@ -0,0 +1,35 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from job_search_pipeline.store import JobStore
+from job_search_pipeline.store.fingerprint import candidate_fingerprint, changed
+
+# ---- n8n Python node entrypoint ----
+# Keeps the jobs to send to the LLM stages: those never scored, or whose job
+# or candidate fingerprint changed since they were scored. Once scored, the
+# rows go through `store/scored/code.py` which records their fingerprints.
+
+_OPTIONS = ("candidate_path", "store_path")
+options = _items[0]["json"] if _items else {}
+
+# "candidate_path" of the extracted candidate bundle (resume.md,
+# candidate.json and llm/*/prompt/*)
+candidate_path = options.get("candidate_path")
+if _items and not candidate_path:
+    raise ValueError('Missing "candidate_path" option (extracted candidate bundle).')
+candidate = candidate_fingerprint(str(candidate_path)) if _items else ""
+
+# Optional "store_path" of a local SQLite JobStore holding the scored jobs;
+# otherwise the fingerprints are read from the rows ("Open Roles" columns)
+store_path = options.get("store_path")
+
+rows = [{k: v for k, v in it["json"].items() if k not in _OPTIONS} for it in _items]
+if store_path:
+    with JobStore(store_path) as store:
+        kept = store.changed(rows, candidate)
+else:
+    kept = [row for row in rows if changed(row, candidate)]
+out = [{"json": row} for row in kept]
+
+return out
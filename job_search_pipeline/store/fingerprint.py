@@ -0,0 +1,102 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import fnmatch
+import hashlib
+from pathlib import Path
+from typing import Any, Mapping
+
+from job_search_pipeline.utils.format.value import optional_float
+
+# Columns recording what a score was computed from, stored next to it.
+JOB_FINGERPRINT = "job_fingerprint"
+CANDIDATE_FINGERPRINT = "candidate_fingerprint"
+
+# Fields of a job whose change calls for scoring it again.
+JOB_FINGERPRINT_FIELDS = ("title", "company", "description")
+
+# Files of the candidate bundle read by the LLM stages (the avatar, letter
+# template, search terms, ... do not change a score).
+CANDIDATE_FILES = ("resume.md", "candidate.json", "llm/*/prompt/*")
+
+
+def _normalize(value: Any) -> str:
+    """Casefolds and collapses whitespace; missing values ("N/A") are empty."""
+    text = " ".join(str(value or "").casefold().split())
+    return "" if text == "n/a" else text
+
+
+def job_fingerprint(row: Mapping[str, Any]) -> str:
+    """Returns the fingerprint of the normalized title, company and description.
+
+    Whitespace, case and missing-value spellings do not change it, so a
+    re-scraped posting keeps its fingerprint unless its content changed.
+    """
+    h = hashlib.sha256()
+    for name in JOB_FINGERPRINT_FIELDS:
+        h.update(_normalize(row.get(name)).encode("utf-8") + b"\0")
+    return h.hexdigest()
+
+
+def _is_candidate_file(name: str) -> bool:
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in CANDIDATE_FILES)
+
+
+def candidate_fingerprint(bundle: str | Path | Mapping[str, str | bytes]) -> str:
+    """Returns the fingerprint of a candidate bundle.
+
+    `bundle` is the extracted bundle directory or a mapping of its file
+    names to contents; only the `CANDIDATE_FILES` are hashed.
+    """
+    if isinstance(bundle, (str, Path)):
+        root = Path(bundle)
+        files = {
+            file.relative_to(root).as_posix(): file
+            for file in root.rglob("*")
+            if file.is_file()
+        }
+        bundle = {
+            name: file.read_bytes()
+            for name, file in files.items()
+            if _is_candidate_file(name)
+        }
+    h = hashlib.sha256()
+    for name in sorted(n for n in bundle if _is_candidate_file(n)):
+        content = bundle[name]
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        h.update(name.encode("utf-8") + b"\0")
+        h.update(len(content).to_bytes(8, "little") + content)
+    return h.hexdigest()
+
+
+def changed(
+    row: Mapping[str, Any], candidate: str, stored: Mapping[str, Any] | None = None
+) -> bool:
+    """Whether `row` must be scored again for the `candidate` fingerprint.
+
+    The fingerprints are read from `stored` (e.g. the stored result of the
+    same job), or from `row` itself; rows never scored have none.
+    """
+    stored = row if stored is None else stored
+    if stored.get(CANDIDATE_FINGERPRINT) != candidate:
+        return True
+    return stored.get(JOB_FINGERPRINT) != job_fingerprint(row)
+
+
+def scored(row: Mapping[str, Any]) -> bool:
+    """Whether `row` has a score (e.g. from "compatibility_score-parse")."""
+    return optional_float(row.get("score")) is not None
+
+
+def stamp(row: Mapping[str, Any], candidate: str) -> dict:
+    """Returns `row` with the fingerprints to store next to its score.
+
+    Only stamp scored rows: a stamped row counts as scored for `candidate`.
+    """
+    return {
+        **row,
+        JOB_FINGERPRINT: job_fingerprint(row),
+        CANDIDATE_FINGERPRINT: candidate,
+    }
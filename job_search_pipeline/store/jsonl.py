@@ -0,0 +1,181 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+import pandas as pd
+
+from job_search_pipeline.query.dedup import canonical_url, job_key
+from job_search_pipeline.store.blob import BlobStore
+from job_search_pipeline.utils.format.value import json_default
+
+DEFAULT_STORE_DIR = ".data/store/jobs"
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+_INDEX = "index.jsonl"
+_SEGMENT = "jobs-{:05d}.jsonl"
+
+
+class JsonlStore:
+    """Append-only job history stored as JSON Lines segments.
+
+    Records are appended to the last segment (a new one is started past
+    `max_segment_bytes`) and an append-only index maps every canonical job
+    key and normalized job URL to the segment and byte offset of its record.
+    Appending costs O(new records); only the index is read when opening.
+
+    With `blobs`, descriptions are stored once in the `BlobStore` and the
+    records only keep their hash; `get` and iteration restore them.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_STORE_DIR,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        blobs: BlobStore | None = None,
+    ):
+        self.path = Path(path)
+        self.max_segment_bytes = max_segment_bytes
+        self.blobs = blobs
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._urls: set[str] = set()
+        self._segment = 0
+        self._load()
+
+    def _file(self, segment: int) -> Path:
+        return self.path / _SEGMENT.format(segment)
+
+    def segments(self) -> list[Path]:
+        return sorted(self.path.glob(_SEGMENT.replace("{:05d}", "*")))
+
+    def _remember(self, key: str, url: str, segment: int, offset: int) -> None:
+        self._offsets[key] = (segment, offset)
+        if url:
+            self._urls.add(url)
+
+    def _load(self) -> None:
+        index = self.path / _INDEX
+        ends: dict[int, int] = {}
+        if index.exists():
+            with index.open("r+b") as f:
+                data = f.read()
+                # Drop the partial last line of an interrupted write.
+                size = data.rfind(b"\n") + 1
+                if size != len(data):
+                    f.truncate(size)
+            for line in data[:size].splitlines():
+                key, url, segment, offset, end = json.loads(line)
+                self._remember(key, url, segment, offset)
+                ends[segment] = end
+
+        segments = self.segments()
+        if segments:
+            self._segment = int(segments[-1].stem.rsplit("-", 1)[1])
+            self._repair(ends.get(self._segment, 0))
+
+    def _repair(self, indexed_end: int) -> None:
+        """Drops a partial last line and indexes records written after the index."""
+        with self._file(self._segment).open("r+b") as f:
+            f.seek(indexed_end)
+            data = f.read()
+            size = data.rfind(b"\n") + 1
+            if size != len(data):
+                f.truncate(indexed_end + size)
+        entries = []
+        offset = indexed_end
+        for line in data[:size].splitlines(keepends=True):
+            record = json.loads(line)
+            entries.append((record, offset, offset + len(line)))
+            offset += len(line)
+        self._index(entries, self._segment)
+
+    def _index(self, entries: list[tuple[dict, int, int]], segment: int) -> None:
+        if not entries:
+            return
+        lines = []
+        for record, offset, end in entries:
+            key, url = job_key(record), canonical_url(record.get("job_url"))
+            self._remember(key, url, segment, offset)
+            lines.append(json.dumps([key, url, segment, offset, end]) + "\n")
+        with (self.path / _INDEX).open("a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, record: Mapping[str, Any] | str) -> bool:
+        """Whether a record (by key or URL), key or URL is already stored."""
+        if isinstance(record, str):
+            return record in self._offsets or canonical_url(record) in self._urls
+        url = canonical_url(record.get("job_url"))
+        return job_key(record) in self._offsets or (bool(url) and url in self._urls)
+
+    def append(self, records: Iterable[Mapping[str, Any]]) -> int:
+        """Appends the records that are not stored yet; returns how many."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        entries: list[tuple[dict, int, int]] = []
+        added = 0
+        f = self._file(self._segment).open("ab")
+        try:
+            for record in records:
+                if record in self:
+                    continue
+                stored = self.blobs.strip(record) if self.blobs is not None else record
+                text = json.dumps(stored, ensure_ascii=False, default=json_default)
+                data = (text + "\n").encode("utf-8")
+                offset = f.tell()
+                if offset and offset + len(data) > self.max_segment_bytes:
+                    f.close()
+                    self._index(entries, self._segment)
+                    entries = []
+                    self._segment += 1
+                    f = self._file(self._segment).open("ab")
+                    offset = 0
+                f.write(data)
+                entries.append((dict(record), offset, offset + len(data)))
+                # Index the key and URL now to skip duplicates of this batch.
+                self._remember(
+                    job_key(record),
+                    canonical_url(record.get("job_url")),
+                    self._segment,
+                    offset,
+                )
+                added += 1
+        finally:
+            f.close()
+        self._index(entries, self._segment)
+        return added
+
+    def get(self, key: str) -> dict | None:
+        """Returns the record stored under a canonical job key, if any."""
+        location = self._offsets.get(key)
+        if location is None:
+            return None
+        segment, offset = location
+        with self._file(segment).open("rb") as f:
+            f.seek(offset)
+            return self._restore(json.loads(f.readline()))
+
+    def _restore(self, record: dict) -> dict:
+        return self.blobs.restore(record) if self.blobs is not None else record
+
+    def __iter__(self) -> Iterator[dict]:
+        """Streams every record in insertion order."""
+        for file in self.segments():
+            with file.open("r", encoding="utf-8") as f:
+                for line in f:
+                    yield self._restore(json.loads(line))
+
+    def iter_frames(self, chunksize: int = 10000) -> Iterator[pd.DataFrame]:
+        """Streams the records as DataFrames of at most `chunksize` rows."""
+        chunk = []
+        for record in self:
+            chunk.append(record)
+            if len(chunk) >= chunksize:
+                yield pd.DataFrame.from_records(chunk)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame.from_records(chunk)
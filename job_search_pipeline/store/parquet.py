@@ -0,0 +1,126 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import importlib.util
+import uuid
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from job_search_pipeline.query.table import JobTable
+
+DEFAULT_PARQUET_DIR = ".data/store/parquet"
+
+# Hive-style partitions: <dataset>/scrape_date=YYYY-MM-DD/site=<site>/*.parquet
+PARTITION_COLUMNS = ("scrape_date", "site")
+
+# Low-cardinality columns of the parsed rows stored as categoricals.
+PARSED_CATEGORICAL_FIELDS = ("site", "level", "type", "interval", "currency")
+
+_DATASETS = ("jobs", "parsed")
+
+
+def _scrape_date(scrape_date: date | str | None) -> str:
+    if scrape_date is None:
+        scrape_date = datetime.now(timezone.utc).date()
+    return scrape_date if isinstance(scrape_date, str) else scrape_date.isoformat()
+
+
+def _dates(col: pd.Series) -> pd.Series:
+    """Parses a "YYYY-MM-DD" column; "N/A" and invalid dates become NaT."""
+    return pd.to_datetime(col.where(col != "N/A"), errors="coerce", format="ISO8601")
+
+
+def jobs_frame(table: JobTable, scrape_date: date | str | None = None) -> pd.DataFrame:
+    """Returns the typed scrape results of `table` as written by `export_jobs`.
+
+    Amounts are floats, the table `CATEGORICAL_FIELDS` categoricals and
+    `date_posted` a datetime; `scrape_date` defaults to today (UTC).
+    """
+    frame = table.frame.copy()
+    frame["date_posted"] = _dates(frame["date_posted"])
+    frame["scrape_date"] = _scrape_date(scrape_date)
+    return frame
+
+
+def parsed_frame(
+    table: JobTable,
+    scrape_date: date | str | None = None,
+    job_format: str = "slim",
+    salary_from_description: bool = False,
+) -> pd.DataFrame:
+    """Returns the typed `Job.parse` rows of `table` as written by `export_parsed`.
+
+    The formatted "salary" is kept next to the float amounts, interval and
+    currency of the scrape, so salaries can be aggregated without parsing.
+    """
+    frame = table.parse(
+        job_format=job_format, salary_from_description=salary_from_description
+    )
+    frame["date_posted"] = _dates(frame["date_posted"])
+    for name in ("min_amount", "max_amount", "interval", "currency"):
+        frame[name] = table.frame[name]
+    frame = frame.astype({name: "category" for name in PARSED_CATEGORICAL_FIELDS})
+    frame["scrape_date"] = _scrape_date(scrape_date)
+    return frame
+
+
+def _write(frame: pd.DataFrame, path: Path) -> Path:
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError("Parquet export requires pyarrow (the 'parquet' extra).")
+
+    # One file per export and partition; earlier exports are kept.
+    frame.to_parquet(
+        path,
+        engine="pyarrow",
+        index=False,
+        partition_cols=list(PARTITION_COLUMNS),
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+    )
+    return path
+
+
+def export_jobs(
+    table: JobTable,
+    path: str | Path = DEFAULT_PARQUET_DIR,
+    scrape_date: date | str | None = None,
+) -> Path:
+    """Appends the scrape results to the "jobs" dataset; returns its path."""
+    return _write(jobs_frame(table, scrape_date), Path(path) / "jobs")
+
+
+def export_parsed(
+    table: JobTable,
+    path: str | Path = DEFAULT_PARQUET_DIR,
+    scrape_date: date | str | None = None,
+    job_format: str = "slim",
+    salary_from_description: bool = False,
+) -> Path:
+    """Appends the `Job.parse` rows to the "parsed" dataset; returns its path."""
+    frame = parsed_frame(
+        table,
+        scrape_date=scrape_date,
+        job_format=job_format,
+        salary_from_description=salary_from_description,
+    )
+    return _write(frame, Path(path) / "parsed")
+
+
+def read_dataset(
+    dataset: str = "parsed",
+    path: str | Path = DEFAULT_PARQUET_DIR,
+    columns: list[str] | None = None,
+    filters: list[tuple] | None = None,
+) -> pd.DataFrame:
+    """Reads only `columns` of the partitions matching `filters`.
+
+    e.g. `read_dataset(columns=["level", "min_amount"],
+    filters=[("scrape_date", ">=", "2026-01-01"), ("site", "==", "indeed")])`
+    """
+    if dataset not in _DATASETS:
+        raise NotImplementedError(f"Only {_DATASETS} datasets are supported.")
+    return pd.read_parquet(
+        Path(path) / dataset, engine="pyarrow", columns=columns, filters=filters
+    )
@@ -0,0 +1,34 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from job_search_pipeline.store import JobStore
+from job_search_pipeline.store.fingerprint import candidate_fingerprint, scored, stamp
+
+# ---- n8n Python node entrypoint ----
+# Runs after "compatibility_score-parse": records the job and candidate
+# fingerprints next to each score, so `store/changed/code.py` skips these
+# jobs until they change. Rows without a "score" (failed scoring) are passed
+# through unstamped and are scored again by the next run.
+
+_OPTIONS = ("candidate_path", "store_path")
+options = _items[0]["json"] if _items else {}
+
+# "candidate_path" of the extracted candidate bundle (resume.md,
+# candidate.json and llm/*/prompt/*)
+candidate_path = options.get("candidate_path")
+if _items and not candidate_path:
+    raise ValueError('Missing "candidate_path" option (extracted candidate bundle).')
+candidate = candidate_fingerprint(str(candidate_path)) if _items else ""
+
+# Optional "store_path" of a local SQLite JobStore where the scored rows are
+# upserted; the stamped rows are also returned for the "Open Roles" sheet
+store_path = options.get("store_path")
+
+rows = [{k: v for k, v in it["json"].items() if k not in _OPTIONS} for it in _items]
+if store_path:
+    with JobStore(store_path) as store:
+        store.upsert_scored(rows, candidate)
+out = [{"json": stamp(row, candidate) if scored(row) else row} for row in rows]
+
+return out
@@ -0,0 +1,276 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import json
+import math
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+from job_search_pipeline.query.dedup import job_key
+from job_search_pipeline.store import fingerprint
+from job_search_pipeline.utils.format.value import json_default, optional_float
+
+DEFAULT_DB_PATH = ".data/store/jobs.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    url TEXT,
+    company TEXT,
+    date_posted TEXT,
+    score REAL,
+    date_created TEXT NOT NULL,
+    date_updated TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_url ON jobs (url);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS jobs_date_posted ON jobs (date_posted);
+CREATE INDEX IF NOT EXISTS jobs_score ON jobs (score);
+CREATE INDEX IF NOT EXISTS jobs_date_created ON jobs (date_created);
+CREATE INDEX IF NOT EXISTS jobs_date_updated ON jobs (date_updated);
+"""
+
+# Missing (NULL) columns of a partial update keep their stored value, and
+# the record is merged into the stored one.
+_UPSERT = """
+INSERT INTO jobs
+    (key, url, company, date_posted, score, date_created, date_updated, record)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    url = COALESCE(excluded.url, url),
+    company = COALESCE(excluded.company, company),
+    date_posted = COALESCE(excluded.date_posted, date_posted),
+    score = COALESCE(excluded.score, score),
+    date_updated = excluded.date_updated,
+    record = json_patch(record, excluded.record)
+"""
+
+
+def row_key(row: Mapping[str, Any]) -> str:
+    """Returns the key of a parsed (`Job.parse`) or scraped row.
+
+    Rows are matched on their normalized URL like the "Open Roles" sheet,
+    falling back to the title and company.
+    """
+    return job_key(
+        {
+            "job_url": row.get("url") or row.get("job_url"),
+            "title": row.get("title"),
+            "company": row.get("company"),
+        }
+    )
+
+
+def _missing(value: Any) -> bool:
+    """Whether `value` is None or a NaN/infinite float (pandas' missing value)."""
+    return value is None or (isinstance(value, float) and not math.isfinite(value))
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _since(since: datetime | str) -> str:
+    if isinstance(since, datetime):
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return since.astimezone(timezone.utc).isoformat(timespec="seconds")
+    return since
+
+
+class JobStore:
+    """Jobs and their scores in a local SQLite database.
+
+    Rows are keyed by `row_key` and indexed on company, `date_posted`, score
+    and creation/update dates, so dedup, "new since" and ranking queries
+    run locally; Google Sheets only receives `export`ed rows.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_DB_PATH):
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "JobStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __contains__(self, row: Mapping[str, Any] | str) -> bool:
+        """Whether a row, or a key from `row_key`, is stored."""
+        key = row if isinstance(row, str) else row_key(row)
+        query = "SELECT 1 FROM jobs WHERE key = ?"
+        return self._db.execute(query, (key,)).fetchone() is not None
+
+    def upsert(self, rows: Iterable[Mapping[str, Any]], now: str | None = None) -> int:
+        """Inserts new rows and merges the others in one transaction.
+
+        None and NaN values are treated as missing, so partial rows (e.g. only
+        "url" and "level") update those fields and keep the rest. Returns the
+        number of rows written.
+        """
+        now = now or _now()
+        params = []
+        for row in rows:
+            record = {k: v for k, v in row.items() if not _missing(v)}
+            params.append(
+                (
+                    row_key(row),
+                    record.get("url") or record.get("job_url"),
+                    record.get("company"),
+                    record.get("date_posted"),
+                    optional_float(record.get("score")),
+                    now,
+                    now,
+                    json.dumps(
+                        record,
+                        ensure_ascii=False,
+                        allow_nan=False,
+                        default=json_default,
+                    ),
+                )
+            )
+        with self._db:
+            self._db.executemany(_UPSERT, params)
+        return len(params)
+
+    def upsert_scored(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        candidate: str,
+        now: str | None = None,
+    ) -> int:
+        """Stores the scored rows with their fingerprints (see `changed`).
+
+        Rows without a score are skipped, so a failed scoring run is retried
+        next time. Returns the number of rows written.
+        """
+        scored = [
+            fingerprint.stamp(r, candidate) for r in rows if fingerprint.scored(r)
+        ]
+        return self.upsert(scored, now=now)
+
+    def new(self, rows: Iterable[Mapping[str, Any]]) -> list[Mapping[str, Any]]:
+        """Returns the rows that are not stored yet (deduplicated)."""
+        by_key = {row_key(row): row for row in rows}
+        keys = list(by_key)
+        stored: set[str] = set()
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            query = f"SELECT key FROM jobs WHERE key IN ({','.join('?' * len(chunk))})"
+            stored.update(k for (k,) in self._db.execute(query, chunk))
+        return [row for key, row in by_key.items() if key not in stored]
+
+    def changed(
+        self, rows: Iterable[Mapping[str, Any]], candidate: str
+    ) -> list[Mapping[str, Any]]:
+        """Returns the rows to score (again) for the `candidate` fingerprint.
+
+        A row is kept (deduplicated) unless its stored result was scored for
+        the same job and candidate fingerprints (see `upsert_scored`).
+        """
+        by_key = {row_key(row): row for row in rows}
+        keys = list(by_key)
+        stored: dict[str, dict] = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            query = (
+                "SELECT key, record FROM jobs "
+                f"WHERE key IN ({','.join('?' * len(chunk))})"
+            )
+            for r in self._db.execute(query, chunk):
+                stored[r["key"]] = json.loads(r["record"])
+        return [
+            row
+            for key, row in by_key.items()
+            if fingerprint.changed(row, candidate, stored.get(key, {}))
+        ]
+
+    def rescore(self, candidate: str, limit: int | None = None) -> list[dict]:
+        """Returns the stored rows whose job or candidate fingerprint changed
+        since they were scored (or never scored), most recently posted first.
+        """
+        query = "SELECT record FROM jobs ORDER BY date_posted DESC, rowid"
+        out = []
+        for r in self._db.execute(query):
+            record = json.loads(r["record"])
+            if fingerprint.changed(record, candidate):
+                out.append(record)
+                if limit is not None and len(out) >= limit:
+                    break
+        return out
+
+    def _records(self, query: str, params: tuple = ()) -> list[dict]:
+        return [json.loads(r["record"]) for r in self._db.execute(query, params)]
+
+    def get(self, row: Mapping[str, Any] | str) -> dict | None:
+        key = row if isinstance(row, str) else row_key(row)
+        records = self._records("SELECT record FROM jobs WHERE key = ?", (key,))
+        return records[0] if records else None
+
+    def new_since(self, since: datetime | str) -> list[dict]:
+        """Returns the rows first stored at or after `since` (oldest first)."""
+        query = (
+            "SELECT record FROM jobs WHERE date_created >= ? "
+            "ORDER BY date_created, rowid"
+        )
+        return self._records(query, (_since(since),))
+
+    def unscored(self, limit: int | None = None) -> list[dict]:
+        """Returns the rows without a score, most recently posted first."""
+        query = (
+            "SELECT record FROM jobs WHERE score IS NULL "
+            "ORDER BY date_posted DESC, rowid LIMIT ?"
+        )
+        return self._records(query, (-1 if limit is None else limit,))
+
+    def top(
+        self,
+        limit: int = 50,
+        min_score: float | None = None,
+        company: str | None = None,
+        posted_since: str | None = None,
+    ) -> list[dict]:
+        """Returns the best scored rows, optionally filtered."""
+        where = ["score IS NOT NULL"]
+        params: list[Any] = []
+        if min_score is not None:
+            where.append("score >= ?")
+            params.append(min_score)
+        if company is not None:
+            where.append("company = ?")
+            params.append(company)
+        if posted_since is not None:
+            where.append("date_posted >= ?")
+            params.append(posted_since)
+        query = (
+            f"SELECT record FROM jobs WHERE {' AND '.join(where)} "
+            "ORDER BY score DESC, date_posted DESC LIMIT ?"
+        )
+        return self._records(query, (*params, limit))
+
+    def export(self, updated_since: datetime | str | None = None) -> Iterator[dict]:
+        """Streams the rows (updated at or after `updated_since`) to sync out."""
+        query = "SELECT record FROM jobs"
+        params: tuple[str, ...] = ()
+        if updated_since is not None:
+            query += " WHERE date_updated >= ?"
+            params = (_since(updated_since),)
+        for r in self._db.execute(query + " ORDER BY rowid", params):
+            yield json.loads(r["record"])
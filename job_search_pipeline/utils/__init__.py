@@ -2,7 +2,9 @@
 #                       Copyright 2026, Sébastien Kéroack
 # ==============================================================================
 
+from . import cache
 from . import format
+from . import metrics
 from . import parse
 
-__all__ = ["format", "parse"]
+__all__ = ["cache", "format", "metrics", "parse"]
@@ -0,0 +1,87 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import pytest
+
+from job_search_pipeline.utils import cache as cache_module
+from job_search_pipeline.utils import format as fmt
+from job_search_pipeline.utils.cache import LRUCache, memoize
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    caches = {}
+    monkeypatch.setattr(cache_module, "CACHES", caches)
+    return caches
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert [k for k, _ in cache.items()] == ["a", "c"]
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+
+def test_memoize_caches_by_arguments(registry):
+    calls = []
+
+    @memoize("test.upper", maxsize=8)
+    def upper(value, suffix=""):
+        calls.append(value)
+        return value.upper() + suffix
+
+    assert upper("a") == upper("a") == "A"
+    assert upper("a", suffix="!") == "A!"
+    assert calls == ["a", "a"]
+    assert cache_module.stats()["test.upper"]["hits"] == 1
+    assert registry["test.upper"] is upper.cache
+
+
+def test_memoize_rejects_duplicate_names(registry):
+    memoize("test.dup")(str)
+    with pytest.raises(ValueError):
+        memoize("test.dup")(str)
+
+
+def test_save_and_load_roundtrip(registry, tmp_path):
+    @memoize("test.pair", key=lambda a, b: (a, (b,)))
+    def pair(a, b):
+        return f"{a}-{b}"
+
+    pair("x", 1)
+    path = tmp_path / "memo.json"
+    cache_module.save(path)
+    pair.cache.clear()
+
+    cache_module.load(path)
+    assert pair.cache.items() == [(("x", (1,)), "x-1")]
+    assert pair("x", 1) == "x-1"
+    assert pair.cache.hits == 1
+
+
+def test_load_missing_file_is_noop(registry, tmp_path):
+    cache_module.load(tmp_path / "missing.json")
+
+
+def test_format_transforms_are_memoized():
+    fmt.company_name.transform.cache.clear()
+    assert fmt.company_name.transform("ACME / Initech") == "ACME"
+    assert fmt.company_name.transform("ACME / Initech") == "ACME"
+    assert fmt.company_name.transform.cache.hits == 1
+    assert {
+        "format.company_name",
+        "format.job_level",
+        "format.job_title",
+        "format.salary",
+    } <= set(cache_module.CACHES)
@@ -0,0 +1,80 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import json
+
+import pytest
+
+from job_search_pipeline.query import FakeScraper, Query
+from job_search_pipeline.utils import metrics
+
+
+@pytest.fixture
+def enabled():
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def test_disabled_records_nothing():
+    metrics.reset()
+    metrics.count("x")
+    with metrics.timer("y"):
+        pass
+    metrics.timed("z")(lambda: None)()
+    assert metrics.summary() == {"counters": {}, "timers": {}}
+
+
+def test_histogram_buckets_are_cumulative():
+    h = metrics.Histogram(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.7, 3.0):
+        h.observe(seconds)
+    assert h.cumulative() == [("0.1", 1), ("1.0", 3), ("+Inf", 4)]
+    assert h.count == 4 and h.sum == pytest.approx(4.25)
+
+
+def test_timed_records_calls(enabled):
+    fn = metrics.timed("test.fn")(lambda x: x * 2)
+    assert fn(2) == 4 and fn(3) == 6
+    metrics.count("test.items", 5)
+    summary = metrics.summary()
+    assert summary["counters"] == {"test.items": 5}
+    assert summary["timers"]["test.fn"]["count"] == 2
+    assert summary["timers"]["test.fn"]["buckets"]["+Inf"] == 2
+
+
+def test_query_run_and_parse_stages(enabled):
+    q = Query(query="indeed: python", location="québec, qc, canada", results_wanted=5)
+    for job in q.run(scraper=FakeScraper()):
+        job.parse(salary_from_description=True)
+    summary = metrics.summary()
+    assert summary["counters"]["query.scrapes"] == 1
+    assert summary["counters"]["job.rows"] == 5
+    assert {
+        "query.scrape",
+        "job.convert",
+        "job.parse",
+        "format.company_name",
+        "format.job_level",
+        "format.job_title",
+        "format.salary",
+    } <= set(summary["timers"])
+    assert summary["timers"]["job.parse"]["count"] == 5
+
+
+def test_save_json_and_prometheus(enabled, tmp_path):
+    metrics.count("query.scrapes")
+    metrics.observe("query.scrape", 0.2)
+
+    metrics.save(tmp_path / "metrics.json")
+    data = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    assert data["counters"] == {"query.scrapes": 1}
+
+    metrics.save(tmp_path / "metrics.prom")
+    text = (tmp_path / "metrics.prom").read_text(encoding="utf-8")
+    assert "job_search_pipeline_query_scrapes_total 1" in text
+    assert 'job_search_pipeline_query_scrape_seconds_bucket{le="0.5"} 1' in text
+    assert "job_search_pipeline_query_scrape_seconds_count 1" in text
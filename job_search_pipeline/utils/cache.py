@@ -0,0 +1,149 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import functools
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable
+
+DEFAULT_MEMO_PATH = ".data/utils/memo.json"
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe mapping bounded to `maxsize` least recently used entries."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def update(self, items: Iterable[tuple[Hashable, Any]]) -> None:
+        for key, value in items:
+            self.put(key, value)
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """Returns the entries from least to most recently used."""
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+# Named caches, reported by `stats` and persisted by `save`/`load`.
+CACHES: dict[str, LRUCache] = {}
+
+
+def register(name: str, cache: LRUCache) -> LRUCache:
+    if name in CACHES:
+        raise ValueError(f"Cache already registered: {name}")
+    CACHES[name] = cache
+    return cache
+
+
+def memoize(
+    name: str, maxsize: int = 4096, key: Callable[..., Hashable] | None = None
+) -> Callable:
+    """Caches the results of a pure function in a named `LRUCache`.
+
+    `key` builds the cache key from the call arguments (by default the
+    positional arguments followed by the sorted keyword arguments). Keys and
+    results must be JSON serializable for the cache to be persisted.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        cache = register(name, LRUCache(maxsize))
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs) if key else (*args, *sorted(kwargs.items()))
+            value = cache.get(k, _MISSING)
+            if value is _MISSING:
+                value = fn(*args, **kwargs)
+                cache.put(k, value)
+            return value
+
+        # Exposed for inspection and tests (e.g. `fn.cache.clear()`).
+        setattr(wrapper, "cache", cache)
+        return wrapper
+
+    return decorator
+
+
+def stats() -> dict[str, dict]:
+    return {name: cache.stats() for name, cache in CACHES.items()}
+
+
+def clear() -> None:
+    for cache in CACHES.values():
+        cache.clear()
+
+
+def _freeze(v: Any) -> Hashable:
+    """Turns the JSON lists of a loaded key back into tuples."""
+    if isinstance(v, list):
+        return tuple(_freeze(x) for x in v)
+    return v
+
+
+def save(path: str | Path = DEFAULT_MEMO_PATH) -> None:
+    """Writes every registered cache to a JSON file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {name: cache.items() for name, cache in CACHES.items()}
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    tmp.replace(path)
+
+
+def load(path: str | Path = DEFAULT_MEMO_PATH) -> None:
+    """Fills the registered caches from a file written by `save`, if any."""
+    path = Path(path)
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8") as f:
+        data = json.load(f)
+    for name, items in data.items():
+        if name in CACHES:
+            CACHES[name].update((_freeze(k), v) for k, v in items)
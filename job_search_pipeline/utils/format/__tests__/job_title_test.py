@@ -4,7 +4,7 @@
 
 import pytest
 
-from job_search_pipeline.utils.format.job_title import transform
+from job_search_pipeline.utils.format.job_title import TitleNormalizer, transform
 
 
 @pytest.mark.parametrize(
@@ -114,3 +114,32 @@ def test_empty_returns_na():
 def test_invalid_gender_raises():
     with pytest.raises(NotImplementedError):
         transform("Développeur(euse)", gender="other")
+
+
+def test_normalizer_counts_cache_hits():
+    normalizer = TitleNormalizer()
+    assert normalizer.transform("Développeur(euse) Python") == "Développeur Python"
+    assert normalizer.transform("Développeur(euse) Python") == "Développeur Python"
+    assert normalizer.transform("Développeur(euse) Python", "woman") == (
+        "Développeuse Python"
+    )
+    assert (normalizer.hits, normalizer.misses) == (1, 2)
+
+
+def test_normalizer_normalizes_gender_before_caching():
+    normalizer = TitleNormalizer()
+    assert normalizer.transform("Développeur(euse)", " Man ") == "Développeur"
+    assert normalizer.transform("Développeur(euse)", "man") == "Développeur"
+    assert normalizer.hits == 1
+
+
+def test_normalizer_evicts_least_recently_used():
+    normalizer = TitleNormalizer(maxsize=2)
+    normalizer.transform("A")
+    normalizer.transform("B")
+    normalizer.transform("A")
+    normalizer.transform("C")
+    normalizer.transform("A")
+    assert (normalizer.hits, normalizer.misses) == (2, 3)
+    normalizer.transform("B")
+    assert normalizer.misses == 4
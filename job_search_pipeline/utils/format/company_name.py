@@ -2,7 +2,12 @@
 #                       Copyright 2026, Sébastien Kéroack
 # ==============================================================================
 
+from job_search_pipeline.utils.cache import memoize
+from job_search_pipeline.utils.metrics import timed
 
+
+@timed("format.company_name")
+@memoize("format.company_name")
 def transform(value: str) -> str:
     # Basic normalization rules
     value = value.strip()
@@ -4,9 +4,18 @@
 
 
 from job_search_pipeline.utils import parse
+from job_search_pipeline.utils.cache import memoize
+from job_search_pipeline.utils.metrics import timed
 
 
-def transform(title: str, description: str) -> str:
+@timed("format.job_level")
+# Keyed by the description hash to keep long descriptions out of the cache;
+# the hash is cached on the `JobText` shared with the other parsers.
+@memoize(
+    "format.job_level",
+    key=lambda title, description: (title, parse.JobText.of(description).content_hash),
+)
+def transform(title: str, description: str | parse.JobText) -> str:
     level = parse.job_level.transform(title, True)
     if not level:
         level = parse.job_level.transform(description)
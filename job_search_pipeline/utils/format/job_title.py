@@ -4,6 +4,198 @@
 
 import re
 
+from job_search_pipeline.utils.cache import LRUCache, register
+from job_search_pipeline.utils.metrics import timed
+from job_search_pipeline.utils.parse.text import JobText
+
+_LETTERS = "A-Za-zÀ-ÖØ-öø-ÿ"
+
+# Handles both 'Développeuse.eur' and 'Développeur.euse' (with or without dot)
+_EUR_EUSE_PATTERN = re.compile(
+    rf"\b([{_LETTERS}]+)euse[.·]?eur\b|\b([{_LETTERS}]+)eur[.·]?euse\b",
+    re.IGNORECASE,
+)
+
+# Paired forms like "Développeuse/Développeur".
+_PAIR_PATTERN = re.compile(
+    rf"\b([{_LETTERS}]+)(eur|euse)\s*/\s*\1(eur|euse)\b",
+    re.IGNORECASE,
+)
+
+# "X ou Y" forms like "Développeuse ou Développeur".
+_OU_PATTERN = re.compile(
+    rf"\b([{_LETTERS}]+)(eur|euse)\s+ou\s+\1(eur|euse)\b",
+    re.IGNORECASE,
+)
+
+# Words like "Développeur(euse)" / "Développeur.euse" and "vendeur(se)".
+_EUSE_PATTERN = re.compile(
+    rf"\b([{_LETTERS}]+)eur(?:\((?:euse|se)\)|[.·](?:euse|se))(?![{_LETTERS}])",
+    re.IGNORECASE,
+)
+
+# Simple optional ".e" / "(e)" suffixes (e.g., "senior.e", "chargé(e)").
+_OPT_E_PATTERN = re.compile(rf"\b([{_LETTERS}]+)(?:\((?:e)\)|[.·]e)(?![{_LETTERS}])")
+
+_STAGE_PREFIX_PATTERN = re.compile(
+    r"\b(stage|stagiaire|co-?op|coop(?:ératif)?|intern(?:ship)?|été|hiver|automne|printemps|202\d)\b",
+    re.IGNORECASE,
+)
+_SPACED_SEP_PATTERN = re.compile(r"\s([/\\])\s")
+_DASH_SUFFIX_PATTERN = re.compile(r"\s[–-]\s(.+)$")
+_FR_MARKERS_PATTERN = re.compile(r"\b(d'|de|des|du|la|le|les|en)\b", re.IGNORECASE)
+_DIGIT_PATTERN = re.compile(r"\d")
+_CONTRACT_PATTERN = re.compile(
+    r"\b(mois|stage|co-?op|intern(?:ship)?|contrat|contract|cdd|cdi|freelance|temporaire)\b",
+    re.IGNORECASE,
+)
+_TECH_PUNCT_PATTERN = re.compile(r"[.\(\)]")
+_TECH_DOTTED_PATTERN = re.compile(r"[A-Za-z]{2,}\.[A-Za-z]{1,}")
+_TRAILING_ENCAPS_PATTERN = re.compile(r"(?:\s*[\(\[\{][^\)\]\}]*[\)\]\}]\s*)+$")
+
+_GENDERS = {"man": "eur", "woman": "euse"}
+
+
+def _gender(gender: str) -> str:
+    gender = (gender or "").strip().lower()
+    if gender not in _GENDERS:
+        raise NotImplementedError("Only 'man' and 'woman' genders are supported.")
+    return gender
+
+
+class TitleNormalizer:
+    """Job title formatter with precompiled patterns and a bounded LRU cache.
+
+    Results are cached by `(title, gender)`; `hits` and `misses` count the
+    cache lookups of `transform`.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.cache = LRUCache(maxsize)
+        # Replacement callbacks per gender, built once.
+        self._subs = {
+            gender: self._make_subs(suffix) for gender, suffix in _GENDERS.items()
+        }
+
+    @staticmethod
+    def _make_subs(suffix: str):
+        def repl_eur_euse(match: re.Match) -> str:
+            # Only one of group(1) or group(2) will be set
+            return f"{match.group(1) or match.group(2)}{suffix}"
+
+        def repl_pair(match: re.Match) -> str:
+            s1 = match.group(2).lower()
+            s2 = match.group(3).lower()
+            if {s1, s2} != {"eur", "euse"}:
+                return match.group(0)
+            return f"{match.group(1)}{suffix}"
+
+        def repl_euse(match: re.Match) -> str:
+            return f"{match.group(1)}{suffix}"
+
+        def repl_opt_e(match: re.Match) -> str:
+            # For "sénior.e", "junior.e", allow "séniore"/"juniore" for women.
+            root = match.group(1)
+            if suffix == "euse" and not root.lower().endswith("e"):
+                return f"{root}e"
+            return root
+
+        return repl_eur_euse, repl_pair, repl_euse, repl_opt_e
+
+    @property
+    def hits(self) -> int:
+        return self.cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self.cache.misses
+
+    def normalize_inclusive(self, value: str, gender: str = "man") -> str:
+        """See `normalize_inclusive_job_title`."""
+        repl_eur_euse, repl_pair, repl_euse, repl_opt_e = self._subs[_gender(gender)]
+        value = _EUR_EUSE_PATTERN.sub(repl_eur_euse, value)
+        value = _PAIR_PATTERN.sub(repl_pair, value)
+        value = _OU_PATTERN.sub(repl_pair, value)
+        value = _EUSE_PATTERN.sub(repl_euse, value)
+        return _OPT_E_PATTERN.sub(repl_opt_e, value)
+
+    def transform(self, value: str | JobText, gender: str = "man") -> str:
+        """See `transform`; results are cached by `(title, gender)`."""
+        key = (str(value or ""), _gender(gender))
+        title = self.cache.get(key)
+        if title is None:
+            title = self._transform(*key)
+            self.cache.put(key, title)
+        return title
+
+    def cache_clear(self) -> None:
+        self.cache.clear()
+
+    def _transform(self, value: str, gender: str) -> str:
+        base = value.strip()
+        title = self.normalize_inclusive(base, gender=gender)
+
+        # Some sources prefix the title with program/duration info, e.g.
+        # "Stage coopératif - Été 2026: Développeur...".
+        # If the left side looks like a stage/coop label, keep only the right side.
+        if ":" in title:
+            left, right = title.split(":", 1)
+            left = left.strip()
+            right = right.strip()
+            if _STAGE_PREFIX_PATTERN.search(left):
+                title = right or title
+
+        # Some sources provide bilingual titles such as:
+        # - "EN | FR" / "FR | EN"
+        # - "FR / EN" (with spaces)
+        # - "EN \\ FR" (with spaces)
+        # In these cases, keep the left-most title to avoid noisy duplicates.
+        if "|" in title:
+            left = title.split("|", 1)[0].strip()
+            title = left or title
+        else:
+            spaced_sep = _SPACED_SEP_PATTERN.search(title)
+            if spaced_sep:
+                sep = spaced_sep.group(1)
+                left = title.split(sep, 1)[0].strip()
+                title = left or title
+
+        # Remove trailing non-title suffixes after a dash, e.g.
+        # "... – 4 mois Stage/Co-op (Été 2026)".
+        dash_match = _DASH_SUFFIX_PATTERN.search(title)
+        if dash_match:
+            right = dash_match.group(1).strip()
+            left_part = title[: dash_match.start()].strip()
+
+            # 1) Bilingual titles like "FR - EN": keep left-most.
+            # Heuristic: left contains common French markers, right does not.
+            if left_part and right:
+                fr_markers = _FR_MARKERS_PATTERN.search(left_part)
+                fr_markers_right = _FR_MARKERS_PATTERN.search(right)
+                if (
+                    fr_markers
+                    and not fr_markers_right
+                    and not _DIGIT_PATTERN.search(right)
+                ):
+                    title = left_part
+                else:
+                    # 2) Trailing duration/contract info after dash.
+                    if _DIGIT_PATTERN.match(right) or _CONTRACT_PATTERN.search(right):
+                        title = left_part
+                    else:
+                        # If the right side contains technical details (e.g., 'Vue.js',
+                        # parentheses like '(Vue 3)', or dot-separated tokens), prefer
+                        # the left part which is likely the canonical French title.
+                        technical = _TECH_PUNCT_PATTERN.search(right)
+                        if technical or _TECH_DOTTED_PATTERN.search(right):
+                            title = left_part
+        title = _TRAILING_ENCAPS_PATTERN.sub("", title or "").strip()
+        return title or "N/A"
+
+
+NORMALIZER = TitleNormalizer()
+register("format.job_title", NORMALIZER.cache)
+
 
 def normalize_inclusive_job_title(value: str, gender: str = "man") -> str:
     """Normalize inclusive French job titles to a single gendered form.
@@ -20,151 +212,14 @@ def normalize_inclusive_job_title(value: str, gender: str = "man") -> str:
       - This function is intentionally conservative.
       - It does not truncate on separators like '/', '|', '\\'.
     """
-    # Handles both 'Développeuse.eur' and 'Développeur.euse' (with or without dot)
-    inclusive_eur_euse_pattern = re.compile(
-        r"\b([A-Za-zÀ-ÖØ-öø-ÿ]+)euse[.·]?eur\b|\b([A-Za-zÀ-ÖØ-öø-ÿ]+)eur[.·]?euse\b",
-        re.IGNORECASE,
-    )
-
-    def inclusive_eur_euse_dispatch(match: re.Match) -> str:
-        # Only one of group(1) or group(2) will be set
-        root = match.group(1) or match.group(2)
-        return f"{root}{'eur' if gender == 'man' else 'euse'}"
-
-    value = inclusive_eur_euse_pattern.sub(inclusive_eur_euse_dispatch, value)
-    gender = (gender or "").strip().lower()
-    if gender not in {"man", "woman"}:
-        raise NotImplementedError("Only 'man' and 'woman' genders are supported.")
+    return NORMALIZER.normalize_inclusive(value, gender=gender)
 
-    # 1) Handle paired forms like "Développeuse/Développeur".
-    pair_pattern = re.compile(
-        r"\b([A-Za-zÀ-ÖØ-öø-ÿ]+)(eur|euse)\s*/\s*\1(eur|euse)\b",
-        re.IGNORECASE,
-    )
-
-    # Also handle "X ou Y" forms like "Développeuse ou Développeur".
-    ou_pattern = re.compile(
-        r"\b([A-Za-zÀ-ÖØ-öø-ÿ]+)(eur|euse)\s+ou\s+\1(eur|euse)\b",
-        re.IGNORECASE,
-    )
-
-    def repl_pair(match: re.Match) -> str:
-        root = match.group(1)
-        s1 = match.group(2).lower()
-        s2 = match.group(3).lower()
-        if {s1, s2} != {"eur", "euse"}:
-            return match.group(0)
-        return f"{root}{'eur' if gender == 'man' else 'euse'}"
-
-    value = pair_pattern.sub(repl_pair, value)
-    value = ou_pattern.sub(repl_pair, value)
-
-    # 2) Handle words like "Développeur(euse)" / "Développeur.euse" and "vendeur(se)".
-    euse_pattern = re.compile(
-        r"\b([A-Za-zÀ-ÖØ-öø-ÿ]+)eur(?:\((?:euse|se)\)|[.·](?:euse|se))(?![A-Za-zÀ-ÖØ-öø-ÿ])",
-        re.IGNORECASE,
-    )
-
-    def repl_euse(match: re.Match) -> str:
-        root = match.group(1)
-        return f"{root}{'eur' if gender == 'man' else 'euse'}"
-
-    value = euse_pattern.sub(repl_euse, value)
-
-    # 3) Handle simple optional ".e" / "(e)" suffixes (e.g., "senior.e", "chargé(e)").
-    #    For "sénior.e", "junior.e", allow "séniore"/"juniore" for women.
-    opt_e_pattern = re.compile(
-        r"\b([A-Za-zÀ-ÖØ-öø-ÿ]+)(?:\((?:e)\)|[.·]e)(?![A-Za-zÀ-ÖØ-öø-ÿ])"
-    )
-
-    def repl_opt_e(match: re.Match) -> str:
-        root = match.group(1)
-        if root.lower() in {"senior", "sénior", "junior"}:
-            if gender == "woman" and not root.lower().endswith("e"):
-                return f"{root}e"
-            return root
-        if gender == "woman" and not root.lower().endswith("e"):
-            return f"{root}e"
-        return root
-
-    return opt_e_pattern.sub(repl_opt_e, value)
 
-
-_TRAILING_ENCAPS_PATTERN = re.compile(r"(?:\s*[\(\[\{][^\)\]\}]*[\)\]\}]\s*)+$")
-
-
-def transform(value: str, gender: str = "man") -> str:
+@timed("format.job_title")
+def transform(value: str | JobText, gender: str = "man") -> str:
     """Format a job title for downstream usage.
 
     - Normalizes inclusive forms via normalize_inclusive_job_title.
     - Removes trailing encapsulated segments like "(4 mois)", "[remote]", "{contract}".
     """
-
-    base = (value or "").strip()
-    title = normalize_inclusive_job_title(base, gender=gender)
-
-    # Some sources prefix the title with program/duration info, e.g.
-    # "Stage coopératif - Été 2026: Développeur...".
-    # If the left side looks like a stage/coop label, keep only the right side.
-    if ":" in title:
-        left, right = title.split(":", 1)
-        left = left.strip()
-        right = right.strip()
-        if re.search(
-            r"\b(stage|stagiaire|co-?op|coop(?:ératif)?|intern(?:ship)?|été|hiver|automne|printemps|202\d)\b",
-            left,
-            flags=re.IGNORECASE,
-        ):
-            title = right or title
-
-    # Some sources provide bilingual titles such as:
-    # - "EN | FR" / "FR | EN"
-    # - "FR / EN" (with spaces)
-    # - "EN \\ FR" (with spaces)
-    # In these cases, keep the left-most title to avoid noisy duplicates.
-    if "|" in title:
-        left = title.split("|", 1)[0].strip()
-        title = left or title
-    else:
-        spaced_sep = re.search(r"\s([/\\])\s", title)
-        if spaced_sep:
-            sep = spaced_sep.group(1)
-            left = title.split(sep, 1)[0].strip()
-            title = left or title
-
-    # Remove trailing non-title suffixes after a dash, e.g.
-    # "... – 4 mois Stage/Co-op (Été 2026)".
-    dash_match = re.search(r"\s[–-]\s(.+)$", title)
-    if dash_match:
-        right = dash_match.group(1).strip()
-        left_part = title[: dash_match.start()].strip()
-
-        # 1) Bilingual titles like "FR - EN": keep left-most.
-        # Heuristic: left contains common French markers, right does not.
-        if left_part and right:
-            fr_markers = re.search(
-                r"\b(d'|de|des|du|la|le|les|en)\b", left_part, flags=re.IGNORECASE
-            )
-            fr_markers_right = re.search(
-                r"\b(d'|de|des|du|la|le|les|en)\b", right, flags=re.IGNORECASE
-            )
-            if fr_markers and not fr_markers_right and not re.search(r"\d", right):
-                title = left_part
-            else:
-                # 2) Trailing duration/contract info after dash.
-                if re.match(r"\d", right) or re.search(
-                    r"\b(mois|stage|co-?op|intern(?:ship)?|contrat|contract|cdd|cdi|freelance|temporaire)\b",
-                    right,
-                    flags=re.IGNORECASE,
-                ):
-                    title = left_part
-                else:
-                    # If the right side contains technical details (e.g., 'Vue.js',
-                    # parentheses like '(Vue 3)', or dot-separated tokens), prefer
-                    # the left part which is likely the canonical French title.
-                    if re.search(r"[.\(\)]", right) or re.search(
-                        r"[A-Za-z]{2,}\.[A-Za-z]{1,}", right
-                    ):
-                        title = left_part
-    title = _TRAILING_ENCAPS_PATTERN.sub("", title or "").strip()
-    return title or "N/A"
+    return NORMALIZER.transform(value, gender=gender)
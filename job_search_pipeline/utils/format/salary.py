@@ -3,8 +3,12 @@
 # ==============================================================================
 
 from job_search_pipeline.utils import format as fmt
+from job_search_pipeline.utils.cache import memoize
+from job_search_pipeline.utils.metrics import timed
 
 
+@timed("format.salary")
+@memoize("format.salary")
 def transform(
     min_amount: float | None,
     max_amount: float | None,
@@ -2,7 +2,9 @@
 #                       Copyright 2026, Sébastien Kéroack
 # ==============================================================================
 
+import hashlib
 from dataclasses import fields
+from datetime import date, datetime
 from typing import Any
 
 
@@ -30,7 +32,32 @@ def optional_float(v: Any) -> float | None:
         return None
 
 
-def repr_dataclass_short(cls: Any) -> str:
+def repr_dataclass_short(cls: Any, **overrides: Any) -> str:
     cls_name = cls.__class__.__name__  # <- no "<locals>"
-    body = ", ".join(f"{f.name}={getattr(cls, f.name)!r}" for f in fields(cls))
+    body = ", ".join(
+        f"{f.name}={overrides.get(f.name, getattr(cls, f.name))!r}" for f in fields(cls)
+    )
     return f"{cls_name}({body})"
+
+
+def content_hash(value: str) -> str:
+    """Returns the SHA-256 hex digest of a text value."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def json_default(v: Any) -> Any:
+    """`default=` hook for json.dump handling scraped (pandas/numpy) values."""
+    # datetime/date (and pandas Timestamp behaves similarly)
+    if isinstance(v, (datetime, date)):
+        return v.isoformat()
+
+    # numpy scalars often have .item()
+    item = getattr(v, "item", None)
+    if callable(item):
+        try:
+            return item()
+        except Exception:
+            pass
+
+    # fallback
+    return str(v)
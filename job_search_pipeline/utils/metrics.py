@@ -0,0 +1,183 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import bisect
+import functools
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Callable, Iterator
+
+# Upper bounds (seconds) of the latency histogram buckets.
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+PROMETHEUS_PREFIX = "job_search_pipeline"
+
+# Instrumentation is opt-in; when disabled, hooks return before timing.
+ENABLED = False
+
+_NOOP = nullcontext()
+_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9_]")
+_lock = threading.Lock()
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus style)."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Returns `(le, count)` pairs, ending with "+Inf"."""
+        out, total = [], 0
+        for bound, n in zip([*map(str, self.buckets), "+Inf"], self.counts):
+            total += n
+            out.append((bound, total))
+        return out
+
+
+_counters: dict[str, int] = {}
+_histograms: dict[str, Histogram] = {}
+
+
+def enable() -> None:
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    global ENABLED
+    ENABLED = False
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def count(name: str, n: int = 1) -> None:
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def observe(name: str, seconds: float) -> None:
+    if not ENABLED:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+
+@contextmanager
+def _timer(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start)
+
+
+def timer(name: str):
+    """Context manager recording the duration of its block under `name`."""
+    return _timer(name) if ENABLED else _NOOP
+
+
+def timed(name: str) -> Callable:
+    """Decorator recording the duration of every call under `name`."""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def summary() -> dict:
+    """Returns the counters and latency histograms as a JSON-able dict."""
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "timers": {
+                name: {
+                    "count": h.count,
+                    "sum": h.sum,
+                    "mean": h.sum / h.count if h.count else 0.0,
+                    "buckets": dict(h.cumulative()),
+                }
+                for name, h in _histograms.items()
+            },
+        }
+
+
+def _metric_name(name: str) -> str:
+    return f"{PROMETHEUS_PREFIX}_{_NAME_PATTERN.sub('_', name)}"
+
+
+def to_prometheus() -> str:
+    """Returns the metrics in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        for name, value in sorted(_counters.items()):
+            metric = _metric_name(name) + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, h in sorted(_histograms.items()):
+            metric = _metric_name(name) + "_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for le, n in h.cumulative():
+                lines.append(f'{metric}_bucket{{le="{le}"}} {n}')
+            lines += [f"{metric}_sum {h.sum}", f"{metric}_count {h.count}"]
+    return "\n".join(lines) + "\n"
+
+
+def save(path: str | Path) -> None:
+    """Writes the metrics as Prometheus text (".prom") or a JSON summary."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".prom":
+        text = to_prometheus()
+    else:
+        text = json.dumps(summary(), indent=2)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
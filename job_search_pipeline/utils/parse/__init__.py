@@ -4,5 +4,7 @@
 
 from .job_level import job_level
 from .salary import salary
+from . import text
+from .text import JobText
 
-__all__ = ["job_level", "salary"]
+__all__ = ["JobText", "job_level", "salary", "text"]
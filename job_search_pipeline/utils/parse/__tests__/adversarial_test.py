@@ -0,0 +1,67 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import time
+
+import pytest
+
+from job_search_pipeline.utils import format as fmt
+from job_search_pipeline.utils import parse
+
+# Length of the adversarial descriptions, and worst-case parse time allowed
+# per job (generous, to stay far from timing noise on slow runners).
+LENGTH = 200_000
+WORST_CASE_SECONDS = 1.0
+
+CASES = {
+    "digits": "1" * LENGTH + "$",
+    "digit_groups": "1" + " 000" * (LENGTH // 4) + "x$",
+    "spaced_digits": "1 " * (LENGTH // 2) + "$",
+    "nbsp_groups": "1 000 " * (LENGTH // 6) + "$ à",
+    "dot_runs": "1." * (LENGTH // 2) + "$",
+    "dollars": "$1 " * (LENGTH // 3),
+    "suffixed": "1$ " * (LENGTH // 3),
+    "ranges": "$1 - $2 " * (LENGTH // 8),
+    "phones": "418 555 1234, " * (LENGTH // 14) + "$",
+    "table": "| 12 345,67 $ | 1 000 $ | 99,99$ |\n" * (LENGTH // 36),
+    "keywords": "salaire prime par heure référence " * (LENGTH // 34) + "25$",
+    "long_word": "a" * LENGTH + "eur confirmé senior ",
+    "levels": "développeur iii développeur ii stage " * (LENGTH // 36),
+    "seniors": "sénior- " * (LENGTH // 8),
+}
+
+
+def _elapsed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_worst_case_time_per_job(name):
+    text = CASES[name]
+    elapsed = (
+        _elapsed(parse.salary.transform, text)
+        + _elapsed(parse.job_level.transform, text)
+        + _elapsed(parse.job_level.transform, text, True)
+        + _elapsed(fmt.job_level.transform, "N/A", text)
+    )
+    assert elapsed < WORST_CASE_SECONDS, f"{name}: {elapsed:.3f} s"
+
+
+def test_budgets_keep_results_on_regular_texts():
+    text = "Salaire : 85 000 $ à 110 000 $ par année. " + "x " * 20000 + "sénior dev"
+    assert parse.salary.transform(text) == ("yearly", 85000, 110000, "USD")
+    assert parse.job_level.transform(text) == "senior"
+
+    # Past the budgets, trailing amounts and keywords are ignored.
+    filler = "Prime : 1$. " * parse.salary.MAX_DOLLARS
+    assert parse.salary.transform(filler + "Salaire : 85 000$") == (
+        None,
+        None,
+        None,
+        None,
+    )
+    filler = "x" * parse.job_level.MAX_LENGTH
+    assert parse.job_level.transform(filler + " sénior dev") is None
@@ -0,0 +1,49 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+from job_search_pipeline.utils import parse
+from job_search_pipeline.utils.format import job_title
+from job_search_pipeline.utils.format.value import content_hash
+from job_search_pipeline.utils.parse import JobText
+
+
+def test_forms_are_computed_once():
+    text = JobText("Salaire : 85\u00a0000$ à 110 000$ — Développeur SÉNIOR")
+    assert text.normalized == "Salaire : 85 000$ à 110 000$ — Développeur SÉNIOR"
+    assert not text.computed("lower")
+    assert text.lower == text.normalized.lower()
+    assert text.computed("lower")
+    assert text.content_hash == content_hash(text.raw)
+    assert text.aligned
+    assert text.lower is text.lower
+    assert text.dollars == [16, 27]
+    assert text.find("salaire") == [0]
+    assert text.find(" 000$") == [12, 23]
+    assert str(text) == text.raw and len(text) == len(text.raw)
+
+
+def test_empty_and_unaligned_texts():
+    assert not JobText(None) and JobText(None).raw == ""
+    assert JobText.of("x").raw == "x"
+    text = JobText("x")
+    assert JobText.of(text) is text
+    assert not JobText("İ").aligned
+
+
+def test_parsers_accept_job_text():
+    raw = (
+        "Poste de développeur sénior pour ACME. Salaire: 85 000$ à 110 000$ par année. "
+        "Prime de référencement : 1000$."
+    )
+    text = JobText(raw)
+    assert parse.salary.transform(text) == parse.salary.transform(raw)
+    assert parse.salary.transform(text, max_length=40) == (None, None, None, None)
+    assert parse.job_level.transform(text) == parse.job_level.transform(raw)
+    assert parse.job_level.transform(text) == "senior"
+    title = JobText("Développeur(euse) Python")
+    assert job_title.transform(title) == "Développeur Python"
+
+
+def test_nbsp_separated_keywords_are_found():
+    assert parse.job_level.transform("Développeur sénior\u00a0Python") == "senior"
@@ -7,8 +7,8 @@ import pytest
 from pathlib import Path
 from typing import cast
 
-from job_search_pipeline.utils.parse.job_level import transform
-
+from job_search_pipeline.utils.parse.job_level import classify_many, transform
+from job_search_pipeline.utils.parse.job_level.job_level import _anchor
 
 INTERN_KEYWORDS = {
     # EN
@@ -221,3 +221,37 @@ def test_job_level_from_files(path: Path):
     stem = path.stem.split("-")[0]
     expected_level = None if stem.startswith("na") else stem.lower()
     assert transform(text) == expected_level
+
+
+@pytest.mark.parametrize(
+    "fragment,expected",
+    [
+        pytest.param("cto", "cto"),
+        pytest.param(r"s[eé]nior[- ]", "nior"),
+        pytest.param(r"\w+e[u]?r confirm[ée]", "r confirm"),
+        pytest.param(r"(?<![-\w])stage", "stage"),
+        pytest.param(r"co[- ]?op", "co"),
+        pytest.param(r"sr[.]?", "sr"),
+        pytest.param("colou?r", "colo"),
+        pytest.param("cto|vp", ""),
+    ],
+)
+def test_anchor_is_a_required_literal(fragment: str, expected: str):
+    assert _anchor(fragment) == expected
+
+
+def test_transform_matches_ignorecase_aliases():
+    # IGNORECASE matches the long s with "s", which lowercasing does not.
+    assert transform("ſenior developer") == "senior"
+
+
+def test_classify_many_matches_transform():
+    texts = [
+        "Senior Software Engineer",
+        "Stagiaire - Développeur junior",
+        "VP of Engineering, ex senior",
+        "Software Engineer",
+        "",
+    ]
+    assert classify_many(texts, all=True) == [transform(t, True) for t in texts]
+    assert classify_many(texts) == [transform(t) for t in texts]
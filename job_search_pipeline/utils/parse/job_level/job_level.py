@@ -4,6 +4,9 @@
 
 
 import re
+from typing import Iterable
+
+from job_search_pipeline.utils.parse.text import JobText
 
 # ordered patterns (priority: executive -> senior -> mid -> junior -> entry -> intern)
 _LEVEL_FRAGMENTS = {
@@ -94,24 +97,87 @@ _LEVEL_FRAGMENTS_FULL = {
 }
 
 
-def _compile_from_fragments(fragments_dict):
-    patterns = []
-    for label, frags in fragments_dict.items():
-        # join fragments with alternation, ensure grouping and word-boundary outside fragments
-        alt = "|".join(frags)
-        regex = rf"\b({alt})\b"
-        patterns.append((re.compile(regex, re.I), label))
-    return patterns
+# Input budget: only the first characters of a text are classified.
+MAX_LENGTH = 50000
+
+# Regex syntax that does not stand for a required literal character.
+_NON_LITERAL_PATTERN = re.compile(
+    r"\\.|\[[^\]]*\]|\((?:[^()]|\([^()]*\))*\)|.(?=[?*{])|\{[^}]*\}|[.^$?*+]"
+)
+
+# Lowercase characters that IGNORECASE matches against another letter.
+_CASE_ALIASES = str.maketrans({"ı": "i", "ſ": "s"})
+
+
+def _anchor(fragment: str) -> str:
+    """Returns the longest literal contained in every match of `fragment`."""
+    pieces = _NON_LITERAL_PATTERN.split(fragment)
+    if any("|" in piece for piece in pieces):
+        return ""
+    return max(pieces, key=len)
+
+
+class LevelClassifier:
+    """Finds the highest-priority level of a text in a single regex scan.
+
+    The fragments are combined once into a lookahead pattern with a group per
+    label (in priority order), and the best label found is returned. Each
+    fragment has a literal anchor (e.g. "nior" for `s[eé]nior[- ]`): texts
+    without any anchor cannot match and are not scanned, and the scan stops
+    at the best rank whose anchor is present. Only the first `max_length`
+    characters of a text are looked at.
+    """
+
+    def __init__(
+        self, fragments_dict: dict[str, list[str]], max_length: int = MAX_LENGTH
+    ):
+        self.max_length = max_length
+        self.labels = tuple(fragments_dict)
+        # (rank, anchor) pairs, in priority order.
+        self.anchors = tuple(
+            (rank, _anchor(frag))
+            for rank, frags in enumerate(fragments_dict.values())
+            for frag in frags
+        )
+        groups = ["(" + "|".join(frags) + ")" for frags in fragments_dict.values()]
+        # At each position the alternation yields the best label matching there;
+        # group i + 1 is the label of rank i.
+        self.pattern = re.compile(rf"\b(?=(?:{'|'.join(groups)})\b)", re.I)
+
+    def classify(self, text: str | JobText) -> str | None:
+        text = JobText.of(text).lower
+        if len(text) > self.max_length:
+            text = text[: self.max_length]
+        haystack = text
+        if "ı" in text or "ſ" in text:
+            haystack = text.translate(_CASE_ALIASES)
+        top = next((rank for rank, a in self.anchors if a in haystack), None)
+        if top is None:
+            return None
+
+        best = None
+        for m in self.pattern.finditer(text):
+            rank = (m.lastindex or 1) - 1
+            if best is None or rank < best:
+                best = rank
+                if best == top:
+                    break
+        return None if best is None else self.labels[best]
+
+    def classify_many(self, texts: Iterable[str | JobText]) -> list[str | None]:
+        return [self.classify(text) for text in texts]
+
+
+CLASSIFIER = LevelClassifier(_LEVEL_FRAGMENTS)
+CLASSIFIER_FULL = LevelClassifier(_LEVEL_FRAGMENTS_FULL)
 
 
-_LEVEL_PATTERNS = _compile_from_fragments(_LEVEL_FRAGMENTS)
-_LEVEL_PATTERNS_FULL = _compile_from_fragments(_LEVEL_FRAGMENTS_FULL)
+def transform(text: str | JobText, all: bool = False) -> str | None:
+    return (CLASSIFIER_FULL if all else CLASSIFIER).classify(text)
 
 
-def transform(text: str, all: bool = False) -> str | None:
-    text = (text or "").lower()
-    patterns = _LEVEL_PATTERNS_FULL if all else _LEVEL_PATTERNS
-    for pattern, label in patterns:
-        if pattern.search(text):
-            return label
-    return None
+def classify_many(
+    texts: Iterable[str | JobText], all: bool = False
+) -> list[str | None]:
+    """Batch version of `transform`."""
+    return (CLASSIFIER_FULL if all else CLASSIFIER).classify_many(texts)
@@ -94,3 +94,62 @@ def test_jobs_fixtures_roundtrip(path: Path):
     formatted = fmt.salary.transform(min_amount, max_amount, currency, interval)
     expected = path.stem
     assert _normalize_salary_string(formatted) == expected
+
+
+def test_extractor_is_reusable_with_custom_limits():
+    extractor = parse.salary.SalaryExtractor(lower_limit=10, hourly_threshold=20)
+    assert extractor.extract("$15 - $18") == ("hourly", 15, 18, "USD")
+    assert extractor.extract("$25 - $28") == ("monthly", 25, 28, "USD")
+    assert parse.salary.extract_salary("$15 - $18", lower_limit=10) == (
+        "hourly",
+        15,
+        18,
+        "USD",
+    )
+
+
+def test_extract_salary_in_long_description():
+    filler = "Nous offrons un environnement stimulant et flexible. " * 400
+    text = filler + "Salaire: 85 000$ à 110 000$ par année. " + filler
+    assert parse.salary.transform(text, currency="CAD") == (
+        "yearly",
+        85000,
+        110000,
+        "CAD",
+    )
+    assert parse.salary.transform(filler) == (None, None, None, None)
+
+
+def test_extract_salary_max_length_and_stop_score():
+    yearly = "Salaire: 85 000$ à 110 000$ par année."
+    text = yearly + " " * 80 + "Salaire: 20$ à 22$ de l'heure."
+    assert parse.salary.transform(text) == ("hourly", 20, 22, "USD")
+    assert parse.salary.transform(text, max_length=len(yearly)) == (
+        "yearly",
+        85000,
+        110000,
+        "USD",
+    )
+    assert parse.salary.transform(text, stop_score=3) == (
+        "yearly",
+        85000,
+        110000,
+        "USD",
+    )
+
+
+def test_extract_salary_column_matches_row_wise():
+    import pandas as pd
+
+    paths = sorted((Path(__file__).parent / "salary").glob("*.txt"))
+    texts = [p.read_text(encoding="utf-8") for p in paths]
+    texts += [texts[0], None, "", "$85k–110k", "pas de salaire"]
+    series = pd.Series(texts, index=range(10, 10 + len(texts)), dtype=object)
+
+    frame = parse.salary.extract_salary_column(series, currency="CAD")
+    assert list(frame.columns) == list(parse.salary.SALARY_COLUMNS)
+    assert list(frame.index) == list(series.index)
+    for i, text in series.items():
+        expected = parse.salary.transform(text, currency="CAD")
+        row = tuple(None if pd.isna(v) else v for v in frame.loc[i])
+        assert row == expected
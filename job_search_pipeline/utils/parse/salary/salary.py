@@ -5,6 +5,11 @@
 import re
 from enum import Enum
 
+import numpy as np
+import pandas as pd
+
+from job_search_pipeline.utils.parse.text import JobText
+
 
 class CompensationInterval(Enum):
     YEARLY = "yearly"
@@ -12,261 +17,325 @@ class CompensationInterval(Enum):
     HOURLY = "hourly"
 
 
-def transform(*args, **kwargs):
-    """Helper function to call extract_salary with the same signature."""
-    return extract_salary(*args, **kwargs)
-
-
-def extract_salary(
-    salary_str,
-    lower_limit=1000,
-    upper_limit=700000,
-    hourly_threshold=350,
-    monthly_threshold=30000,
-    enforce_annual_salary=False,
-    currency="USD",
-):
-    """
-    Extracts salary information from a string and returns the salary interval, min and max salary values, and currency.
-    (TODO: Needs test cases as the regex is complicated and may not cover all edge cases)
-    """
-    if not salary_str:
-        return None, None, None, None
-
-    # Accept: "$85,000 - $110,000", "$85k–110k", "85 000,00$ à 110 000,00$"
-    # Range separators: hyphen/dash variants, and common textual separators.
-    RANGE_SEP = r"(?:[-—–]|\bto\b|\bà\b|\ba\b|\bet\b|\band\b)"
-    NUMBER = r"(?:\d+(?:[,\s\u00A0]\d{3})*(?:[.,]\d+)?|\d+(?:[.,]\d+)?)"
+# Accept: "$85,000 - $110,000", "$85k–110k", "85 000,00$ à 110 000,00$"
+# Range separators: hyphen/dash variants, and common textual separators.
+_RANGE_SEP = r"(?:[-—–]|\bto\b|\bà\b|\ba\b|\bet\b|\band\b)"
+_NUMBER = r"(?:\d+(?:[,\s\u00A0]\d{3})*(?:[.,]\d+)?|\d+(?:[.,]\d+)?)"
 
-    patterns = [
-        # $ prefixed (original style, but more flexible number parsing)
+# (pattern, whether the match starts with the "$")
+_RANGE_PATTERNS = (
+    # $ prefixed (original style, but more flexible number parsing)
+    (
         re.compile(
-            rf"\$\s*({NUMBER})([kK]?)\s*{RANGE_SEP}\s*(?:\$)?\s*({NUMBER})([kK]?)",
+            rf"\$\s*({_NUMBER})([kK]?)\s*{_RANGE_SEP}\s*(?:\$)?\s*({_NUMBER})([kK]?)",
             re.IGNORECASE,
         ),
-        # $ suffixed (French/CA style)
+        True,
+    ),
+    # $ suffixed (French/CA style)
+    (
         re.compile(
-            rf"({NUMBER})([kK]?)\s*\$\s*{RANGE_SEP}\s*({NUMBER})([kK]?)\s*\$?",
+            rf"({_NUMBER})([kK]?)\s*\$\s*{_RANGE_SEP}\s*({_NUMBER})([kK]?)\s*\$?",
             re.IGNORECASE,
         ),
-    ]
-
-    def to_number(s: str) -> float:
-        # Normalize spaces (incl NBSP), then handle separators robustly.
-        s = s.replace("\u00a0", " ").strip()
-        s = re.sub(r"\s+", "", s)
-
-        # Heuristic: decide whether ',' / '.' is decimal or thousand separator.
-        def looks_like_thousands_sep(txt: str, sep: str) -> bool:
-            parts = txt.split(sep)
-            return (
-                len(parts) > 1
-                and all(p.isdigit() for p in parts)
-                and len(parts[-1]) == 3
-            )
-
-        if "," in s and "." not in s:
-            if looks_like_thousands_sep(s, ","):
-                s = s.replace(",", "")
-            else:
-                s = s.replace(",", ".")  # decimal comma
-        elif "." in s and "," not in s:
-            if looks_like_thousands_sep(s, "."):
-                s = s.replace(".", "")
-            # else '.' is decimal dot -> keep it
-        else:
-            # Both present: assume US-style thousands comma + decimal dot
+        False,
+    ),
+)
+
+_SINGLE_PATTERNS = (
+    # $ prefixed
+    (re.compile(rf"\$\s*({_NUMBER})([kK]?)", re.IGNORECASE), True),
+    # $ suffixed (French/CA style)
+    (re.compile(rf"({_NUMBER})([kK]?)\s*\$", re.IGNORECASE), False),
+)
+
+# Characters that may appear between the start of a "$" suffixed amount and
+# its "$": digits, separators, whitespace and the "k" suffix.
+_AMOUNT_CHARS = frozenset("0123456789,.kK\u00a0")
+
+# Input budget against pathological texts (tables, phone lists, ...): a "$"
+# suffixed amount starts at most `_MAX_AMOUNT_LENGTH` characters before its
+# "$", and only the first `MAX_DOLLARS` "$" of a text are looked at.
+_MAX_AMOUNT_LENGTH = 32
+MAX_DOLLARS = 256
+
+# Every pattern has a digit next to a "$" (up to whitespace and "k"); texts
+# without one are skipped by `extract_column`.
+_CANDIDATE_PATTERN = r"\$\s*\d|\d[kK]?\s*\$"
+
+SALARY_COLUMNS = ("interval", "min_amount", "max_amount", "currency")
+
+_WS_PATTERN = re.compile(r"\s+")
+
+# Context keywords looked up (lowercased) around every amount.
+_KEYWORDS = {
+    "remuneration": ("rémunération", "remuneration"),
+    "salary": ("salaire", "salary"),
+    "hourly": ("par heure", "heure", "hour", "/h", "/hr"),
+    "monthly": ("par mois", "mois", "month", "/mo", "/m"),
+    "yearly": ("par an", "année", "annuel", "year", "/an", "/yr"),
+    "bonus": ("prime", "bonus"),
+    # Amounts that are very commonly NOT base salary (benefits/bonuses/perks).
+    "nonsalary": (
+        "référencement",
+        "referencement",
+        "referral",
+        "reference",
+        "référence",
+        "remboursement",
+        "allocation",
+        "montant alloué",
+        "montant alloue",
+    ),
+}
+_KEYWORD_CATEGORY = {k: cat for cat, words in _KEYWORDS.items() for k in words}
+
+# Single pass over a context window reporting, at every position, the
+# shortest keyword starting there. Keywords sharing a start position are
+# prefixes of each other and belong to the same category, so the shortest
+# one is enough to tell whether any of them fits in a sub-window.
+_KEYWORD_PATTERN = re.compile(
+    "(?=({}))".format("|".join(map(re.escape, sorted(_KEYWORD_CATEGORY, key=len))))
+)
+
+_SALARY = frozenset({"remuneration", "salary"})
+_NONSALARY = frozenset({"nonsalary", "bonus"})
+
+# Context window sizes (characters) around an amount.
+_CONTEXT = 60
+_NEAR_CONTEXT = 25
+
+
+def _finditer(pattern: re.Pattern, prefixed: bool, text: str, dollars: list[int]):
+    """Same matches as `pattern.finditer(text)`, only tried next to a "$".
+
+    Every match contains a "$". Prefixed matches start on it, and suffixed
+    ones start in the run of amount characters right before their first
+    "$", so no other start position needs to be tried. Only the last
+    `_MAX_AMOUNT_LENGTH` characters of the run are tried.
+    """
+    last_end = 0
+    for d in dollars:
+        if d < last_end:
+            continue
+        if prefixed:
+            m = pattern.match(text, d)
+            if m:
+                last_end = m.end()
+                yield m
+            continue
+
+        r, floor = d, max(last_end, d - _MAX_AMOUNT_LENGTH)
+        while r > floor and (text[r - 1] in _AMOUNT_CHARS or text[r - 1].isspace()):
+            r -= 1
+        for p in range(r, d):
+            m = pattern.match(text, p)
+            if m:
+                last_end = m.end()
+                yield m
+                break
+
+
+def _categories(text: str) -> set[str]:
+    return {_KEYWORD_CATEGORY[m.group(1)] for m in _KEYWORD_PATTERN.finditer(text)}
+
+
+def _to_number(s: str) -> float:
+    # Normalize spaces (incl NBSP), then handle separators robustly.
+    s = _WS_PATTERN.sub("", s.replace("\u00a0", " ").strip())
+
+    # Heuristic: decide whether ',' / '.' is decimal or thousand separator.
+    def looks_like_thousands_sep(txt: str, sep: str) -> bool:
+        parts = txt.split(sep)
+        return (
+            len(parts) > 1 and all(p.isdigit() for p in parts) and len(parts[-1]) == 3
+        )
+
+    if "," in s and "." not in s:
+        if looks_like_thousands_sep(s, ","):
             s = s.replace(",", "")
+        else:
+            s = s.replace(",", ".")  # decimal comma
+    elif "." in s and "," not in s:
+        if looks_like_thousands_sep(s, "."):
+            s = s.replace(".", "")
+        # else '.' is decimal dot -> keep it
+    else:
+        # Both present: assume US-style thousands comma + decimal dot
+        s = s.replace(",", "")
 
-        return float(s)
+    return float(s)
 
-    def convert_hourly_to_annual(hourly_wage):
-        return hourly_wage * 2080
 
-    def convert_monthly_to_annual(monthly_wage):
-        return monthly_wage * 12
+class SalaryExtractor:
+    """Reusable salary parser.
+
+    All patterns are compiled once at import time, and the keyword context
+    around each amount is classified with a single pass over its window.
+    Only the first `max_dollars` "$" of a text are looked at.
+    """
+
+    def __init__(
+        self,
+        lower_limit=1000,
+        upper_limit=700000,
+        hourly_threshold=350,
+        monthly_threshold=30000,
+        max_dollars=MAX_DOLLARS,
+    ):
+        self.lower_limit = lower_limit
+        self.upper_limit = upper_limit
+        self.hourly_threshold = hourly_threshold
+        self.monthly_threshold = monthly_threshold
+        self.max_dollars = max_dollars
+
+    @staticmethod
+    def _context(text: JobText, start: int, end: int) -> tuple[set, set, set]:
+        """Returns keyword categories before, after and right before a match."""
+        lo = max(0, start - _CONTEXT)
+        near = max(0, start - _NEAR_CONTEXT)
+        hi = end + _CONTEXT
+        if text.computed("lower") and text.aligned:
+            # Scan the lowercase text shared with other parsers in place.
+            lower, offset = text.lower, 0
+        else:
+            # Lowercasing the whole text costs more than a few windows.
+            normalized = text.normalized
+            window = normalized[lo:hi]
+            lower, offset = window.lower(), lo
+            if len(lower) != len(window):
+                # Lowercasing changed the length; fall back to separate windows.
+                return (
+                    _categories(normalized[lo:start].lower()),
+                    _categories(normalized[end:hi].lower()),
+                    _categories(normalized[near:start].lower()),
+                )
 
-    def infer_interval_from_context(value: float, before: str, after: str) -> str:
-        after_l = after.lower()
-        if any(k in after_l for k in ["par heure", "heure", "hour", "/h", "/hr"]):
+        before, after, near_before = set(), set(), set()
+        for m in _KEYWORD_PATTERN.finditer(lower, lo - offset, hi - offset):
+            k = m.group(1)
+            s, e = m.start() + offset, m.start() + offset + len(k)
+            if e <= start:
+                before.add(_KEYWORD_CATEGORY[k])
+                if s >= near:
+                    near_before.add(_KEYWORD_CATEGORY[k])
+            elif s >= end:
+                after.add(_KEYWORD_CATEGORY[k])
+        return before, after, near_before
+
+    def _interval(self, value: float, after: set) -> str:
+        if "hourly" in after:
             return CompensationInterval.HOURLY.value
-        if any(k in after_l for k in ["par mois", "mois", "month", "/mo", "/m"]):
+        if "monthly" in after:
             return CompensationInterval.MONTHLY.value
-        if any(
-            k in after_l for k in ["par an", "année", "annuel", "year", "/an", "/yr"]
-        ):
+        if "yearly" in after:
             return CompensationInterval.YEARLY.value
 
         # Fall back to thresholds.
-        if value < hourly_threshold:
+        if value < self.hourly_threshold:
             return CompensationInterval.HOURLY.value
-        if value < monthly_threshold:
+        if value < self.monthly_threshold:
             return CompensationInterval.MONTHLY.value
         return CompensationInterval.YEARLY.value
 
-    # Try extracting salary ranges (may appear multiple times in long descriptions).
-    range_candidates = []
-    for pat in patterns:
-        for m in pat.finditer(salary_str):
-            min_salary = to_number(m.group(1))
-            max_salary = to_number(m.group(3))
-
-            # Handle 'k' suffix for min and max salaries independently
-            if "k" in (m.group(2) or "").lower():
-                min_salary *= 1000
-            if "k" in (m.group(4) or "").lower():
-                max_salary *= 1000
-
-            before = salary_str[max(0, m.start() - 60) : m.start()]
-            after = salary_str[m.end() : m.end() + 60]
-            before_l = before.lower()
-            after_l = after.lower()
-
-            # If the amount is immediately described as a bonus/premium, ignore it.
-            near_before = salary_str[max(0, m.start() - 25) : m.start()].lower()
-            if any(k in near_before for k in ["prime", "bonus"]):
-                continue
-
-            score = 0
-            if any(k in before_l for k in ["rémunération", "remuneration"]):
-                score += 3
-            if any(k in before_l for k in ["salaire", "salary"]):
-                score += 2
-            if any(k in after_l for k in ["par heure", "heure", "hour", "/h", "/hr"]):
-                score += 2
-            if any(k in after_l for k in ["par mois", "mois", "month", "/mo", "/m"]):
-                score += 1
-            if any(
-                k in after_l
-                for k in ["par an", "année", "annuel", "year", "/an", "/yr"]
-            ):
-                score += 1
-            if any(k in before_l for k in ["prime", "bonus"]):
-                score -= 2
-
-            # Exclude bonuses/premiums unless they are clearly tied to salary.
-            # Example false positives: "Prime de soir : 3$/heure", "Prime ... 5000$".
-            if any(k in before_l for k in ["prime", "bonus"]) and not any(
-                k in before_l
-                for k in ["rémunération", "remuneration", "salaire", "salary"]
-            ):
-                continue
-
-            interval = infer_interval_from_context(min_salary, before, after)
-
-            if interval == CompensationInterval.HOURLY.value:
-                annual_min_salary = convert_hourly_to_annual(min_salary)
-                annual_max_salary = (
-                    convert_hourly_to_annual(max_salary)
-                    if max_salary < hourly_threshold
-                    else None
-                )
-            elif interval == CompensationInterval.MONTHLY.value:
-                annual_min_salary = convert_monthly_to_annual(min_salary)
-                annual_max_salary = (
-                    convert_monthly_to_annual(max_salary)
-                    if max_salary < monthly_threshold
-                    else None
-                )
-            else:
-                annual_min_salary = min_salary
-                annual_max_salary = max_salary
-
-            if not annual_max_salary:
-                continue
-
-            if (
-                lower_limit <= annual_min_salary <= upper_limit
-                and lower_limit <= annual_max_salary <= upper_limit
-                and annual_min_salary < annual_max_salary
-            ):
-                range_candidates.append(
-                    (
-                        score,
-                        m.start(),
-                        interval,
-                        min_salary,
-                        max_salary,
-                        annual_min_salary,
-                        annual_max_salary,
-                    )
+    def _annual(self, value: float, interval: str) -> float:
+        if interval == CompensationInterval.HOURLY.value:
+            return value * 2080
+        if interval == CompensationInterval.MONTHLY.value:
+            return value * 12
+        return value
+
+    def _dollars(self, text: JobText) -> list[int]:
+        dollars = text.dollars
+        return (
+            dollars if len(dollars) <= self.max_dollars else dollars[: self.max_dollars]
+        )
+
+    def _ranges(self, text: JobText, stop_score: int | None = None) -> list[tuple]:
+        candidates = []
+        for pat, prefixed in _RANGE_PATTERNS:
+            for m in _finditer(pat, prefixed, text.raw, self._dollars(text)):
+                min_salary = _to_number(m.group(1))
+                max_salary = _to_number(m.group(3))
+
+                # Handle 'k' suffix for min and max salaries independently
+                if "k" in (m.group(2) or "").lower():
+                    min_salary *= 1000
+                if "k" in (m.group(4) or "").lower():
+                    max_salary *= 1000
+
+                before, after, near_before = self._context(text, m.start(), m.end())
+
+                # If the amount is immediately described as a bonus/premium, ignore it.
+                if "bonus" in near_before:
+                    continue
+
+                # Exclude bonuses/premiums unless they are clearly tied to salary.
+                # Example false positives: "Prime de soir : 3$/heure", "Prime ... 5000$".
+                if "bonus" in before and not before & _SALARY:
+                    continue
+
+                score = (
+                    3 * ("remuneration" in before)
+                    + 2 * ("salary" in before)
+                    + 2 * ("hourly" in after)
+                    + 1 * ("monthly" in after)
+                    + 1 * ("yearly" in after)
+                    - 2 * ("bonus" in before)
                 )
 
-    if not range_candidates:
-        # Try extracting a single salary value (common in job descriptions).
-        single_patterns = [
-            # $ prefixed
-            re.compile(rf"\$\s*({NUMBER})([kK]?)", re.IGNORECASE),
-            # $ suffixed (French/CA style)
-            re.compile(rf"({NUMBER})([kK]?)\s*\$", re.IGNORECASE),
-        ]
-
-        # Amounts that are very commonly NOT base salary (benefits/bonuses/perks).
-        # We only accept them if a salary keyword is present nearby.
-        nonsalary_context = [
-            "référencement",
-            "referencement",
-            "referral",
-            "reference",
-            "référence",
-            "reference",
-            "remboursement",
-            "allocation",
-            "montant alloué",
-            "montant alloue",
-            "prime",
-            "bonus",
-        ]
+                interval = self._interval(min_salary, after)
+                annual_min_salary = self._annual(min_salary, interval)
+                if interval == CompensationInterval.HOURLY.value:
+                    ok = max_salary < self.hourly_threshold
+                elif interval == CompensationInterval.MONTHLY.value:
+                    ok = max_salary < self.monthly_threshold
+                else:
+                    ok = True
+                annual_max_salary = self._annual(max_salary, interval) if ok else None
+
+                if not annual_max_salary:
+                    continue
+
+                if (
+                    self.lower_limit <= annual_min_salary <= self.upper_limit
+                    and self.lower_limit <= annual_max_salary <= self.upper_limit
+                    and annual_min_salary < annual_max_salary
+                ):
+                    candidates.append(
+                        (
+                            score,
+                            m.start(),
+                            interval,
+                            min_salary,
+                            max_salary,
+                            annual_min_salary,
+                            annual_max_salary,
+                        )
+                    )
+                    if stop_score is not None and score >= stop_score:
+                        return candidates
+        return candidates
 
+    def _singles(self, text: JobText, stop_score: int | None = None) -> list[tuple]:
         candidates = []
-        for pat in single_patterns:
-            for m in pat.finditer(salary_str):
-                raw = m.group(1)
-                suffix = (m.group(2) or "").lower()
-                value = to_number(raw)
-                if "k" in suffix:
+        for pat, prefixed in _SINGLE_PATTERNS:
+            for m in _finditer(pat, prefixed, text.raw, self._dollars(text)):
+                value = _to_number(m.group(1))
+                if "k" in (m.group(2) or "").lower():
                     value *= 1000
 
-                before = salary_str[max(0, m.start() - 60) : m.start()]
-                after = salary_str[m.end() : m.end() + 60]
+                before, after, near_before = self._context(text, m.start(), m.end())
 
                 # If the amount is immediately described as a bonus/premium, ignore it.
-                near_before = salary_str[max(0, m.start() - 25) : m.start()].lower()
-                if any(k in near_before for k in ["prime", "bonus"]):
+                if "bonus" in near_before:
                     continue
 
-                score = 0
-                before_l = before.lower()
-                after_l = after.lower()
-                has_salary_keyword = any(
-                    k in before_l
-                    for k in ["rémunération", "remuneration", "salaire", "salary"]
-                )
-                if has_salary_keyword:
-                    score += 3
-                has_unit_keyword = any(
-                    k in after_l for k in ["par heure", "heure", "hour", "/h", "/hr"]
-                )
-                if has_unit_keyword:
-                    score += 2
-                if any(
-                    k in after_l for k in ["par mois", "mois", "month", "/mo", "/m"]
-                ):
-                    score += 1
-                if any(
-                    k in after_l
-                    for k in ["par an", "année", "annuel", "year", "/an", "/yr"]
-                ):
-                    score += 1
-                # De-prioritize bonuses/prime amounts.
-                if any(k in before_l for k in ["prime", "bonus"]):
-                    score -= 2
+                has_salary_keyword = bool(before & _SALARY)
+                has_unit_keyword = "hourly" in after
 
                 # Exclude bonuses/premiums unless they are clearly tied to salary.
-                if any(k in before_l for k in ["prime", "bonus"]) and not any(
-                    k in before_l
-                    for k in ["rémunération", "remuneration", "salaire", "salary"]
-                ):
+                if "bonus" in before and not has_salary_keyword:
                     continue
 
                 # If we don't see salary keywords or time-unit context, it's too ambiguous.
@@ -275,47 +344,175 @@ def extract_salary(
                     continue
 
                 # Ignore common benefit/referral/bonus contexts unless salary is explicit.
-                if not has_salary_keyword and any(
-                    k in before_l or k in after_l for k in nonsalary_context
-                ):
+                if not has_salary_keyword and (before | after) & _NONSALARY:
                     continue
 
-                interval = infer_interval_from_context(value, before, after)
+                score = (
+                    3 * has_salary_keyword
+                    + 2 * has_unit_keyword
+                    + 1 * ("monthly" in after)
+                    + 1 * ("yearly" in after)
+                    # De-prioritize bonuses/prime amounts.
+                    - 2 * ("bonus" in before)
+                )
+                interval = self._interval(value, after)
                 candidates.append((score, m.start(), interval, value))
+                if stop_score is not None and score >= stop_score:
+                    return candidates
+        return candidates
+
+    def extract(
+        self,
+        salary_str,
+        enforce_annual_salary=False,
+        currency="USD",
+        max_length=None,
+        stop_score=None,
+    ):
+        """Returns (interval, min, max, currency), or four Nones.
+
+        `salary_str` may be a `JobText` shared with the other parsers.
+        `max_length` only scans the first characters of the text, and
+        `stop_score` stops at the first candidate scoring at least that much
+        instead of ranking every match.
+        """
+        text = JobText.of(salary_str)
+        if not text:
+            return None, None, None, None
+        if max_length is not None and len(text) > max_length:
+            text = JobText(text.raw[:max_length])
+
+        # Every pattern needs a "$"; only look around them.
+        if not text.dollars:
+            return None, None, None, None
+
+        # Try extracting salary ranges (may appear multiple times in long descriptions).
+        range_candidates = self._ranges(text, stop_score)
+        if range_candidates:
+            # Pick the best candidate (highest score, then latest occurrence).
+            range_candidates.sort(key=lambda t: (-t[0], -t[1]))
+            _score, _pos, interval, lo, hi, annual_lo, annual_hi = range_candidates[0]
+            if enforce_annual_salary:
+                return interval, annual_lo, annual_hi, currency
+            return interval, lo, hi, currency
 
+        # Try extracting a single salary value (common in job descriptions).
+        candidates = self._singles(text, stop_score)
         if not candidates:
             return None, None, None, None
 
         # Pick the best candidate (highest score, then earliest occurrence).
         candidates.sort(key=lambda t: (-t[0], t[1]))
         _score, _pos, interval, value = candidates[0]
+        annual_value = self._annual(value, interval)
 
-        if interval == CompensationInterval.HOURLY.value:
-            annual_value = convert_hourly_to_annual(value)
-        elif interval == CompensationInterval.MONTHLY.value:
-            annual_value = convert_monthly_to_annual(value)
-        else:
-            annual_value = value
-
-        if not (lower_limit <= annual_value <= upper_limit):
+        if not (self.lower_limit <= annual_value <= self.upper_limit):
             return None, None, None, None
 
         if enforce_annual_salary:
             return interval, annual_value, None, currency
         return interval, value, None, currency
 
-    # Pick the best candidate (highest score, then latest occurrence).
-    range_candidates.sort(key=lambda t: (-t[0], -t[1]))
-    (
-        _score,
-        _pos,
-        interval,
-        min_salary,
-        max_salary,
-        annual_min_salary,
-        annual_max_salary,
-    ) = range_candidates[0]
-
-    if enforce_annual_salary:
-        return interval, annual_min_salary, annual_max_salary, currency
-    return interval, min_salary, max_salary, currency
+    def extract_column(
+        self,
+        texts,
+        enforce_annual_salary=False,
+        currency="USD",
+        max_length=None,
+        stop_score=None,
+    ) -> pd.DataFrame:
+        """Vectorized `extract` over a Series (or array) of texts.
+
+        Duplicated texts are parsed once, and texts without an amount next to
+        a "$" (found column-wise) are skipped. Returns the `SALARY_COLUMNS`
+        aligned with `texts`.
+        """
+        texts = texts if isinstance(texts, pd.Series) else pd.Series(texts)
+        values = texts.fillna("").astype(str)
+        if max_length is not None:
+            values = values.str.slice(0, max_length)
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Series(uniques, dtype=object)
+
+        rows = [(None, None, None, None)] * len(uniques)
+        candidates = uniques.str.contains(_CANDIDATE_PATTERN, regex=True)
+        for i in np.flatnonzero(candidates.to_numpy(dtype=bool)).tolist():
+            rows[i] = self.extract(
+                uniques.iat[i],
+                enforce_annual_salary=enforce_annual_salary,
+                currency=currency,
+                stop_score=stop_score,
+            )
+
+        frame = pd.DataFrame(rows, columns=list(SALARY_COLUMNS)).take(codes)
+        frame.index = texts.index
+        return frame.astype({"min_amount": float, "max_amount": float})
+
+
+EXTRACTOR = SalaryExtractor()
+
+
+def _extractor(limits: tuple) -> SalaryExtractor:
+    default = (
+        EXTRACTOR.lower_limit,
+        EXTRACTOR.upper_limit,
+        EXTRACTOR.hourly_threshold,
+        EXTRACTOR.monthly_threshold,
+    )
+    return EXTRACTOR if limits == default else SalaryExtractor(*limits)
+
+
+def transform(*args, **kwargs):
+    """Helper function to call extract_salary with the same signature."""
+    return extract_salary(*args, **kwargs)
+
+
+def extract_salary(
+    salary_str,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+    currency="USD",
+    max_length=None,
+    stop_score=None,
+):
+    """
+    Extracts salary information from a string and returns the salary interval, min and max salary values, and currency.
+    (TODO: Needs test cases as the regex is complicated and may not cover all edge cases)
+    """
+    limits = (lower_limit, upper_limit, hourly_threshold, monthly_threshold)
+    return _extractor(limits).extract(
+        salary_str,
+        enforce_annual_salary=enforce_annual_salary,
+        currency=currency,
+        max_length=max_length,
+        stop_score=stop_score,
+    )
+
+
+def extract_salary_column(
+    texts,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+    currency="USD",
+    max_length=None,
+    stop_score=None,
+) -> pd.DataFrame:
+    """Vectorized `extract_salary` over a Series of descriptions.
+
+    Returns a DataFrame with interval, min_amount, max_amount and currency
+    columns aligned with `texts` (see `SalaryExtractor.extract_column`).
+    """
+    limits = (lower_limit, upper_limit, hourly_threshold, monthly_threshold)
+    return _extractor(limits).extract_column(
+        texts,
+        enforce_annual_salary=enforce_annual_salary,
+        currency=currency,
+        max_length=max_length,
+        stop_score=stop_score,
+    )
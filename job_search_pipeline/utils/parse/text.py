@@ -0,0 +1,70 @@
+#                                  MIT License
+#                       Copyright 2026, Sébastien Kéroack
+# ==============================================================================
+
+import functools
+import hashlib
+
+
+class JobText:
+    """Job text preprocessed once and shared by the parsers.
+
+    `normalized` replaces the NBSPs of `raw` with spaces, `lower` is its
+    lowercase form and `content_hash` the memo key of `raw`. Every form is
+    computed on first use. `normalized` keeps the offsets of `raw`,
+    and so does `lower` when `aligned` is true.
+    """
+
+    def __init__(self, raw: str | None):
+        self.raw = raw or ""
+        self._positions: dict[str, list[int]] = {}
+
+    @classmethod
+    def of(cls, text: "str | JobText | None") -> "JobText":
+        return text if isinstance(text, JobText) else cls(text)
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def computed(self, form: str) -> bool:
+        """Whether `form` (e.g. "lower") was already computed."""
+        return form in self.__dict__
+
+    @functools.cached_property
+    def normalized(self) -> str:
+        return self.raw.replace("\u00a0", " ")
+
+    @functools.cached_property
+    def lower(self) -> str:
+        return self.normalized.lower()
+
+    @functools.cached_property
+    def aligned(self) -> bool:
+        return len(self.lower) == len(self.raw)
+
+    @functools.cached_property
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of `raw` (same as `value.content_hash`)."""
+        return hashlib.sha256(self.raw.encode("utf-8")).hexdigest()
+
+    @property
+    def dollars(self) -> list[int]:
+        """Offsets of the "$" signs."""
+        return self.find("$", lower=False)
+
+    def find(self, keyword: str, lower: bool = True) -> list[int]:
+        """Returns the offsets of `keyword` in `lower` (or `normalized`)."""
+        key = keyword if lower else "\0" + keyword
+        positions = self._positions.get(key)
+        if positions is None:
+            text = self.lower if lower else self.normalized
+            positions = []
+            i = text.find(keyword)
+            while i != -1:
+                positions.append(i)
+                i = text.find(keyword, i + 1)
+            self._positions[key] = positions
+        return positions